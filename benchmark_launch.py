@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""浏览器启动配置基准测试
+
+对每个 launch_profile 多次冷启动 Chromium，报告启动耗时、首次导航耗时
+（DOMContentLoaded）与浏览器进程的峰值 RSS（取中位数 / 最大值）。
+"""
+import time
+import argparse
+import statistics
+
+from playwright.sync_api import sync_playwright
+
+from core.launch_profiles import PROFILES, LaunchProfile
+from utils.process_memory import PeakRSSSampler
+from utils.table import format_table
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """解析命令行参数"""
+    parser = argparse.ArgumentParser(
+        description="比较各浏览器启动配置的启动耗时、首次导航耗时与峰值内存",
+        epilog="示例: python benchmark_launch.py --runs 5 --profiles default lean",
+    )
+    parser.add_argument(
+        "--profiles",
+        nargs="+",
+        choices=list(PROFILES),
+        default=list(PROFILES),
+        help="要比较的启动配置（默认全部）",
+    )
+    parser.add_argument("--runs", type=int, default=3, help="每个配置的运行次数（默认 3）")
+    parser.add_argument(
+        "--url",
+        default="https://github.com/login",
+        help="首次导航的页面（默认 GitHub 登录页）",
+    )
+    return parser.parse_args(argv)
+
+
+def measure(profile: LaunchProfile, url: str) -> tuple[float, float, int]:
+    """冷启动一次浏览器并访问 url
+
+    Args:
+        profile: 启动配置
+        url: 首次导航的页面
+
+    Returns:
+        (启动耗时秒, 首次导航耗时秒, 峰值 RSS 字节)
+    """
+    with sync_playwright() as p, PeakRSSSampler() as sampler:
+        start = time.monotonic()
+        browser = p.chromium.launch(**profile.launch_options())
+        launched = time.monotonic()
+        try:
+            page = browser.new_context(**profile.context_options()).new_page()
+            page.goto(url, wait_until="domcontentloaded", timeout=60000)
+            navigated = time.monotonic()
+        finally:
+            browser.close()
+
+    return launched - start, navigated - launched, sampler.peak
+
+
+def main():
+    """主函数"""
+    args = parse_args()
+
+    rows = []
+    for name in args.profiles:
+        samples = [measure(PROFILES[name], args.url) for _ in range(args.runs)]
+        launch, navigation, rss = zip(*samples)
+        print(f"✅ {name}: {args.runs} 次运行完成")
+        rows.append(
+            (
+                name,
+                f"{statistics.median(launch):.2f}s",
+                f"{statistics.median(navigation):.2f}s",
+                f"{max(rss) / 1024 / 1024:.0f} MB" if max(rss) else "-",
+            )
+        )
+
+    print()
+    print(format_table(("配置", "启动耗时", "首次导航", "峰值 RSS"), rows))
+
+
+if __name__ == "__main__":
+    main()
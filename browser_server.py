@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""常驻浏览器服务：启动一次 Chromium，供 main.py / login_only.py 等入口连接复用"""
+import os
+import argparse
+from urllib.parse import urlparse
+
+from core.browser_server import serve, server_url
+from core.launch_profiles import PROFILES
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """解析命令行参数"""
+    default_port = urlparse(server_url()).port
+    parser = argparse.ArgumentParser(
+        description="常驻浏览器服务（本地 CDP 端点）",
+        epilog="示例: python browser_server.py & python main.py clawcloud",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=default_port,
+        help=f"CDP 端口（默认 {default_port}，与 BROWSER_SERVER_URL 一致）",
+    )
+    parser.add_argument(
+        "--launch-profile",
+        choices=list(PROFILES),
+        default=os.environ.get("ATHENA_LAUNCH_PROFILE"),
+        help="浏览器启动配置（默认 default），也可通过 ATHENA_LAUNCH_PROFILE 设置",
+    )
+    return parser.parse_args(argv)
+
+
+def main():
+    """主函数"""
+    args = parse_args()
+    if args.launch_profile:
+        os.environ["ATHENA_LAUNCH_PROFILE"] = args.launch_profile
+    serve(args.port)
+
+
+if __name__ == "__main__":
+    main()
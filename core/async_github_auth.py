@@ -0,0 +1,16 @@
+"""GitHub 认证器（异步版）"""
+from core.github_auth import GitHubAuthenticatorBase
+from core.steps import AsyncStepIO
+
+
+class AsyncGitHubAuthenticator(AsyncStepIO, GitHubAuthenticatorBase):
+    """GitHub 认证处理器（异步版）
+
+    与 GitHubAuthenticator 共用 GitHubAuthenticatorBase 中的流程，基于 playwright.async_api，
+    公开方法返回协程，便于在同一个事件循环中并发驱动多个站点。
+    通知器是阻塞实现，统一放到线程中调用，避免阻塞事件循环。
+
+    Attributes:
+        notifier: 通知器实例，用于发送实时通知和接收用户输入
+        screenshots: 截图文件路径列表
+    """
@@ -0,0 +1,7 @@
+"""OAuth 流程控制器（异步版）"""
+from core.oauth_handler import OAuthFlowControllerBase
+from core.steps import AsyncStepIO
+
+
+class AsyncOAuthFlowController(AsyncStepIO, OAuthFlowControllerBase):
+    """OAuth 流程控制（异步版），流程同 OAuthFlowController，公开方法返回协程"""
@@ -0,0 +1,312 @@
+"""多站点批量运行器"""
+import asyncio
+import time
+import logging
+from dataclasses import replace
+from typing import Callable, Optional
+
+from playwright.async_api import async_playwright, Browser, StorageState
+
+from core.types import SiteResult, LoginJob, NotifierInterface
+from core.constants import BrowserConfig
+from core.async_github_auth import AsyncGitHubAuthenticator
+from core.cookie_manager import build_github_session_cookies, CookieManager
+from core.browser_server import connect_or_launch_async, report_first_navigation
+from core.launch_profiles import get_launch_profile
+from core.profile_store import ProfileLock, profile_base_dir, profile_path
+from sites.registry import get_async_adapter_class
+from utils.table import format_table
+
+logger = logging.getLogger(__name__)
+
+
+class BatchRunner:
+    """批量运行器
+
+    只启动一个 Chromium，每个任务（账号 × 站点）在独立的 BrowserContext 中运行。
+    基于异步适配器，所有任务由同一个事件循环驱动，
+    通过信号量限制同时打开的 BrowserContext 数量。
+
+    启用持久化配置（ATHENA_PROFILE_DIR）时，每个账号都先在自己的持久化配置中
+    登录 GitHub，设备 Cookie 与 HTTP 缓存跨运行保留，再把会话复制到各站点的上下文。
+
+    Attributes:
+        jobs: 登录任务列表
+        notifier: 通知器实例
+        concurrency: 最大并发任务数
+        on_result: 每个任务完成时的回调
+    """
+
+    def __init__(
+        self,
+        jobs: list[LoginJob],
+        notifier: NotifierInterface,
+        concurrency: int = BrowserConfig.BATCH_CONCURRENCY,
+        on_result: Optional[Callable[[SiteResult], None]] = None,
+        share_github_session: bool = True,
+        launch_local: bool = False,
+    ):
+        """初始化批量运行器
+
+        Args:
+            jobs: 登录任务列表
+            notifier: 通知器实例
+            concurrency: 最大并发任务数
+            on_result: 每个任务完成时的回调（按完成顺序调用）
+            share_github_session: 同一账号有多个站点时，先登录 GitHub 一次，
+                再把会话复制到各站点的上下文中
+            launch_local: 总是启动自己的浏览器，不连接常驻浏览器服务
+        """
+        self.jobs = jobs
+        self.notifier = notifier
+        self.concurrency = max(1, concurrency)
+        self.on_result = on_result
+        self.share_github_session = share_github_session
+        self.launch_local = launch_local
+        # (计时起点, 浏览器获取方式)，第一个站点页面导航后清空
+        self._first_navigation: Optional[tuple[float, str]] = None
+
+    def run(self) -> list[SiteResult]:
+        """运行所有任务
+
+        Returns:
+            按任务顺序排列的结果列表
+        """
+        if not self.jobs:
+            return []
+        return asyncio.run(self.run_async())
+
+    async def run_async(self) -> list[SiteResult]:
+        """获取浏览器（除 launch_local 外优先连接常驻浏览器服务）并运行所有任务"""
+        start = time.monotonic()
+        async with async_playwright() as p:
+            browser, mode = await connect_or_launch_async(p, local_only=self.launch_local)
+            print(
+                f"🌐 浏览器已{'连接' if mode == 'connect' else '启动'}"
+                f"（{time.monotonic() - start:.2f}s），并发数: {self.concurrency}"
+            )
+            self._first_navigation = (start, mode)
+            try:
+                return await self.run_on_browser(browser)
+            finally:
+                await browser.close()
+
+    async def run_on_browser(self, browser: Browser) -> list[SiteResult]:
+        """在已启动的浏览器上运行所有任务
+
+        任务按账号分组，各账号并发执行。共享会话时，每个账号先在独立上下文中
+        登录 GitHub 并导出 storage_state，再由各站点上下文加载该状态，
+        只需完成 OAuth 授权与回调。
+
+        Args:
+            browser: 共享的浏览器实例
+
+        Returns:
+            按任务顺序排列的结果列表
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        results: dict[int, SiteResult] = {}
+
+        def finish(index: int, result: SiteResult) -> None:
+            results[index] = result
+            if self.on_result:
+                self.on_result(result)
+
+        async def run_limited(
+            index: int,
+            job: LoginJob,
+            storage_state: Optional[StorageState],
+            login_metrics: Optional[dict[str, float]],
+        ) -> None:
+            async with semaphore:
+                result = await self._run_job(browser, job, storage_state)
+            if login_metrics:
+                # 预登录 GitHub 的指标（密码登录、设备验证）记在账号的第一个任务上
+                for name, value in login_metrics.items():
+                    result.metrics[name] = result.metrics.get(name, 0) + value
+            result.persistent_profile = profile_base_dir() is not None
+            finish(index, result)
+
+        async def run_account(indexed_jobs: list[tuple[int, LoginJob]]) -> None:
+            storage_state = None
+            persistent = profile_base_dir() is not None
+            if persistent or (self.share_github_session and len(indexed_jobs) > 1):
+                first_job = indexed_jobs[0][1]
+                async with semaphore:
+                    storage_state, error, metrics = await self._login_github_once(
+                        browser, first_job
+                    )
+                if error:
+                    for position, (index, job) in enumerate(indexed_jobs):
+                        failed = SiteResult(
+                            site=job.site,
+                            account=job.account,
+                            success=False,
+                            error=error,
+                            metrics=metrics if position == 0 else {},
+                            persistent_profile=persistent,
+                        )
+                        finish(index, failed)
+                    return
+            else:
+                metrics = {}
+
+            await asyncio.gather(
+                *(
+                    run_limited(index, job, storage_state, metrics if position == 0 else None)
+                    for position, (index, job) in enumerate(indexed_jobs)
+                )
+            )
+
+        accounts: dict[tuple[str, str], list[tuple[int, LoginJob]]] = {}
+        for index, job in enumerate(self.jobs):
+            accounts.setdefault((job.account, job.credentials.username), []).append((index, job))
+
+        await asyncio.gather(*(run_account(indexed_jobs) for indexed_jobs in accounts.values()))
+        return [results[index] for index in range(len(self.jobs))]
+
+    async def _new_context(self, browser: Browser, storage_state: Optional[StorageState] = None):
+        """创建统一配置的 BrowserContext"""
+        return await browser.new_context(
+            **get_launch_profile().context_options(), storage_state=storage_state
+        )
+
+    async def _new_persistent_context(self, browser: Browser, user_data_dir: str):
+        """在账号的持久化配置目录上启动 BrowserContext（独立的 Chromium 进程）"""
+        profile = get_launch_profile()
+        return await browser.browser_type.launch_persistent_context(
+            user_data_dir, **profile.launch_options(), **profile.context_options()
+        )
+
+    async def _login_github_once(
+        self, browser: Browser, job: LoginJob
+    ) -> tuple[Optional[StorageState], str, dict[str, float]]:
+        """为账号登录一次 GitHub 并导出会话
+
+        启用持久化配置时在账号的配置目录中登录，并持有目录锁直到上下文关闭。
+
+        Args:
+            browser: 共享的浏览器实例
+            job: 该账号的任意一个任务（使用其凭据与 2FA 配置）
+
+        Returns:
+            (storage_state, 错误消息, 登录指标)。登录失败时返回错误消息，该账号的任务
+            不再逐个重试登录；出现异常时返回 (None, "", 指标)，各站点回退为各自完成 GitHub 登录
+        """
+        label = job.account or job.credentials.username
+        print(f"🔐 [{label}] 登录 GitHub（会话将复用于所有站点）")
+        authenticator = AsyncGitHubAuthenticator(self.notifier)
+        lock = None
+        try:
+            base_dir = profile_base_dir()
+            if base_dir:
+                user_data_dir = profile_path(base_dir, job.credentials.username)
+                lock = ProfileLock(user_data_dir)
+                await asyncio.to_thread(lock.acquire)
+                context = await self._new_persistent_context(browser, user_data_dir)
+            else:
+                context = await self._new_context(browser)
+            try:
+                if job.credentials.session_cookie:
+                    await context.add_cookies(
+                        build_github_session_cookies(job.credentials.session_cookie)
+                    )
+
+                page = context.pages[0] if context.pages else await context.new_page()
+                if not await authenticator.ensure_logged_in(
+                    page,
+                    job.credentials,
+                    job.config.two_factor,
+                    job.config.device_verification,
+                ):
+                    return None, "GitHub 登录失败", authenticator.metrics
+
+                return await context.storage_state(), "", authenticator.metrics
+            finally:
+                await context.close()
+        except Exception as e:
+            logger.error(f"[{label}] 预登录 GitHub 异常，回退为逐站点登录: {e}")
+            return None, "", authenticator.metrics
+        finally:
+            if lock:
+                lock.release()
+
+    async def _run_job(
+        self, browser: Browser, job: LoginJob, storage_state: Optional[StorageState] = None
+    ) -> SiteResult:
+        """在独立的 BrowserContext 中运行单个任务
+
+        Args:
+            browser: 共享的浏览器实例
+            job: 登录任务
+            storage_state: 已登录 GitHub 的会话状态（为空时由站点自行登录）
+
+        Returns:
+            任务结果
+        """
+        start = time.monotonic()
+        try:
+            credentials = job.credentials
+            session_cookie = credentials.session_cookie
+            if storage_state:
+                # 会话已在 storage_state 中，不再注入可能过期的 Session Cookie
+                credentials = replace(credentials, session_cookie=None)
+                session_cookie = CookieManager().find_cookie(storage_state["cookies"])
+
+            adapter = get_async_adapter_class(job.site)(job.config, credentials, self.notifier)
+            success = await asyncio.to_thread(adapter.try_http_oauth, session_cookie)
+            if not success:
+                context = await self._new_context(browser, storage_state)
+                try:
+                    page = await context.new_page()
+                    if self._first_navigation:
+                        report_first_navigation(page, *self._first_navigation)
+                        self._first_navigation = None
+                    success = await adapter.run(context, page)
+                finally:
+                    await context.close()
+
+            return SiteResult(
+                site=job.site,
+                account=job.account,
+                success=success,
+                duration=time.monotonic() - start,
+                error="" if success else "登录流程失败",
+                cookies_saved=adapter.cookies_saved,
+                cookies_expire_at=adapter.cookies_expire_at,
+                metrics=adapter.run_metrics(),
+            )
+        except Exception as e:
+            logger.error(f"任务 {job.key} 运行异常: {e}")
+            return SiteResult(
+                site=job.site,
+                account=job.account,
+                success=False,
+                duration=time.monotonic() - start,
+                error=str(e),
+            )
+
+
+def format_results_table(results: list[SiteResult]) -> str:
+    """格式化站点结果表格
+
+    Args:
+        results: 站点结果列表
+
+    Returns:
+        可直接打印的表格文本
+    """
+    headers = ("站点", "状态", "耗时", "错误")
+    rows = [
+        (
+            r.key,
+            "✅ 成功" if r.success else "❌ 失败",
+            f"{r.duration:.1f}s",
+            r.error,
+        )
+        for r in results
+    ]
+
+    succeeded = sum(1 for r in results if r.success)
+    summary = f"共 {len(results)} 个任务，成功 {succeeded}，失败 {len(results) - succeeded}"
+    return f"{format_table(headers, rows)}\n{summary}"
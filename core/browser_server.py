@@ -0,0 +1,148 @@
+"""常驻浏览器服务
+
+Chromium 冷启动是短任务的主要耗时。browser_server.py 启动一个常驻的 Chromium
+并开放本地 CDP（WebSocket）端点，main.py / login_only.py 等入口可达时直接连接，
+不可达时回退为本地启动。
+"""
+import os
+import json
+import time
+import signal
+import logging
+import urllib.request
+from typing import Optional
+
+from core.constants import BrowserConfig
+from core.launch_profiles import get_launch_profile
+
+logger = logging.getLogger(__name__)
+
+
+def server_url() -> str:
+    """常驻浏览器服务地址（环境变量 BROWSER_SERVER_URL 优先）"""
+    return os.environ.get("BROWSER_SERVER_URL", BrowserConfig.SERVER_URL).rstrip("/")
+
+
+def probe_server(
+    url: Optional[str] = None, timeout: float = BrowserConfig.SERVER_PROBE_TIMEOUT
+) -> Optional[str]:
+    """探测常驻浏览器服务是否可达
+
+    Args:
+        url: 服务地址（默认取 server_url()）
+        timeout: 探测超时（秒）
+
+    Returns:
+        浏览器的 WebSocket 端点，不可达时返回 None
+    """
+    url = url or server_url()
+    try:
+        with urllib.request.urlopen(f"{url}/json/version", timeout=timeout) as response:
+            return json.loads(response.read().decode("utf-8")).get("webSocketDebuggerUrl")
+    except (OSError, ValueError):
+        return None
+
+
+def connect_or_launch(playwright, url: Optional[str] = None):
+    """连接常驻浏览器，不可达时本地启动（同步 API）
+
+    本地启动时使用当前的 launch_profile（常驻浏览器的启动参数由服务端决定）。
+
+    Args:
+        playwright: sync_playwright() 返回的实例
+        url: 服务地址（默认取 server_url()）
+
+    Returns:
+        (Browser, 模式)，模式为 "connect" 或 "launch"
+    """
+    endpoint = probe_server(url)
+    if endpoint:
+        try:
+            return playwright.chromium.connect_over_cdp(endpoint), "connect"
+        except Exception as e:
+            logger.warning(f"连接常驻浏览器失败，改为本地启动: {e}")
+    return playwright.chromium.launch(**get_launch_profile().launch_options()), "launch"
+
+
+async def connect_or_launch_async(playwright, url: Optional[str] = None, local_only: bool = False):
+    """连接常驻浏览器，不可达时本地启动（异步 API）
+
+    Args:
+        playwright: async_playwright() 返回的实例
+        url: 服务地址（默认取 server_url()）
+        local_only: 总是本地启动，不连接常驻浏览器
+
+    Returns:
+        (Browser, 模式)，模式为 "connect" 或 "launch"
+    """
+    endpoint = None if local_only else probe_server(url)
+    if endpoint:
+        try:
+            return await playwright.chromium.connect_over_cdp(endpoint), "connect"
+        except Exception as e:
+            logger.warning(f"连接常驻浏览器失败，改为本地启动: {e}")
+    browser = await playwright.chromium.launch(**get_launch_profile().launch_options())
+    return browser, "launch"
+
+
+def report_first_navigation(page, start: float, mode: str) -> None:
+    """页面首次完成 DOMContentLoaded 时打印距 start 的耗时
+
+    同步与异步 Page 均可使用。
+
+    Args:
+        page: Playwright Page 对象
+        start: 计时起点（time.monotonic()）
+        mode: 浏览器获取方式（"connect" / "launch" / "persistent"）
+    """
+    label = {"connect": "连接常驻浏览器", "persistent": "启动持久化配置"}.get(mode, "本地启动浏览器")
+    page.once(
+        "domcontentloaded",
+        lambda _: print(f"⏱️ 首次导航耗时 {time.monotonic() - start:.2f}s（{label}）"),
+    )
+
+
+def serve(port: int, host: str = "127.0.0.1") -> None:
+    """启动常驻 Chromium 并开放 CDP 端点，直到浏览器退出或收到中断信号
+
+    Args:
+        port: CDP 端口
+        host: 监听地址（CDP 可完全控制浏览器，只应监听本地地址）
+    """
+    from playwright.sync_api import sync_playwright
+
+    def stop(signum, frame):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, stop)
+
+    with sync_playwright() as p:
+        options = get_launch_profile().launch_options()
+        options["args"] += [f"--remote-debugging-port={port}", f"--remote-debugging-address={host}"]
+        browser = p.chromium.launch(**options)
+        url = f"http://{host}:{port}"
+        endpoint = None
+        for _ in range(50):
+            endpoint = probe_server(url)
+            if endpoint:
+                break
+            time.sleep(0.1)
+
+        if not endpoint:
+            browser.close()
+            raise RuntimeError(f"常驻浏览器未在 {url} 开放 CDP 端点")
+
+        print(f"🌐 常驻浏览器已启动: {url}")
+        print(f"   WebSocket 端点: {endpoint}")
+        if url != server_url():
+            print(f"   客户端需设置 BROWSER_SERVER_URL={url}")
+
+        try:
+            while browser.is_connected():
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if browser.is_connected():
+                browser.close()
+        print("👋 常驻浏览器已关闭")
@@ -0,0 +1,268 @@
+"""站点配置加载"""
+from typing import Any, Optional
+
+import yaml
+
+from core.constants import BrowserConfig
+from core.types import (
+    SiteConfig,
+    TwoFactorConfig,
+    DeviceVerificationConfig,
+    TimeoutConfig,
+    KeepAliveURL,
+    CookieTarget,
+    ScheduleConfig,
+    ReadySpec,
+    BlockResourcesConfig,
+    HttpOAuthConfig,
+)
+
+DEFAULT_SITES_FILE = "config/sites.yaml"
+
+# 可以配置就绪条件的步骤
+READY_STEPS = ("login_page", "oauth_redirect", "authorize", "keepalive")
+
+# 保活 URL 的访问方式
+KEEPALIVE_MODES = ("page", "http")
+
+# Playwright 的 request.resource_type 取值
+RESOURCE_TYPES = (
+    "document",
+    "stylesheet",
+    "image",
+    "media",
+    "font",
+    "script",
+    "texttrack",
+    "xhr",
+    "fetch",
+    "eventsource",
+    "websocket",
+    "manifest",
+    "other",
+)
+
+
+def read_sites_file(path: str = DEFAULT_SITES_FILE) -> dict[str, Any]:
+    """读取站点配置文件
+
+    Args:
+        path: 配置文件路径
+
+    Returns:
+        站点名称到原始配置字典的映射
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.safe_load(f) or {}
+
+
+def parse_site_config(site_data: dict[str, Any]) -> SiteConfig:
+    """将原始配置字典转换为 SiteConfig
+
+    Args:
+        site_data: sites.yaml 中单个站点的配置
+
+    Returns:
+        站点配置
+    """
+    return SiteConfig(
+        name=site_data["name"],
+        enabled=site_data.get("enabled", True),
+        login_url=site_data["login_url"],
+        success_url_patterns=site_data["success_url_patterns"],
+        oauth_button_selectors=site_data["oauth_button_selectors"],
+        two_factor=TwoFactorConfig(
+            strategy=site_data["two_factor"]["strategy"],
+            mobile_wait=site_data["two_factor"]["mobile_wait"],
+            totp_wait=site_data["two_factor"]["totp_wait"],
+        ),
+        device_verification=DeviceVerificationConfig(wait=site_data["device_verification"]["wait"]),
+        timeouts=TimeoutConfig(
+            page_load=site_data["timeouts"]["page_load"],
+            oauth_callback=site_data["timeouts"]["oauth_callback"],
+            network_idle=site_data["timeouts"]["network_idle"],
+        ),
+        keepalive_urls=[parse_keepalive_url(item) for item in site_data.get("keepalive_urls", [])],
+        keepalive_parallelism=max(
+            1, site_data.get("keepalive_parallelism", BrowserConfig.KEEPALIVE_PARALLELISM)
+        ),
+        cookie_domain=site_data.get("cookie_domain", "github.com"),
+        cookie_names=site_data.get("cookie_names", ["user_session"]),
+        cookie_targets=parse_cookie_targets(site_data.get("cookie_targets", [])),
+        schedule=ScheduleConfig(**site_data.get("schedule", {})),
+        min_refresh_interval=site_data.get("min_refresh_interval", 0),
+        ready=parse_ready_specs(site_data.get("ready", {})),
+        block_resources=parse_block_resources(site_data.get("block_resources")),
+        http_oauth=parse_http_oauth(site_data.get("http_oauth")),
+        storage_state_cache=site_data.get("storage_state_cache"),
+    )
+
+
+def parse_http_oauth(data: Optional[dict[str, Any]]) -> Optional[HttpOAuthConfig]:
+    """解析 HTTP OAuth 配置
+
+    Args:
+        data: 原始配置，未配置时为 None
+
+    Returns:
+        HTTP OAuth 配置，未配置时返回 None
+
+    Raises:
+        ValueError: 未配置 start_url
+    """
+    if not data:
+        return None
+    if not data.get("start_url"):
+        raise ValueError("http_oauth 需要配置 start_url")
+    return HttpOAuthConfig(start_url=data["start_url"], max_redirects=data.get("max_redirects", 10))
+
+
+def parse_keepalive_url(data: dict[str, Any]) -> KeepAliveURL:
+    """解析单个保活 URL
+
+    Args:
+        data: 原始配置，包含 url / name，可选 ready / mode
+
+    Returns:
+        保活 URL
+
+    Raises:
+        ValueError: 访问方式无效
+    """
+    mode = data.get("mode", "page")
+    if mode not in KEEPALIVE_MODES:
+        raise ValueError(f"未知的保活方式: {mode}（可选: {', '.join(KEEPALIVE_MODES)}）")
+    return KeepAliveURL(
+        url=data["url"],
+        name=data["name"],
+        ready=parse_ready_spec(data["ready"]) if data.get("ready") else None,
+        mode=mode,
+    )
+
+
+def parse_block_resources(data: Optional[dict[str, Any]]) -> Optional[BlockResourcesConfig]:
+    """解析请求拦截配置
+
+    Args:
+        data: 原始配置，未配置时为 None
+
+    Returns:
+        请求拦截配置，未配置时返回 None
+
+    Raises:
+        ValueError: 资源类型无效
+    """
+    if not data:
+        return None
+
+    types = data.get("types", [])
+    unknown = sorted(set(types) - set(RESOURCE_TYPES))
+    if unknown:
+        raise ValueError(f"未知的资源类型: {', '.join(unknown)}（可选: {', '.join(RESOURCE_TYPES)}）")
+
+    return BlockResourcesConfig(
+        types=types,
+        deny=data.get("deny", []),
+        allow=data.get("allow", []),
+        render_on_failure=data.get("render_on_failure", True),
+    )
+
+
+def parse_ready_spec(data: dict[str, Any]) -> ReadySpec:
+    """解析单个就绪条件
+
+    Args:
+        data: 原始配置，可包含 selector / url / response / timeout
+
+    Returns:
+        就绪条件
+
+    Raises:
+        ValueError: 未配置任何条件
+    """
+    spec = ReadySpec(
+        selector=data.get("selector"),
+        url=data.get("url"),
+        response=data.get("response"),
+        timeout=data.get("timeout"),
+    )
+    if not (spec.selector or spec.url or spec.response):
+        raise ValueError("就绪条件至少需要 selector、url、response 之一")
+    return spec
+
+
+def parse_ready_specs(data: dict[str, Any]) -> dict[str, ReadySpec]:
+    """解析各步骤的就绪条件
+
+    Args:
+        data: 步骤名称到原始配置的映射
+
+    Returns:
+        步骤名称到就绪条件的映射
+
+    Raises:
+        ValueError: 步骤名称无效
+    """
+    unknown = sorted(set(data) - set(READY_STEPS))
+    if unknown:
+        raise ValueError(f"未知的就绪步骤: {', '.join(unknown)}（可选: {', '.join(READY_STEPS)}）")
+    return {step: parse_ready_spec(spec) for step, spec in data.items()}
+
+
+def parse_cookie_targets(items: list[dict[str, Any]]) -> list[CookieTarget]:
+    """解析 Cookie 存储目标列表
+
+    Args:
+        items: 原始配置列表
+
+    Returns:
+        Cookie 存储目标列表
+    """
+    return [
+        CookieTarget(
+            type=target["type"],
+            secret_name=target.get("secret_name"),
+            path=target.get("path"),
+            encrypt=target.get("encrypt", False),
+        )
+        for target in items
+    ]
+
+
+def load_site_config(site_name: str, path: str = DEFAULT_SITES_FILE) -> SiteConfig:
+    """加载单个站点配置
+
+    Args:
+        site_name: 站点名称（sites.yaml 中的键）
+        path: 配置文件路径
+
+    Returns:
+        站点配置
+
+    Raises:
+        ValueError: 站点未配置或已禁用
+    """
+    site_data = read_sites_file(path).get(site_name)
+    if not site_data:
+        raise ValueError(f"站点 '{site_name}' 未配置")
+
+    if not site_data.get("enabled", True):
+        raise ValueError(f"站点 '{site_name}' 已禁用")
+
+    return parse_site_config(site_data)
+
+
+def load_enabled_sites(path: str = DEFAULT_SITES_FILE) -> dict[str, SiteConfig]:
+    """加载所有启用的站点配置
+
+    Args:
+        path: 配置文件路径
+
+    Returns:
+        站点名称到站点配置的映射（保持文件中的顺序）
+    """
+    return {
+        site_name: parse_site_config(site_data)
+        for site_name, site_data in read_sites_file(path).items()
+        if isinstance(site_data, dict) and site_data.get("enabled", True)
+    }
@@ -13,8 +13,13 @@ class Timeouts:
     TWO_FACTOR_MOBILE = 120
     TWO_FACTOR_TOTP = 120
     ELEMENT_VISIBLE = 5000
+    OAUTH_BUTTON = 3000  # 所有 OAuth 按钮候选选择器共用一次等待
     SHORT_WAIT = 2000
+    DEVICE_POLL = 1000
+    READY = 10000  # 快速模式下单个就绪条件的最长等待时间
+    READY_POLL = 20  # 同步版轮流检查多个保活标签页就绪状态的间隔
     API_REQUEST = 30
+    SESSION_PROBE = 5  # 秒，login_only.py 用 HTTP 请求检查 Session Cookie
 
 
 class RetryConfig:
@@ -36,6 +41,51 @@ class CookieConfig:
     LOGGED_IN_VALUE = "yes"
 
 
+class BrowserConfig:
+    """浏览器配置"""
+
+    LAUNCH_ARGS = ["--no-sandbox"]
+    VIEWPORT = {"width": 1920, "height": 1080}
+    USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+    BATCH_CONCURRENCY = 3
+    KEEPALIVE_PARALLELISM = 3  # 同时渲染保活页面的标签页数
+    # 常驻浏览器服务（browser_server.py）的 CDP 地址，可通过 BROWSER_SERVER_URL 覆盖
+    SERVER_URL = "http://127.0.0.1:9333"
+    SERVER_PROBE_TIMEOUT = 0.5
+
+
+class HealthConfig:
+    """站点健康与冷却配置"""
+
+    MAX_CONSECUTIVE_FAILURES = 3
+    COOLDOWN_BASE = 1800  # 秒，第一次失败后的冷却时间，之后每次失败翻倍
+    COOLDOWN_MAX = 86400
+
+
+class LeaseConfig:
+    """多节点租约队列配置（秒）"""
+
+    LEASE_SECONDS = 300
+    DONE_TTL = 3600
+    BUSY_TIMEOUT = 30
+
+
+class ProfileConfig:
+    """持久化浏览器配置目录（秒）"""
+
+    LOCK_TIMEOUT = 600  # 等待其他进程释放同一账号配置目录的最长时间
+    LOCK_POLL = 0.5
+
+
+class StorageStateConfig:
+    """站点 storage_state 缓存"""
+
+    # 缓存目录，可通过环境变量 ATHENA_STORAGE_DIR 覆盖
+    DIR = ".athena_storage"
+    # 设置该环境变量时用其派生的密钥加密缓存文件（需要 pynacl）
+    KEY_ENV = "ATHENA_STORAGE_KEY"
+
+
 class GitHubUrls:
     """GitHub URL 模式"""
 
@@ -46,6 +96,8 @@ class GitHubUrls:
     TWO_FACTOR_MOBILE = "two-factor/mobile"
     DEVICE_VERIFICATION = "verified-device"
     DEVICE_VERIFICATION_ALT = "device-verification"
+    # 需要登录才能访问的页面，未登录时重定向到 /login
+    SESSION_PROBE = "https://github.com/settings/profile"
 
 
 class Selectors:
@@ -3,7 +3,7 @@ import os
 import json
 import base64
 import logging
-from typing import Optional
+from typing import Any, Mapping, Optional, Sequence
 import requests
 from requests.exceptions import RequestException
 
@@ -15,6 +15,31 @@ from utils.security import mask_sensitive
 logger = logging.getLogger(__name__)
 
 
+def build_github_session_cookies(session_cookie: str) -> list[dict]:
+    """构造预加载到 BrowserContext 的 GitHub Session Cookie
+
+    Args:
+        session_cookie: user_session 的值
+
+    Returns:
+        可直接传给 BrowserContext.add_cookies 的 Cookie 列表
+    """
+    return [
+        {
+            "name": CookieConfig.SESSION_COOKIE_NAME,
+            "value": session_cookie,
+            "domain": "github.com",
+            "path": "/",
+        },
+        {
+            "name": CookieConfig.LOGGED_IN_COOKIE_NAME,
+            "value": CookieConfig.LOGGED_IN_VALUE,
+            "domain": "github.com",
+            "path": "/",
+        },
+    ]
+
+
 class CookieManager:
     """Cookie 管理器"""
 
@@ -38,15 +63,57 @@ class CookieManager:
             Cookie 值，未找到返回 None
         """
         try:
-            for cookie in context.cookies():
-                if cookie["name"] == name and domain.lstrip(".") in cookie.get("domain", ""):
-                    value = cookie["value"]
-                    logger.info(f"提取 Cookie: {name} = {mask_sensitive(value)}")
-                    return value
+            return self.find_cookie(context.cookies(), domain, name)
         except Exception as e:
             logger.error(f"提取 Cookie 失败: {e}")
         return None
 
+    def find_cookie(
+        self,
+        cookies: Sequence[Mapping[str, Any]],
+        domain: str = CookieConfig.GITHUB_DOMAIN,
+        name: str = CookieConfig.SESSION_COOKIE_NAME,
+    ) -> Optional[str]:
+        """从 Cookie 列表中查找指定 Cookie
+
+        异步版 BrowserContext.cookies() 需要 await，调用方取得列表后直接使用本方法。
+
+        Args:
+            cookies: BrowserContext.cookies() 返回的 Cookie 列表
+            domain: Cookie 域名
+            name: Cookie 名称
+
+        Returns:
+            Cookie 值，未找到返回 None
+        """
+        cookie = self.find_cookie_entry(cookies, domain, name)
+        if cookie is None:
+            return None
+        value = cookie["value"]
+        logger.info(f"提取 Cookie: {name} = {mask_sensitive(value)}")
+        return value
+
+    def find_cookie_entry(
+        self,
+        cookies: Sequence[Mapping[str, Any]],
+        domain: str = CookieConfig.GITHUB_DOMAIN,
+        name: str = CookieConfig.SESSION_COOKIE_NAME,
+    ) -> Optional[Mapping[str, Any]]:
+        """从 Cookie 列表中查找完整的 Cookie 记录（含 expires 等属性）
+
+        Args:
+            cookies: BrowserContext.cookies() 返回的 Cookie 列表
+            domain: Cookie 域名
+            name: Cookie 名称
+
+        Returns:
+            Cookie 字典，未找到返回 None
+        """
+        for cookie in cookies:
+            if cookie["name"] == name and domain.lstrip(".") in cookie.get("domain", ""):
+                return cookie
+        return None
+
     def save_cookies(self, value: str, targets: list[CookieTarget]):
         """保存 Cookie 到多个目标"""
         if not value:
@@ -0,0 +1,95 @@
+"""多账号凭据文件加载"""
+import os
+import re
+from typing import Any
+
+import yaml
+
+from core.types import AccountConfig, GitHubCredentials
+from core.config_loader import parse_cookie_targets
+from core.validators import validate_credentials
+
+_ENV_PATTERN = re.compile(r"\$\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
+
+def expand_env(value: Any) -> str:
+    """展开字符串中的 ${VAR} 环境变量引用，未设置的变量展开为空字符串"""
+    if value is None:
+        return ""
+    return _ENV_PATTERN.sub(lambda m: os.environ.get(m.group(1), ""), str(value)).strip()
+
+
+def load_env_credentials() -> GitHubCredentials:
+    """从环境变量 GH_USERNAME / GH_PASSWORD / GH_SESSION 加载单个账号凭据"""
+    return GitHubCredentials(
+        username=os.environ.get("GH_USERNAME", ""),
+        password=os.environ.get("GH_PASSWORD", ""),
+        session_cookie=os.environ.get("GH_SESSION", "").strip(),
+    )
+
+
+def parse_account(data: dict[str, Any], index: int) -> AccountConfig:
+    """解析单个账号配置
+
+    Args:
+        data: 原始账号配置
+        index: 账号在文件中的序号（用于默认名称和错误提示）
+
+    Returns:
+        账号配置
+
+    Raises:
+        ValueError: 凭据缺失或格式无效
+    """
+    name = str(data.get("name") or f"account{index + 1}")
+    username = expand_env(data.get("username"))
+    password = expand_env(data.get("password"))
+    session_cookie = expand_env(data.get("session_cookie"))
+
+    valid, message = validate_credentials(username, password, session_cookie)
+    if not valid:
+        raise ValueError(f"账号 '{name}' 凭据无效: {message}")
+
+    return AccountConfig(
+        name=name,
+        credentials=GitHubCredentials(
+            username=username,
+            password=password,
+            session_cookie=session_cookie or None,
+        ),
+        cookie_targets=parse_cookie_targets(data.get("cookie_targets", [])),
+        sites=data.get("sites"),
+    )
+
+
+def load_accounts(path: str) -> list[AccountConfig]:
+    """从凭据文件加载所有账号
+
+    支持 accounts 列表格式；仅包含旧版 github 段时视为单个账号。
+
+    Args:
+        path: 凭据文件路径
+
+    Returns:
+        账号配置列表
+
+    Raises:
+        ValueError: 文件中没有账号或账号名称重复
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml.safe_load(f) or {}
+
+    items = data.get("accounts")
+    if items is None and data.get("github"):
+        items = [{"name": "default", **data["github"]}]
+    if not items:
+        raise ValueError(f"凭据文件 '{path}' 中没有账号")
+
+    accounts = [parse_account(item, i) for i, item in enumerate(items)]
+
+    names = [account.name for account in accounts]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"账号名称重复: {', '.join(duplicates)}")
+
+    return accounts
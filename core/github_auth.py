@@ -1,8 +1,12 @@
 """GitHub 认证器"""
 import time
 import logging
+from abc import ABC
 from typing import Optional
-from playwright.sync_api import Page, TimeoutError as PlaywrightTimeout, Error as PlaywrightError
+from urllib.parse import urljoin
+
+# 同步版与异步版的 TimeoutError / Error 是同一个类，流程中统一捕获
+from playwright.sync_api import TimeoutError as PlaywrightTimeout, Error as PlaywrightError
 
 from core.types import (
     GitHubCredentials,
@@ -11,40 +15,122 @@ from core.types import (
     NotifierInterface,
 )
 from core.constants import Timeouts, Selectors, GitHubUrls, Messages
+from core.pacing import Pacer
+from core.steps import Steps, StepIO, SyncStepIO
 
 logger = logging.getLogger(__name__)
 
+# 旧实现每 5 秒整页刷新一次设备验证页，用于估算节省的流量
+LEGACY_RELOAD_INTERVAL = 5
 
-class GitHubAuthenticator:
-    """GitHub 认证处理器
+# 统计页面一次完整加载传输的字节数（文档 + 子资源）
+PAGE_WEIGHT_JS = """() => performance.getEntriesByType('navigation')
+    .concat(performance.getEntriesByType('resource'))
+    .reduce((total, entry) => total + (entry.transferSize || entry.encodedBodySize || 0), 0)"""
 
-    负责处理完整的 GitHub 登录流程，包括：
-    - 基本凭据认证
-    - 双因素认证（GitHub Mobile / TOTP）
-    - 设备验证
-    - 错误处理和截图
+
+class GitHubAuthenticatorBase(StepIO, ABC):
+    """GitHub 认证器公共逻辑
+
+    完整的 GitHub 登录流程（凭据、设备验证、GitHub Mobile / TOTP 双因素认证、错误处理和截图）
+    以步骤生成器实现，同步版 GitHubAuthenticator 与异步版 AsyncGitHubAuthenticator
+    只提供 I/O（见 core.steps）。公开方法在同步版中返回结果，在异步版中返回协程。
 
     Attributes:
         notifier: 通知器实例，用于发送实时通知和接收用户输入
         screenshots: 截图文件路径列表
     """
 
-    def __init__(self, notifier: NotifierInterface):
+    def __init__(self, notifier: NotifierInterface, pacer: Optional[Pacer] = None):
         """初始化认证器
 
         Args:
             notifier: 通知器实例
+            pacer: 步骤间等待策略（默认按环境变量 ATHENA_FAST 新建）
         """
         self.notifier = notifier
+        self.pacer = pacer or Pacer()
         self.screenshots: list[str] = []
+        # 运行指标（如设备验证节省的字节数），由调用方写入 StateManager
+        self.metrics: dict[str, float] = {}
+
+    def _add_metric(self, name: str, value: float = 1) -> None:
+        """累加运行指标"""
+        self.metrics[name] = self.metrics.get(name, 0) + value
+
+    @staticmethod
+    def _is_device_verification(url: str) -> bool:
+        """判断 URL 是否为设备验证页"""
+        return GitHubUrls.DEVICE_VERIFICATION in url or GitHubUrls.DEVICE_VERIFICATION_ALT in url
+
+    @staticmethod
+    def _left_two_factor(url: str) -> bool:
+        """是否已离开双因素认证页（批准后跳转，或被重定向回登录页）"""
+        return GitHubUrls.TWO_FACTOR not in url
+
+    def _mobile_approval_result(self, url: str, elapsed: float) -> bool:
+        """判断 GitHub Mobile 等待结果并记录批准耗时
+
+        Args:
+            url: 等待结束时的页面 URL
+            elapsed: 等待耗时（秒）
+
+        Returns:
+            是否已批准
+        """
+        if GitHubUrls.TWO_FACTOR in url:
+            return False
+        # 授权页 URL 同样以 github.com/login 开头，需要排除
+        if GitHubUrls.LOGIN in url and GitHubUrls.OAUTH_AUTHORIZE not in url:
+            logger.error(f"❌ 被重定向到登录页（{elapsed:.1f}s）")
+            return False
+
+        logger.info(f"✅ 双因素认证通过！批准耗时 {elapsed:.1f}s")
+        self._add_metric("two_factor_mobile_approvals")
+        self._add_metric("two_factor_mobile_wait_seconds", round(elapsed, 1))
+        return True
+
+    def _approved_location(self, url: str, status: int, headers: dict) -> Optional[str]:
+        """根据设备验证页探测响应判断是否已通过
+
+        验证通过后再次请求验证页会被重定向离开，返回重定向目标；否则返回 None。
+        """
+        location = headers.get("location")
+        if 300 <= status < 400 and location and not self._is_device_verification(location):
+            return urljoin(url, location)
+        return None
+
+    def _record_device_verification_savings(
+        self, elapsed: float, page_bytes: int, probe_bytes: int
+    ) -> None:
+        """记录相对旧实现（每 5 秒整页刷新）节省的字节数"""
+        reloads_avoided = int(elapsed // LEGACY_RELOAD_INTERVAL)
+        saved = max(0, reloads_avoided * page_bytes - probe_bytes)
+        self._add_metric("device_verification_bytes_saved", saved)
+        logger.info(
+            f"📉 设备验证等待 {elapsed:.1f}s，探测 {probe_bytes} 字节，"
+            f"避免 {reloads_avoided} 次整页刷新（约 {page_bytes} 字节/次），节省 {saved} 字节"
+        )
+
+    def _next_screenshot_name(self, name: str) -> str:
+        """生成下一张截图的文件名"""
+        return f"{len(self.screenshots) + 1:02d}_{name}.png"
+
+    def _notify(self, message: str, level: str = "INFO"):
+        """发送通知（异步版在线程中发送）"""
+        return self._in_thread(self.notifier.notify, message, level)
+
+    def _send_photo(self, path: str, caption: str = ""):
+        """发送图片（异步版在线程中发送）"""
+        return self._in_thread(self.notifier.send_photo, path, caption)
 
     def login(
         self,
-        page: Page,
+        page,
         credentials: GitHubCredentials,
         two_factor_config: TwoFactorConfig,
         device_config: DeviceVerificationConfig,
-    ) -> bool:
+    ):
         """完整的 GitHub 登录流程
 
         Args:
@@ -56,78 +142,159 @@ class GitHubAuthenticator:
         Returns:
             是否登录成功
         """
+        return self._run(self._login_steps(page, credentials, two_factor_config, device_config))
+
+    def ensure_logged_in(
+        self,
+        page,
+        credentials: GitHubCredentials,
+        two_factor_config: TwoFactorConfig,
+        device_config: DeviceVerificationConfig,
+    ):
+        """确保当前上下文已登录 GitHub
+
+        先访问 GitHub 登录页，已有会话（如预加载的 Session Cookie）会显示登录标识，
+        否则执行完整登录流程（含 2FA 与设备验证）。
+
+        Returns:
+            是否已登录
+        """
+        return self._run(
+            self._ensure_logged_in_steps(page, credentials, two_factor_config, device_config)
+        )
+
+    def handle_device_verification(self, page, config: DeviceVerificationConfig):
+        """处理设备验证
+
+        Returns:
+            是否成功
+        """
+        return self._run(self._device_verification_steps(page, config))
+
+    def handle_2fa(self, page, config: TwoFactorConfig):
+        """处理双因素认证（自动路由）
+
+        Returns:
+            是否成功
+        """
+        return self._run(self._two_factor_steps(page, config))
+
+    def _screenshot(self, page, name: str):
+        """截图
+
+        Returns:
+            截图文件路径，失败返回 None
+        """
+        return self._run(self._screenshot_steps(page, name))
+
+    def _login_steps(
+        self,
+        page,
+        credentials: GitHubCredentials,
+        two_factor_config: TwoFactorConfig,
+        device_config: DeviceVerificationConfig,
+    ) -> Steps[bool]:
+        """登录流程各步骤"""
         logger.info("🔹 登录 GitHub...")
-        self._screenshot(page, "github_登录页")
+        # 统计密码登录与设备验证次数，用于衡量设备验证频率
+        self._add_metric("github_password_logins")
+        yield from self._screenshot_steps(page, "github_登录页")
 
         # 输入凭据
-        if not self._fill_credentials(page, credentials):
+        if not (yield from self._fill_credentials_steps(page, credentials)):
             return False
 
-        self._screenshot(page, "github_已填写")
+        yield from self._screenshot_steps(page, "github_已填写")
 
         # 提交表单
-        self._submit_login_form(page)
-
-        time.sleep(Timeouts.LOGIN_SLEEP / 1000)
-        self._wait_for_page_load(page)
-        self._screenshot(page, "github_登录后")
+        login_url = page.url
+        yield from self._submit_login_form_steps(page)
+
+        yield self._pause(
+            Timeouts.LOGIN_SLEEP / 1000,
+            lambda: page.wait_for_url(
+                lambda url: url != login_url, timeout=Timeouts.READY, wait_until="commit"
+            ),
+        )
+        yield from self._page_load_steps(page)
+        yield from self._screenshot_steps(page, "github_登录后")
 
         url = page.url
         logger.info(f"当前 URL: {url}")
 
         # 处理设备验证
-        if GitHubUrls.DEVICE_VERIFICATION in url or GitHubUrls.DEVICE_VERIFICATION_ALT in url:
-            if not self.handle_device_verification(page, device_config):
+        if self._is_device_verification(url):
+            self._add_metric("device_verifications")
+            if not (yield from self._device_verification_steps(page, device_config)):
                 return False
-            time.sleep(2)
-            self._wait_for_page_load(page)
+            yield self._pause(
+                2, lambda: page.wait_for_load_state("domcontentloaded", timeout=Timeouts.READY)
+            )
+            yield from self._page_load_steps(page)
 
         # 处理双因素认证
         if GitHubUrls.TWO_FACTOR in page.url:
-            if not self.handle_2fa(page, two_factor_config):
+            if not (yield from self._two_factor_steps(page, two_factor_config)):
                 return False
 
         # 检查错误
-        if self._check_login_error(page):
+        if (yield from self._login_error_steps(page)):
             return False
 
         logger.info("✅ GitHub 认证成功")
         return True
 
-    def _fill_credentials(self, page: Page, credentials: GitHubCredentials) -> bool:
-        """填写登录凭据
+    def _ensure_logged_in_steps(
+        self,
+        page,
+        credentials: GitHubCredentials,
+        two_factor_config: TwoFactorConfig,
+        device_config: DeviceVerificationConfig,
+    ) -> Steps[bool]:
+        """已有会话时直接返回，否则执行登录流程"""
+        yield page.goto(GitHubUrls.LOGIN, wait_until="domcontentloaded")
+        try:
+            yield page.wait_for_selector(
+                Selectors.LOGGED_IN_INDICATOR, timeout=Timeouts.ELEMENT_VISIBLE
+            )
+            logger.info("✅ 已登录 GitHub")
+            return True
+        except PlaywrightTimeout:
+            pass
 
-        Args:
-            page: Page 对象
-            credentials: 凭据
+        return (yield from self._login_steps(page, credentials, two_factor_config, device_config))
+
+    def _fill_credentials_steps(self, page, credentials: GitHubCredentials) -> Steps[bool]:
+        """填写登录凭据
 
         Returns:
             是否成功
         """
         try:
-            page.locator(Selectors.LOGIN_INPUT).fill(credentials.username)
-            page.locator(Selectors.PASSWORD_INPUT).fill(credentials.password)
+            yield page.locator(Selectors.LOGIN_INPUT).fill(credentials.username)
+            yield page.locator(Selectors.PASSWORD_INPUT).fill(credentials.password)
             logger.info("✅ 已输入凭据")
             return True
         except (PlaywrightTimeout, PlaywrightError) as e:
             logger.error(f"❌ 输入凭据失败: {e}")
             return False
 
-    def _submit_login_form(self, page: Page) -> None:
+    def _submit_login_form_steps(self, page) -> Steps[None]:
         """提交登录表单"""
         try:
-            page.locator(Selectors.SUBMIT_BUTTON).first.click()
+            yield page.locator(Selectors.SUBMIT_BUTTON).first.click()
         except (PlaywrightTimeout, PlaywrightError):
             logger.warning("未找到提交按钮，可能已自动提交")
 
-    def _wait_for_page_load(self, page: Page, timeout: int = Timeouts.NETWORK_IDLE) -> None:
+    def _page_load_steps(self, page, timeout: int = Timeouts.NETWORK_IDLE) -> Steps[None]:
         """等待页面加载完成"""
         try:
-            page.wait_for_load_state("networkidle", timeout=timeout)
+            with self.pacer.waiting():
+                yield page.wait_for_load_state("networkidle", timeout=timeout)
         except PlaywrightTimeout:
             logger.warning("页面加载超时，继续执行")
 
-    def _check_login_error(self, page: Page) -> bool:
+    def _login_error_steps(self, page) -> Steps[bool]:
         """检查登录错误
 
         Returns:
@@ -135,80 +302,101 @@ class GitHubAuthenticator:
         """
         try:
             err = page.locator(Selectors.ERROR_FLASH).first
-            if err.is_visible(timeout=2000):
-                error_text = err.inner_text()
+            if (yield err.is_visible(timeout=2000)):
+                error_text = yield err.inner_text()
                 logger.error(f"❌ 登录错误: {error_text}")
                 return True
         except (PlaywrightTimeout, PlaywrightError):
             pass
         return False
 
-    def handle_device_verification(self, page: Page, config: DeviceVerificationConfig) -> bool:
-        """处理设备验证
-
-        Args:
-            page: Page 对象
-            config: 设备验证配置
-
-        Returns:
-            是否成功
-        """
+    def _device_verification_steps(self, page, config: DeviceVerificationConfig) -> Steps[bool]:
+        """等待设备验证：页面自身离开验证页，或轻量探测发现已通过"""
         logger.warning(f"⚠️ 需要设备验证，等待 {config.wait} 秒...")
-        self._screenshot(page, "设备验证")
+        yield from self._screenshot_steps(page, "设备验证")
 
-        self.notifier.notify(Messages.DEVICE_VERIFICATION_NEEDED.format(wait=config.wait), "WARN")
+        yield self._notify(Messages.DEVICE_VERIFICATION_NEEDED.format(wait=config.wait), "WARN")
 
         if self.screenshots:
-            self.notifier.send_photo(self.screenshots[-1], "设备验证页面")
-
-        for i in range(config.wait):
-            time.sleep(1)
-            if i % 5 == 0 and i > 0:
-                logger.info(f"  等待... ({i}/{config.wait}秒)")
-                url = page.url
-                if (
-                    GitHubUrls.DEVICE_VERIFICATION not in url
-                    and GitHubUrls.DEVICE_VERIFICATION_ALT not in url
-                ):
-                    logger.info("✅ 设备验证通过！")
-                    self.notifier.notify("✅ <b>设备验证通过</b>", "SUCCESS")
-                    return True
-                try:
-                    page.reload(timeout=10000)
-                    self._wait_for_page_load(page, 10000)
-                except (PlaywrightTimeout, PlaywrightError):
-                    pass
-
-        # 最后检查一次
-        if (
-            GitHubUrls.DEVICE_VERIFICATION not in page.url
-            and GitHubUrls.DEVICE_VERIFICATION_ALT not in page.url
-        ):
+            yield self._send_photo(self.screenshots[-1], "设备验证页面")
+
+        verify_url = page.url
+        page_bytes = yield from self._page_weight_steps(page)
+        probe_bytes = 0
+        start = time.monotonic()
+        deadline = start + config.wait
+
+        while not (yield from self._left_device_verification_steps(page, deadline)):
+            if time.monotonic() >= deadline:
+                break
+            # 轻量探测：只请求验证页文档，不加载子资源、不跟随重定向
+            location, size = yield from self._probe_device_verification_steps(page, verify_url)
+            probe_bytes += size
+            if location:
+                yield page.goto(location, wait_until="domcontentloaded")
+                break
+
+        self._record_device_verification_savings(time.monotonic() - start, page_bytes, probe_bytes)
+
+        if not self._is_device_verification(page.url):
+            logger.info("✅ 设备验证通过！")
+            yield self._notify("✅ <b>设备验证通过</b>", "SUCCESS")
             return True
 
         logger.error("❌ 设备验证超时")
-        self.notifier.notify("❌ <b>设备验证超时</b>", "ERROR")
+        yield self._notify("❌ <b>设备验证超时</b>", "ERROR")
         return False
 
-    def handle_2fa(self, page: Page, config: TwoFactorConfig) -> bool:
-        """处理双因素认证（自动路由）
+    def _left_device_verification_steps(self, page, deadline: float) -> Steps[bool]:
+        """等待页面自身离开设备验证页，最长一个探测间隔
 
-        Args:
-            page: Page 对象
-            config: 2FA 配置
+        Returns:
+            是否已离开
+        """
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return not self._is_device_verification(page.url)
+        try:
+            yield page.wait_for_url(
+                lambda url: not self._is_device_verification(url),
+                timeout=min(remaining * 1000, Timeouts.DEVICE_POLL),
+                wait_until="commit",
+            )
+            return True
+        except PlaywrightTimeout:
+            return False
+
+    def _probe_device_verification_steps(self, page, url: str) -> Steps[tuple[Optional[str], int]]:
+        """用上下文的请求客户端（共享 Cookie）探测设备验证状态
 
         Returns:
-            是否成功
+            (通过后的重定向目标或 None, 响应字节数)
         """
+        try:
+            response = yield page.request.get(url, max_redirects=0, timeout=Timeouts.SHORT_WAIT * 5)
+            size = len((yield response.body()))
+            return self._approved_location(url, response.status, response.headers), size
+        except (PlaywrightTimeout, PlaywrightError) as e:
+            logger.debug(f"设备验证探测失败: {e}")
+            return None, 0
+
+    def _page_weight_steps(self, page) -> Steps[int]:
+        """当前页面一次完整加载传输的字节数"""
+        try:
+            return int((yield page.evaluate(PAGE_WEIGHT_JS)))
+        except (PlaywrightTimeout, PlaywrightError):
+            return 0
+
+    def _two_factor_steps(self, page, config: TwoFactorConfig) -> Steps[bool]:
+        """按页面 URL 选择 GitHub Mobile 或 TOTP 验证"""
         logger.warning("⚠️ 需要双因素认证")
-        self._screenshot(page, "双因素认证")
+        yield from self._screenshot_steps(page, "双因素认证")
 
         if GitHubUrls.TWO_FACTOR_MOBILE in page.url:
-            return self._handle_2fa_mobile(page, config.mobile_wait)
-        else:
-            return self._handle_2fa_totp(page, config.totp_wait)
+            return (yield from self._mobile_2fa_steps(page, config.mobile_wait))
+        return (yield from self._totp_2fa_steps(page, config.totp_wait))
 
-    def _handle_2fa_mobile(self, page: Page, timeout: int) -> bool:
+    def _mobile_2fa_steps(self, page, timeout: int) -> Steps[bool]:
         """处理 GitHub Mobile 验证
 
         Args:
@@ -220,33 +408,33 @@ class GitHubAuthenticator:
         """
         logger.warning(f"⚠️ 等待 GitHub Mobile 批准（{timeout}秒）...")
 
-        shot = self._screenshot(page, "2fa_mobile")
-        self.notifier.notify(Messages.TWO_FACTOR_MOBILE_NEEDED.format(timeout=timeout), "WARN")
+        shot = yield from self._screenshot_steps(page, "2fa_mobile")
+        yield self._notify(Messages.TWO_FACTOR_MOBILE_NEEDED.format(timeout=timeout), "WARN")
 
         if shot:
-            self.notifier.send_photo(shot, "双因素认证页面")
-
-        for i in range(timeout):
-            time.sleep(1)
+            yield self._send_photo(shot, "双因素认证页面")
 
-            url = page.url
-            if GitHubUrls.TWO_FACTOR not in url:
-                logger.info("✅ 双因素认证通过！")
-                self.notifier.notify("✅ <b>双因素认证通过</b>", "SUCCESS")
-                return True
+        start = time.monotonic()
+        try:
+            # 批准或拒绝后 GitHub 会重定向离开双因素认证页，等待该导航即可
+            yield page.wait_for_url(
+                self._left_two_factor, timeout=timeout * 1000, wait_until="commit"
+            )
+        except PlaywrightTimeout:
+            pass
 
-            if GitHubUrls.LOGIN in url:
-                logger.error("❌ 被重定向到登录页")
-                return False
+        if self._mobile_approval_result(page.url, time.monotonic() - start):
+            yield self._notify("✅ <b>双因素认证通过</b>", "SUCCESS")
+            return True
 
-            if i % 10 == 0 and i != 0:
-                logger.info(f"  等待... ({i}/{timeout}秒)")
+        if GitHubUrls.TWO_FACTOR not in page.url:
+            return False
 
         logger.error("❌ 双因素认证超时")
-        self.notifier.notify("❌ <b>双因素认证超时</b>", "ERROR")
+        yield self._notify("❌ <b>双因素认证超时</b>", "ERROR")
         return False
 
-    def _handle_2fa_totp(self, page: Page, timeout: int) -> bool:
+    def _totp_2fa_steps(self, page, timeout: int) -> Steps[bool]:
         """处理 TOTP 验证码
 
         Args:
@@ -257,27 +445,29 @@ class GitHubAuthenticator:
             是否成功
         """
         logger.warning("🔐 需要输入验证码")
-        shot = self._screenshot(page, "2fa_totp")
+        shot = yield from self._screenshot_steps(page, "2fa_totp")
 
-        self.notifier.notify(Messages.TWO_FACTOR_TOTP_NEEDED.format(timeout=timeout), "WARN")
+        yield self._notify(Messages.TWO_FACTOR_TOTP_NEEDED.format(timeout=timeout), "WARN")
 
         if shot:
-            self.notifier.send_photo(shot, "验证码输入页面")
+            yield self._send_photo(shot, "验证码输入页面")
 
-        code = self.notifier.wait_user_input("请输入验证码", r"^/code\s+(\d{6,8})$", timeout)
+        code = yield self._in_thread(
+            self.notifier.wait_user_input, "请输入验证码", r"^/code\s+(\d{6,8})$", timeout
+        )
 
         if not code:
             logger.error("❌ 等待验证码超时")
-            self.notifier.notify("❌ <b>等待验证码超时</b>", "ERROR")
+            yield self._notify("❌ <b>等待验证码超时</b>", "ERROR")
             return False
 
         logger.info("✅ 收到验证码，正在填入...")
-        self.notifier.notify("✅ 收到验证码，正在填入...", "SUCCESS")
+        yield self._notify("✅ 收到验证码，正在填入...", "SUCCESS")
 
-        return self._fill_totp_code(page, code)
+        return (yield from self._fill_totp_code_steps(page, code))
 
-    def _fill_totp_code(self, page: Page, code: str) -> bool:
-        """填写 TOTP 验证码
+    def _fill_totp_code_steps(self, page, code: str) -> Steps[bool]:
+        """填写并提交 TOTP 验证码
 
         Args:
             page: Page 对象
@@ -286,55 +476,69 @@ class GitHubAuthenticator:
         Returns:
             是否成功
         """
-        for sel in Selectors.TOTP_INPUT:
-            try:
-                el = page.locator(sel).first
-                if el.is_visible(timeout=2000):
-                    el.fill(code)
-                    logger.info("✅ 已填入验证码")
-                    time.sleep(1)
-
-                    # 提交
-                    try:
-                        btn = page.locator('button[type="submit"]').first
-                        btn.click()
-                    except (PlaywrightTimeout, PlaywrightError):
-                        page.keyboard.press("Enter")
-
-                    time.sleep(3)
-                    self._wait_for_page_load(page)
-
-                    if GitHubUrls.TWO_FACTOR not in page.url:
-                        logger.info("✅ 验证码验证通过！")
-                        self.notifier.notify("✅ <b>验证码验证通过</b>", "SUCCESS")
-                        return True
-                    else:
-                        logger.error("❌ 验证码可能错误")
-                        self.notifier.notify("❌ <b>验证码错误</b>", "ERROR")
-                        return False
-            except (PlaywrightTimeout, PlaywrightError):
-                continue
-
-        logger.error("❌ 未找到验证码输入框")
-        return False
+        el = yield self._wait_visible(page, Selectors.TOTP_INPUT, Timeouts.SHORT_WAIT)
+        if el is None:
+            logger.error("❌ 未找到验证码输入框")
+            return False
 
-    def _screenshot(self, page: Page, name: str) -> Optional[str]:
-        """截图
+        try:
+            yield el.fill(code)
+        except (PlaywrightTimeout, PlaywrightError) as e:
+            logger.error(f"❌ 填入验证码失败: {e}")
+            return False
+        logger.info("✅ 已填入验证码")
+        yield self._pause(1)
 
-        Args:
-            page: Page 对象
-            name: 截图名称
+        # 提交
+        try:
+            yield page.locator('button[type="submit"]').first.click()
+        except (PlaywrightTimeout, PlaywrightError):
+            yield page.keyboard.press("Enter")
+
+        yield self._pause(
+            3,
+            lambda: page.wait_for_url(
+                self._left_two_factor, timeout=Timeouts.READY, wait_until="commit"
+            ),
+        )
+        yield from self._page_load_steps(page)
+
+        if GitHubUrls.TWO_FACTOR not in page.url:
+            logger.info("✅ 验证码验证通过！")
+            yield self._notify("✅ <b>验证码验证通过</b>", "SUCCESS")
+            return True
+
+        logger.error("❌ 验证码可能错误")
+        yield self._notify("❌ <b>验证码错误</b>", "ERROR")
+        return False
+
+    def _screenshot_steps(self, page, name: str) -> Steps[Optional[str]]:
+        """截图并记录到 screenshots
 
         Returns:
             截图文件路径，失败返回 None
         """
         try:
-            n = len(self.screenshots) + 1
-            filename = f"{n:02d}_{name}.png"
-            page.screenshot(path=filename)
+            filename = self._next_screenshot_name(name)
+            yield page.screenshot(path=filename)
             self.screenshots.append(filename)
             logger.debug(f"截图保存: {filename}")
             return filename
         except (PlaywrightTimeout, PlaywrightError) as e:
             logger.warning(f"截图失败: {e}")
             return None
+
+
+class GitHubAuthenticator(SyncStepIO, GitHubAuthenticatorBase):
+    """GitHub 认证处理器
+
+    负责处理完整的 GitHub 登录流程，包括：
+    - 基本凭据认证
+    - 双因素认证（GitHub Mobile / TOTP）
+    - 设备验证
+    - 错误处理和截图
+
+    Attributes:
+        notifier: 通知器实例，用于发送实时通知和接收用户输入
+        screenshots: 截图文件路径列表
+    """
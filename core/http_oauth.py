@@ -0,0 +1,130 @@
+"""不启动浏览器的 OAuth 授权链
+
+GitHub 会话有效且 OAuth 应用已授权时，站点登录只是一串 302：
+站点 OAuth 入口 → github.com/login/oauth/authorize → 站点回调 → 站点控制台。
+HttpOAuthChain 用预置了 GitHub Cookie 的 requests.Session 逐跳跟随这些重定向，
+任何意外（需要登录、需要在授权页确认、非预期的页面或状态码）都抛出 HttpOAuthFallback，
+由适配器回退为浏览器流程。
+"""
+import logging
+from typing import Callable
+from urllib.parse import urljoin
+
+import requests
+from requests.exceptions import RequestException
+
+from core.types import HttpOAuthConfig
+from core.constants import Timeouts, GitHubUrls, CookieConfig, BrowserConfig
+
+logger = logging.getLogger(__name__)
+
+# 最终页面中出现这些片段说明实际停在了 GitHub 登录表单或授权页
+# （如站点用 200 + meta refresh / JS 跳转到 GitHub，而不是 302）
+GITHUB_PAGE_MARKERS = (
+    'action="/session"',
+    'id="login_field"',
+    'action="/login/oauth/authorize"',
+    "js-oauth-authorize-btn",
+)
+
+
+class HttpOAuthFallback(Exception):
+    """HTTP 授权链无法完成，需要回退为浏览器流程"""
+
+
+class HttpOAuthChain:
+    """跟随 OAuth 重定向链的 HTTP 会话
+
+    Attributes:
+        config: HTTP OAuth 配置
+        session: 携带 Cookie 的 HTTP 会话
+        requests: 已发送的请求数
+    """
+
+    def __init__(
+        self, config: HttpOAuthConfig, session_cookie: str, timeout: float = Timeouts.API_REQUEST
+    ):
+        """初始化
+
+        Args:
+            config: HTTP OAuth 配置
+            session_cookie: GitHub user_session 的值
+            timeout: 单个请求的超时（秒）
+        """
+        self.config = config
+        self.timeout = timeout
+        self.requests = 0
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = BrowserConfig.USER_AGENT
+        for name, value in (
+            (CookieConfig.SESSION_COOKIE_NAME, session_cookie),
+            (CookieConfig.LOGGED_IN_COOKIE_NAME, CookieConfig.LOGGED_IN_VALUE),
+        ):
+            self.session.cookies.set(name, value, domain=CookieConfig.GITHUB_DOMAIN, path="/")
+
+    def _get(self, url: str) -> requests.Response:
+        """发送不跟随重定向的 GET 请求"""
+        self.requests += 1
+        try:
+            return self.session.get(url, allow_redirects=False, timeout=self.timeout)
+        except RequestException as e:
+            raise HttpOAuthFallback(f"请求失败: {e}") from e
+
+    def run(self, is_success_url: Callable[[str], bool]) -> str:
+        """从站点 OAuth 入口开始逐跳跟随重定向
+
+        Args:
+            is_success_url: 判断 URL 是否为登录成功后页面（站点的 success_url_patterns）
+
+        Returns:
+            最终页面的 URL
+
+        Raises:
+            HttpOAuthFallback: 链路未按预期到达登录成功页面，或最终页面内容是 GitHub 登录/授权页
+        """
+        url = self.config.start_url
+        for _ in range(self.config.max_redirects + 1):
+            response = self._get(url)
+            if response.is_redirect:
+                url = urljoin(url, response.headers["Location"])
+                logger.debug(f"HTTP OAuth 重定向: {url}")
+                if "github.com/login" in url and GitHubUrls.OAUTH_AUTHORIZE not in url:
+                    raise HttpOAuthFallback("GitHub 会话无效，需要登录")
+                continue
+
+            if response.status_code != 200:
+                raise HttpOAuthFallback(f"意外的状态码 {response.status_code}: {url}")
+            if GitHubUrls.OAUTH_AUTHORIZE in url:
+                raise HttpOAuthFallback("OAuth 应用尚未授权，需要在授权页确认")
+            if not is_success_url(url):
+                raise HttpOAuthFallback(f"意外的页面: {url}")
+            if any(marker in response.text for marker in GITHUB_PAGE_MARKERS):
+                raise HttpOAuthFallback(f"页面内容是 GitHub 登录/授权页: {url}")
+            return url
+
+        raise HttpOAuthFallback(f"重定向超过 {self.config.max_redirects} 次")
+
+    def visit(self, url: str) -> bool:
+        """访问页面（保活）
+
+        Returns:
+            是否返回 2xx
+        """
+        try:
+            response = self._get(url)
+        except HttpOAuthFallback:
+            return False
+        return response.ok
+
+    def cookies(self) -> list[dict]:
+        """会话中的 Cookie，格式与 BrowserContext.cookies() 一致"""
+        return [
+            {
+                "name": cookie.name,
+                "value": cookie.value,
+                "domain": cookie.domain,
+                "path": cookie.path,
+                "expires": cookie.expires if cookie.expires is not None else -1,
+            }
+            for cookie in self.session.cookies
+        ]
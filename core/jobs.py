@@ -0,0 +1,126 @@
+"""登录任务生成"""
+from dataclasses import replace
+from datetime import datetime
+from typing import Optional
+
+from core.types import SiteConfig, LoginJob, AccountConfig, GitHubCredentials
+from core.state_manager import StateManager
+
+
+def build_jobs(
+    sites: dict[str, SiteConfig], credentials: GitHubCredentials, account: str = ""
+) -> list[LoginJob]:
+    """为一个账号生成所有站点的登录任务
+
+    Args:
+        sites: 站点名称到站点配置的映射
+        credentials: GitHub 凭据
+        account: 账号标识（单账号时为空）
+
+    Returns:
+        登录任务列表
+    """
+    return [
+        LoginJob(site=site_name, config=config, credentials=credentials, account=account)
+        for site_name, config in sites.items()
+    ]
+
+
+def build_account_jobs(
+    sites: dict[str, SiteConfig], accounts: list[AccountConfig]
+) -> list[LoginJob]:
+    """为多个账号生成登录任务
+
+    账号配置了 sites 时只运行其中列出的站点；配置了 cookie_targets 时
+    替换站点默认的 Cookie 存储目标，使每个账号的 Cookie 写入各自的位置。
+
+    Args:
+        sites: 站点名称到站点配置的映射
+        accounts: 账号配置列表
+
+    Returns:
+        登录任务列表
+    """
+    jobs = []
+    for account in accounts:
+        for site_name, config in sites.items():
+            if account.sites is not None and site_name not in account.sites:
+                continue
+            if account.cookie_targets:
+                config = replace(config, cookie_targets=account.cookie_targets)
+            jobs.append(
+                LoginJob(
+                    site=site_name,
+                    config=config,
+                    credentials=account.credentials,
+                    account=account.name,
+                )
+            )
+    return jobs
+
+
+def split_fresh_jobs(
+    jobs: list[LoginJob], state_manager: StateManager, now: Optional[datetime] = None
+) -> tuple[list[LoginJob], list[LoginJob]]:
+    """按站点的 min_refresh_interval 区分需要运行与可以跳过的任务
+
+    Args:
+        jobs: 登录任务列表
+        state_manager: 状态管理器
+        now: 当前时间（默认取当前时间）
+
+    Returns:
+        (需要运行的任务, 状态仍新鲜、可以跳过的任务)
+    """
+    stale, fresh = [], []
+    for job in jobs:
+        if state_manager.is_fresh(job.key, job.config.min_refresh_interval, now):
+            fresh.append(job)
+        else:
+            stale.append(job)
+    return stale, fresh
+
+
+def job_priority(job: LoginJob, state_manager: StateManager) -> tuple[bool, datetime]:
+    """任务优先级排序键（越小越优先）
+
+    健康站点优先于不健康站点；同一健康状况下 Cookie 越早过期越优先，
+    从未保存过 Cookie 或过期时间未知的任务视为最紧急。
+
+    Args:
+        job: 登录任务
+        state_manager: 状态管理器
+
+    Returns:
+        (是否不健康, Cookie 过期时间)
+    """
+    expiry = state_manager.get_cookie_expiry(job.key) or datetime.min
+    return not state_manager.is_healthy(job.key), expiry
+
+
+def prioritize_jobs(
+    jobs: list[LoginJob], state_manager: StateManager, now: Optional[datetime] = None
+) -> tuple[list[LoginJob], list[tuple[LoginJob, datetime]]]:
+    """按优先级排序任务，并推迟仍在冷却期内的不健康站点
+
+    不健康站点（连续失败达到阈值）在最后一次尝试后按指数冷却时间推迟，
+    避免反复消耗浏览器时间与回调超时。
+
+    Args:
+        jobs: 登录任务列表
+        state_manager: 状态管理器
+        now: 当前时间（默认取当前时间）
+
+    Returns:
+        (按优先级排序的待运行任务, [(冷却中的任务, 冷却结束时间)])
+    """
+    now = now or datetime.now()
+    ready, cooling = [], []
+    for job in jobs:
+        until = state_manager.cooldown_until(job.key)
+        if until and until > now:
+            cooling.append((job, until))
+        else:
+            ready.append(job)
+    ready.sort(key=lambda job: job_priority(job, state_manager))
+    return ready, cooling
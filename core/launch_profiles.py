@@ -0,0 +1,93 @@
+"""浏览器启动配置（launch_profile）
+
+main.py、login_only.py、daemon.py 与常驻浏览器服务共用同一组命名配置：
+
+- default: 与旧版一致，仅 --no-sandbox，1920×1080 视口
+- lean: 关闭扩展、后台网络、组件更新、GPU 等无头自动化用不到的功能，1280×720 视口
+- low-memory: 在 lean 基础上限制渲染进程数与 V8 堆大小，适合内存受限的 CI / 小型 VPS
+
+通过 --launch-profile 或环境变量 ATHENA_LAUNCH_PROFILE 选择，默认 default。
+"""
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+from core.constants import BrowserConfig
+
+
+@dataclass(frozen=True)
+class LaunchProfile:
+    """浏览器启动配置
+
+    Attributes:
+        name: 配置名称
+        args: Chromium 启动参数
+        viewport: 上下文视口大小
+    """
+
+    name: str
+    args: list[str]
+    viewport: dict[str, int]
+
+    def launch_options(self) -> dict:
+        """chromium.launch() 的参数"""
+        return {"headless": True, "args": list(self.args)}
+
+    def context_options(self) -> dict:
+        """browser.new_context() 的参数"""
+        return {"viewport": dict(self.viewport), "user_agent": BrowserConfig.USER_AGENT}
+
+
+_LEAN_ARGS = BrowserConfig.LAUNCH_ARGS + [
+    "--disable-extensions",
+    "--disable-component-extensions-with-background-pages",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-domain-reliability",
+    "--disable-client-side-phishing-detection",
+    "--disable-breakpad",
+    "--metrics-recording-only",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--mute-audio",
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+]
+
+PROFILES: dict[str, LaunchProfile] = {
+    "default": LaunchProfile("default", BrowserConfig.LAUNCH_ARGS, BrowserConfig.VIEWPORT),
+    "lean": LaunchProfile("lean", _LEAN_ARGS, {"width": 1280, "height": 720}),
+    "low-memory": LaunchProfile(
+        "low-memory",
+        _LEAN_ARGS
+        + [
+            "--renderer-process-limit=2",
+            # 不传 --disable-features：Chromium 只保留最后一个该开关，会覆盖 Playwright
+            # 自带的禁用列表（已包含 Translate、MediaRouter，且随版本变化，无法可靠合并）
+            "--disable-site-isolation-trials",
+            "--js-flags=--max-old-space-size=256",
+            "--disk-cache-size=33554432",
+        ],
+        {"width": 1024, "height": 640},
+    ),
+}
+
+
+def get_launch_profile(name: Optional[str] = None) -> LaunchProfile:
+    """获取启动配置
+
+    Args:
+        name: 配置名称（默认读取环境变量 ATHENA_LAUNCH_PROFILE，未设置时为 default）
+
+    Returns:
+        启动配置
+
+    Raises:
+        ValueError: 配置名称无效
+    """
+    name = name or os.environ.get("ATHENA_LAUNCH_PROFILE") or "default"
+    if name not in PROFILES:
+        raise ValueError(f"未知的启动配置: {name}（可选: {', '.join(PROFILES)}）")
+    return PROFILES[name]
@@ -0,0 +1,206 @@
+"""基于 SQLite 租约表的多节点任务队列"""
+import os
+import time
+import socket
+import sqlite3
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from core.types import LoginJob
+from core.constants import LeaseConfig
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS leases (
+    job_key TEXT PRIMARY KEY,
+    username TEXT,
+    node TEXT,
+    lease_expires REAL,
+    finished_at REAL,
+    success INTEGER,
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0
+)
+"""
+
+
+def default_node_id() -> str:
+    """当前节点标识（主机名:进程号）"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class LeaseQueue:
+    """租约任务队列
+
+    多台机器共享同一个 SQLite 文件，每个（账号, 站点）任务在表中占一行。
+    节点领取任务时写入带过期时间的租约，运行期间定期续约，完成后连同结果释放。
+    租约过期（节点崩溃）的任务可被其他节点重新领取；刚完成的任务在 done_ttl 内
+    不会被再次领取，避免多个节点重复登录触发 GitHub 设备验证。
+
+    同一账号的任务总是一起领取，以便该节点只登录一次 GitHub 并复用会话；
+    其他节点持有该 GitHub 账号任一任务的租约时，整组跳过，避免两个节点同时登录同一账号。
+
+    Attributes:
+        path: SQLite 文件路径
+        node: 当前节点标识
+        lease_seconds: 租约时长（秒）
+        done_ttl: 任务完成后不再领取的时间（秒）
+    """
+
+    def __init__(
+        self,
+        path: str,
+        node: Optional[str] = None,
+        lease_seconds: int = LeaseConfig.LEASE_SECONDS,
+        done_ttl: int = LeaseConfig.DONE_TTL,
+    ):
+        """初始化租约队列
+
+        Args:
+            path: SQLite 文件路径（位于各节点共享的存储上）
+            node: 当前节点标识（默认主机名:进程号）
+            lease_seconds: 租约时长（秒）
+            done_ttl: 任务完成后不再领取的时间（秒）
+        """
+        self.path = path
+        self.node = node or default_node_id()
+        self.lease_seconds = lease_seconds
+        self.done_ttl = done_ttl
+
+        with self._transaction() as conn:
+            conn.execute(_SCHEMA)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(leases)")}
+            if "username" not in columns:
+                # 旧版租约表没有 username 列，领取时补全
+                conn.execute("ALTER TABLE leases ADD COLUMN username TEXT")
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """以 BEGIN IMMEDIATE 开启写事务
+
+        每次操作使用独立连接，可以在续约线程中安全调用。
+        共享存储上不使用 WAL（需要共享内存），依赖 SQLite 文件锁串行化写入。
+        """
+        conn = sqlite3.connect(self.path, timeout=LeaseConfig.BUSY_TIMEOUT, isolation_level=None)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    def claim(self, jobs: list[LoginJob], limit: int) -> list[LoginJob]:
+        """领取可运行的任务
+
+        按 jobs 的顺序遍历账号，领取该账号全部可运行的任务，
+        直到领取数量达到 limit。其他节点持有同一 GitHub 账号任一任务
+        （包括不在本节点 jobs 中的任务）的有效租约时，跳过该账号。
+
+        Args:
+            jobs: 候选任务（通常为按优先级排序的全部任务）
+            limit: 期望领取的任务数（整组领取时可能略多）
+
+        Returns:
+            本节点已获得租约的任务
+        """
+        groups: dict[tuple[str, str], list[LoginJob]] = {}
+        for job in jobs:
+            groups.setdefault((job.account, job.credentials.username), []).append(job)
+
+        now = time.time()
+        claimed: list[LoginJob] = []
+        with self._transaction() as conn:
+            conn.executemany(
+                "INSERT INTO leases (job_key, username) VALUES (?, ?) "
+                "ON CONFLICT (job_key) DO UPDATE SET username = excluded.username",
+                [(job.key, job.credentials.username) for job in jobs],
+            )
+            rows = conn.execute("SELECT job_key, lease_expires, finished_at FROM leases").fetchall()
+            state = {key: (expires, finished) for key, expires, finished in rows}
+            busy = {
+                username
+                for (username,) in conn.execute(
+                    "SELECT DISTINCT username FROM leases WHERE node != ? AND lease_expires > ?",
+                    (self.node, now),
+                )
+            }
+
+            for (_, username), group in groups.items():
+                if len(claimed) >= limit:
+                    break
+                if username in busy:
+                    continue
+                claimed.extend(job for job in group if self._claimable(*state[job.key], now))
+
+            conn.executemany(
+                "UPDATE leases SET node = ?, lease_expires = ? WHERE job_key = ?",
+                [(self.node, now + self.lease_seconds, job.key) for job in claimed],
+            )
+
+        return claimed
+
+    def _claimable(
+        self, lease_expires: Optional[float], finished_at: Optional[float], now: float
+    ) -> bool:
+        """租约已过期且最近未完成的任务可以领取"""
+        if lease_expires is not None and lease_expires > now:
+            return False
+        return finished_at is None or finished_at + self.done_ttl <= now
+
+    def renew(self, keys: list[str]) -> None:
+        """为本节点持有的任务续约
+
+        Args:
+            keys: 任务键列表
+        """
+        if not keys:
+            return
+        expires = time.time() + self.lease_seconds
+        with self._transaction() as conn:
+            conn.executemany(
+                "UPDATE leases SET lease_expires = ? WHERE job_key = ? AND node = ?",
+                [(expires, key, self.node) for key in keys],
+            )
+
+    def release(self, key: str, success: bool, error: str = "") -> None:
+        """释放租约并记录结果
+
+        Args:
+            key: 任务键
+            success: 是否成功
+            error: 错误消息
+        """
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE leases SET lease_expires = NULL, finished_at = ?, success = ?, "
+                "error = ?, attempts = attempts + 1 WHERE job_key = ? AND node = ?",
+                (time.time(), int(success), error, key, self.node),
+            )
+
+    def abandon(self, keys: list[str]) -> None:
+        """放弃本节点持有但未完成的任务，其他节点可立即领取
+
+        Args:
+            keys: 任务键列表
+        """
+        if not keys:
+            return
+        with self._transaction() as conn:
+            conn.executemany(
+                "UPDATE leases SET lease_expires = NULL WHERE job_key = ? AND node = ?",
+                [(key, self.node) for key in keys],
+            )
+
+    def snapshot(self) -> list[dict]:
+        """所有任务的租约状态
+
+        Returns:
+            每行一个字典，按任务键排序
+        """
+        with self._transaction() as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute("SELECT * FROM leases ORDER BY job_key").fetchall()
+        return [dict(row) for row in rows]
@@ -0,0 +1,149 @@
+"""多节点租约运行器"""
+import asyncio
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from playwright.async_api import async_playwright
+
+from core.types import LoginJob, SiteResult, NotifierInterface
+from core.state_manager import StateManager
+from core.lease_queue import LeaseQueue
+from core.batch_runner import BatchRunner
+from core.browser_server import connect_or_launch_async
+from core.sharded_runner import format_throughput
+
+logger = logging.getLogger(__name__)
+
+
+class LeaseRunner:
+    """租约运行器
+
+    从共享的 LeaseQueue 中按批领取任务，在同一个浏览器上运行，
+    运行期间后台定期续约，每个任务完成后立即释放租约并写入结果。
+    释放租约（SQLite 提交）与写入状态文件在单独的写入线程中按完成顺序执行，不阻塞事件循环。
+    多个节点同时运行时各自领取不同的任务，吞吐量随节点数增长。
+
+    Attributes:
+        jobs: 全部候选任务（按优先级排序）
+        notifier: 通知器实例
+        queue: 租约队列
+        concurrency: 每批领取并同时运行的任务数
+        state_manager: 状态管理器
+    """
+
+    def __init__(
+        self,
+        jobs: list[LoginJob],
+        notifier: NotifierInterface,
+        queue: LeaseQueue,
+        concurrency: int,
+        state_manager: Optional[StateManager] = None,
+        share_github_session: bool = True,
+    ):
+        """初始化租约运行器
+
+        Args:
+            jobs: 全部候选任务（按优先级排序）
+            notifier: 通知器实例
+            queue: 租约队列
+            concurrency: 每批领取并同时运行的任务数
+            state_manager: 状态管理器（为空时不记录状态）
+            share_github_session: 是否按账号复用 GitHub 会话
+        """
+        self.jobs = jobs
+        self.notifier = notifier
+        self.queue = queue
+        self.concurrency = max(1, concurrency)
+        self.state_manager = state_manager
+        self.share_github_session = share_github_session
+        self._held: set[str] = set()
+
+    def run(self) -> list[SiteResult]:
+        """领取并运行任务，直到队列中没有本节点可领取的任务
+
+        Returns:
+            本节点运行的任务结果（按完成顺序）
+        """
+        return asyncio.run(self.run_async())
+
+    async def run_async(self) -> list[SiteResult]:
+        """在一个浏览器上循环领取、运行任务"""
+        results: list[SiteResult] = []
+        start = time.monotonic()
+        loop = asyncio.get_running_loop()
+        # 单个写入线程：StateManager 不是线程安全的，结果需要依次写入
+        writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lease-writer")
+        writes: list[tuple[str, asyncio.Future]] = []
+
+        def record(result: SiteResult) -> None:
+            self.queue.release(result.key, result.success, result.error)
+            if self.state_manager:
+                self.state_manager.record_result(result)
+
+        def finish(result: SiteResult) -> None:
+            # 不再续约；写入失败的任务在退出时放弃租约
+            self._held.discard(result.key)
+            writes.append((result.key, loop.run_in_executor(writer, record, result)))
+            results.append(result)
+
+        renewer = asyncio.create_task(self._renew_loop())
+        try:
+            async with async_playwright() as p:
+                browser = None
+                try:
+                    while True:
+                        claimed = await asyncio.to_thread(
+                            self.queue.claim, self.jobs, self.concurrency
+                        )
+                        if not claimed:
+                            break
+
+                        self._held.update(job.key for job in claimed)
+                        print(
+                            f"📥 [{self.queue.node}] 领取 {len(claimed)} 个任务: "
+                            f"{', '.join(job.key for job in claimed)}"
+                        )
+                        if browser is None:
+                            browser, _ = await connect_or_launch_async(p)
+
+                        await BatchRunner(
+                            claimed,
+                            self.notifier,
+                            self.concurrency,
+                            on_result=finish,
+                            share_github_session=self.share_github_session,
+                        ).run_on_browser(browser)
+                finally:
+                    if browser is not None:
+                        await browser.close()
+        finally:
+            renewer.cancel()
+            outcomes = await asyncio.gather(
+                *(future for _, future in writes), return_exceptions=True
+            )
+            writer.shutdown()
+            for (key, _), outcome in zip(writes, outcomes):
+                if isinstance(outcome, Exception):
+                    logger.error(f"写入任务结果失败: {key}: {outcome}")
+                    self._held.add(key)
+            # 异常退出或写入失败时放弃仍持有的租约，其他节点可立即领取
+            await asyncio.to_thread(self.queue.abandon, list(self._held))
+            self._held.clear()
+
+        elapsed = time.monotonic() - start
+        print(
+            f"📈 [{self.queue.node}] 完成 {len(results)} 个任务: "
+            f"{format_throughput(results, elapsed)}（总耗时 {elapsed:.1f}s）"
+        )
+        return results
+
+    async def _renew_loop(self) -> None:
+        """每 1/3 个租约时长为持有的任务续约"""
+        while True:
+            await asyncio.sleep(self.queue.lease_seconds / 3)
+            try:
+                await asyncio.to_thread(self.queue.renew, list(self._held))
+            except Exception as e:
+                logger.warning(f"续约失败: {e}")
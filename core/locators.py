@@ -0,0 +1,102 @@
+"""多选择器定位
+
+站点配置与 GitHub 页面常为同一个元素提供多个候选选择器。逐个探测时每个选择器
+各自等待超时，匹配的选择器越靠后等待越久；这里把所有候选合并为一个定位器，
+只等待一次，任一候选可见即返回。
+
+每个候选都先过滤为可见元素再组合：否则组合定位器的第一个匹配可能是 DOM 中更靠前的
+隐藏元素（如折叠的移动端导航、display:none 的副本），即使后面的候选已经可见也会等到超时。
+"""
+from typing import TYPE_CHECKING, Optional
+
+from playwright.sync_api import Error as PlaywrightError
+
+if TYPE_CHECKING:
+    from playwright.async_api import Locator as AsyncLocator
+    from playwright.sync_api import Locator
+
+
+def visible_locator(page, selector: str):
+    """只匹配可见元素的定位器"""
+    return page.locator(f"{selector} >> visible=true")
+
+
+def combined_locator(page, selectors: list[str]):
+    """任一选择器匹配可见元素即可的组合定位器（同步与异步 Page 均可使用）
+
+    Args:
+        page: Playwright Page 对象
+        selectors: 候选选择器（至少一个）
+
+    Returns:
+        组合定位器的第一个可见元素
+    """
+    locator = visible_locator(page, selectors[0])
+    for selector in selectors[1:]:
+        locator = locator.or_(visible_locator(page, selector))
+    return locator.first
+
+
+def wait_visible(page, selectors: list[str], timeout: int):
+    """等待任一候选元素可见（同步 API），所有候选共用一次等待
+
+    Args:
+        page: Playwright Page 对象
+        selectors: 候选选择器
+        timeout: 最长等待时间（毫秒）
+
+    Returns:
+        已可见的组合定位器，超时返回 None
+    """
+    element = combined_locator(page, selectors)
+    try:
+        element.wait_for(state="visible", timeout=timeout)
+    except PlaywrightError:
+        return None
+    return element
+
+
+async def wait_visible_async(page, selectors: list[str], timeout: int):
+    """等待任一候选元素可见（异步 API），语义同 wait_visible()"""
+    element = combined_locator(page, selectors)
+    try:
+        await element.wait_for(state="visible", timeout=timeout)
+    except PlaywrightError:
+        return None
+    return element
+
+
+def first_visible(page, selectors: list[str], timeout: int) -> Optional[tuple[str, "Locator"]]:
+    """等待任一候选元素可见，并确定命中的选择器（同步 API）
+
+    Args:
+        page: Playwright Page 对象
+        selectors: 候选选择器，靠前的优先
+        timeout: 最长等待时间（毫秒）
+
+    Returns:
+        (命中的选择器, 元素定位器)，超时返回 None
+    """
+    if wait_visible(page, selectors, timeout) is None:
+        return None
+
+    # 组合定位器已可见，逐个检查只用于确定命中的选择器，不会再等待
+    for selector in selectors:
+        element = visible_locator(page, selector).first
+        if element.is_visible():
+            return selector, element
+    return None
+
+
+async def first_visible_async(
+    page, selectors: list[str], timeout: int
+) -> Optional[tuple[str, "AsyncLocator"]]:
+    """等待任一候选元素可见，并确定命中的选择器（异步 API），语义同 first_visible()"""
+    if await wait_visible_async(page, selectors, timeout) is None:
+        return None
+
+    for selector in selectors:
+        element = visible_locator(page, selector).first
+        if await element.is_visible():
+            return selector, element
+    return None
@@ -1,81 +1,239 @@
 """OAuth 流程控制器"""
 import time
+import weakref
+from abc import ABC
+from typing import Callable, Optional
 
+from playwright.sync_api import TimeoutError as PlaywrightTimeout
 
-class OAuthFlowController:
-    """OAuth 流程控制"""
+from core.types import ReadySpec
+from core.constants import Timeouts, Selectors
+from core.pacing import Pacer
+from core.readiness import ReadyWaiter
+from core.steps import Steps, StepIO, SyncStepIO
 
-    def __init__(self, notifier):
-        self.notifier = notifier
+# 停留在授权页时等待新导航的最长时间（秒），之后检查是否需要重新点击
+AUTHORIZE_RETRY_INTERVAL = 1
+
+
+class DocumentCounter:
+    """统计页面主框架提交的文档数，用于判断授权按钮是否已在当前文档上点击过
+
+    Attributes:
+        count: 主框架 framenavigated 事件次数
+        clicked: 上次成功点击授权按钮时的 count，未点击过为 None
+    """
+
+    def __init__(self, page):
+        self.page = page
+        self.count = 0
+        self.clicked: Optional[int] = None
+        page.on("framenavigated", self._on_navigated)
+
+    def _on_navigated(self, frame) -> None:
+        if frame == self.page.main_frame:
+            self.count += 1
 
-    def click_oauth_button(self, page, selectors: list[str], button_name: str = "OAuth") -> bool:
-        """点击 OAuth 登录按钮"""
-        for selector in selectors:
+    def should_click(self) -> bool:
+        """上次点击没有找到按钮，或之后提交了新文档（包括同一 URL 的重新渲染）"""
+        return self.clicked != self.count
+
+    def mark_clicked(self) -> None:
+        self.clicked = self.count
+
+
+class OAuthFlowControllerBase(StepIO, ABC):
+    """OAuth 流程控制公共逻辑
+
+    流程以步骤生成器实现，同步版与异步版只提供 I/O（见 core.steps）。
+    公开方法在同步版中返回结果，在异步版中返回协程。
+    """
+
+    def __init__(self, notifier, pacer: Optional[Pacer] = None):
+        self.notifier = notifier
+        self.pacer = pacer or Pacer()
+        self._documents: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def _document_counter(self, page) -> DocumentCounter:
+        """页面的文档计数器（每个页面只注册一次监听）"""
+        counter = self._documents.get(page)
+        if counter is None:
+            counter = self._documents[page] = DocumentCounter(page)
+        return counter
+
+    @staticmethod
+    def _is_authorize_page(url: str) -> bool:
+        """判断 URL 是否为 GitHub OAuth 授权页"""
+        return "github.com/login/oauth/authorize" in url
+
+    @staticmethod
+    def _callback_predicate(success_patterns: list[str]) -> Callable[[str], bool]:
+        """将回调成功模式编译为 URL 判断函数（任一正向模式匹配即成功）
+
+        反向模式（以 ! 开头）只在登录验证时使用，这里忽略。
+        """
+        positives = [pattern for pattern in success_patterns if not pattern.startswith("!")]
+        return lambda url: any(pattern in url for pattern in positives)
+
+    @classmethod
+    def _is_callback_success(cls, url: str, success_patterns: list[str]) -> bool:
+        """判断 URL 是否命中回调成功模式（任一正向模式匹配即成功）"""
+        return cls._callback_predicate(success_patterns)(url)
+
+    def _navigation_predicate(
+        self, is_success: Callable[[str], bool], current_url: str
+    ) -> Callable[[str], bool]:
+        """等待下一次有意义的导航：回调成功，或进入新的授权页"""
+        return lambda url: is_success(url) or (self._is_authorize_page(url) and url != current_url)
+
+    def click_oauth_button(self, page, selectors: list[str], button_name: str = "OAuth"):
+        """点击 OAuth 登录按钮
+
+        所有候选选择器合并为一次等待，点击最先可见的按钮。
+
+        Returns:
+            是否已点击
+        """
+        return self._run(self._click_oauth_button_steps(page, selectors, button_name))
+
+    def handle_authorization(self, page, ready: Optional[ReadySpec] = None, timeout: int = 30):
+        """处理 OAuth 授权页面
+
+        Args:
+            page: Page 对象
+            ready: 授权后的就绪条件，为 None 时等待 networkidle
+            timeout: 就绪条件未指定 timeout 时的超时时间（秒）
+        """
+        return self._run(self._handle_authorization_steps(page, ready, timeout))
+
+    def wait_callback(self, page, success_patterns: list[str], timeout: int = 60):
+        """等待 OAuth 回调完成
+
+        基于导航事件等待，而不是按秒轮询 URL：重定向提交（commit）后立即返回；
+        停留在授权页时点击授权按钮，并每秒检查一次：只有上次没有找到按钮，
+        或点击后提交了新文档（GitHub 在同一 URL 重新渲染授权页）时才重新点击。
+
+        Args:
+            page: Page 对象
+            success_patterns: 回调成功 URL 模式
+            timeout: 超时时间（秒）
+
+        Returns:
+            是否回调成功
+        """
+        return self._run(self._wait_callback_steps(page, success_patterns, timeout))
+
+    def _click_authorize(self, page):
+        """点击授权按钮
+
+        Returns:
+            是否已点击
+        """
+        return self._run(self._click_authorize_steps(page))
+
+    def _click_oauth_button_steps(
+        self, page, selectors: list[str], button_name: str
+    ) -> Steps[bool]:
+        """等待并点击最先可见的 OAuth 按钮"""
+        match = yield self._first_visible(page, selectors, Timeouts.OAUTH_BUTTON)
+        if match:
+            selector, element = match
             try:
-                element = page.locator(selector).first
-                if element.is_visible(timeout=3000):
-                    element.click()
-                    print(f"✅ 已点击: {button_name}")
-                    return True
-            except Exception:
-                pass
+                yield element.click()
+                print(f"✅ 已点击: {button_name}（{selector}）")
+                return True
+            except Exception as e:
+                print(f"❌ 点击 {button_name} 按钮失败: {e}")
+                return False
 
         print(f"❌ 未找到 {button_name} 按钮")
         return False
 
-    def handle_authorization(self, page) -> bool:
-        """处理 OAuth 授权页面"""
-        if "github.com/login/oauth/authorize" not in page.url:
+    def _handle_authorization_steps(
+        self, page, ready: Optional[ReadySpec], timeout: int
+    ) -> Steps[bool]:
+        """点击授权按钮后等待离开授权页，再等待就绪"""
+        if not self._is_authorize_page(page.url):
             return True
 
         print("🔹 处理 OAuth 授权...")
 
-        authorize_selectors = [
-            'button[name="authorize"]',
-            'button:has-text("Authorize")',
-            'button:has-text("授权")',
-        ]
+        waiter = ReadyWaiter(page, ready, timeout)
+        if (yield from self._authorize_steps(page)):
+            yield self._pause(
+                3,
+                lambda: page.wait_for_url(
+                    lambda url: not self._is_authorize_page(url),
+                    timeout=Timeouts.READY,
+                    wait_until="commit",
+                ),
+            )
+            with self.pacer.waiting():
+                yield self._wait_ready(waiter)
 
-        for selector in authorize_selectors:
-            try:
-                element = page.locator(selector).first
-                if element.is_visible(timeout=2000):
-                    element.click()
-                    print("✅ 已点击授权按钮")
-                    time.sleep(3)
-                    page.wait_for_load_state("networkidle", timeout=30000)
-                    return True
-            except Exception:
-                pass
+        return True
+
+    def _authorize_steps(self, page) -> Steps[bool]:
+        """在当前文档上点击授权按钮，同一文档只点击一次，避免重复提交授权表单
 
+        Returns:
+            是否已点击
+        """
+        documents = self._document_counter(page)
+        if not documents.should_click() or not (yield from self._click_authorize_steps(page)):
+            return False
+        documents.mark_clicked()
         return True
 
-    def wait_callback(self, page, success_patterns: list[str], timeout: int = 60) -> bool:
-        """等待 OAuth 回调完成"""
+    def _click_authorize_steps(self, page) -> Steps[bool]:
+        """等待授权按钮可见并点击"""
+        element = yield self._wait_visible(page, Selectors.AUTHORIZE_BUTTON, Timeouts.SHORT_WAIT)
+        if element is None:
+            return False
+        try:
+            yield element.click()
+        except Exception:
+            return False
+        print("✅ 已点击授权按钮")
+        return True
+
+    def _wait_callback_steps(self, page, success_patterns: list[str], timeout: int) -> Steps[bool]:
+        """等待回调成功，停留在授权页时按间隔检查是否需要点击授权按钮"""
         print(f"🔹 等待回调重定向（{timeout}秒）...")
 
-        for i in range(timeout):
+        is_success = self._callback_predicate(success_patterns)
+        start = time.monotonic()
+        deadline = start + timeout
+
+        while True:
             url = page.url
+            if is_success(url):
+                print(f"✅ 回调成功！（{time.monotonic() - start:.2f}s）")
+                return True
 
-            # 检查成功模式
-            for pattern in success_patterns:
-                if pattern.startswith("!"):
-                    # 反向匹配（不包含）
-                    if pattern[1:] not in url:
-                        continue
-                else:
-                    # 正向匹配
-                    if pattern in url:
-                        print("✅ 回调成功！")
-                        return True
-
-            # 处理 OAuth 授权页面
-            if "github.com/login/oauth/authorize" in url:
-                self.handle_authorization(page)
-
-            time.sleep(1)
-            if i % 10 == 0 and i > 0:
-                print(f"  等待... ({i}/{timeout}秒)")
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            wait = remaining
+            if self._is_authorize_page(url):
+                # 同一授权页重新渲染不会产生新 URL，按间隔检查是否需要重新点击
+                yield from self._authorize_steps(page)
+                wait = min(remaining, AUTHORIZE_RETRY_INTERVAL)
+
+            try:
+                with self.pacer.waiting():
+                    yield page.wait_for_url(
+                        self._navigation_predicate(is_success, url),
+                        timeout=wait * 1000,
+                        wait_until="commit",
+                    )
+            except PlaywrightTimeout:
+                pass
 
         print("❌ 回调超时")
         return False
+
+
+class OAuthFlowController(SyncStepIO, OAuthFlowControllerBase):
+    """OAuth 流程控制"""
@@ -0,0 +1,103 @@
+"""固定等待与条件等待
+
+旧流程在各步骤之间使用固定的 sleep（1–3 秒）等待页面就绪，顺利时累计 10 秒以上。
+快速模式（--fast 或环境变量 ATHENA_FAST=1）用明确的就绪条件（URL 变化、
+元素可见、页面加载事件）代替这些 sleep，并统计两类等待各自花费的时间。
+"""
+import os
+import time
+import asyncio
+import logging
+from contextlib import contextmanager
+from typing import Awaitable, Callable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def fast_mode_enabled() -> bool:
+    """是否通过环境变量 ATHENA_FAST 启用了快速模式"""
+    return os.environ.get("ATHENA_FAST", "").lower() in ("1", "true", "yes")
+
+
+class Pacer:
+    """步骤间等待策略与耗时统计
+
+    同步与异步流程共用：pause() / pause_async() 在普通模式下固定 sleep，
+    在快速模式下改为执行就绪条件；waiting() 统计真实等待（页面加载、导航等）的耗时。
+
+    Attributes:
+        fast: 是否为快速模式
+        sleep_seconds: 固定 sleep 累计耗时（秒）
+        wait_seconds: 条件等待累计耗时（秒）
+    """
+
+    def __init__(self, fast: Optional[bool] = None):
+        """初始化
+
+        Args:
+            fast: 是否为快速模式（默认读取环境变量 ATHENA_FAST）
+        """
+        self.fast = fast_mode_enabled() if fast is None else fast
+        self.sleep_seconds = 0.0
+        self.wait_seconds = 0.0
+
+    @contextmanager
+    def waiting(self) -> Iterator[None]:
+        """统计代码块内条件等待的耗时"""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.wait_seconds += time.monotonic() - start
+
+    def pause(self, seconds: float, ready: Optional[Callable[[], object]] = None) -> None:
+        """步骤间等待（同步版）
+
+        Args:
+            seconds: 普通模式下固定 sleep 的秒数
+            ready: 快速模式下执行的就绪条件，超时或出错时继续后续步骤；
+                为 None 表示前一步已经等到就绪，无需再等待
+        """
+        if not self.fast:
+            start = time.monotonic()
+            time.sleep(seconds)
+            self.sleep_seconds += time.monotonic() - start
+            return
+
+        if ready is None:
+            return
+        with self.waiting():
+            try:
+                ready()
+            except Exception as e:
+                logger.debug(f"就绪条件未满足，继续执行: {e}")
+
+    async def pause_async(
+        self, seconds: float, ready: Optional[Callable[[], Awaitable[object]]] = None
+    ) -> None:
+        """步骤间等待（异步版），参数同 pause()"""
+        if not self.fast:
+            start = time.monotonic()
+            await asyncio.sleep(seconds)
+            self.sleep_seconds += time.monotonic() - start
+            return
+
+        if ready is None:
+            return
+        with self.waiting():
+            try:
+                await ready()
+            except Exception as e:
+                logger.debug(f"就绪条件未满足，继续执行: {e}")
+
+    def metrics(self) -> dict[str, float]:
+        """耗时统计，写入 StateManager 的运行指标"""
+        return {
+            "fixed_sleep_seconds": round(self.sleep_seconds, 2),
+            "ready_wait_seconds": round(self.wait_seconds, 2),
+        }
+
+    def report(self) -> str:
+        """本次运行的等待耗时报告"""
+        mode = "快速模式" if self.fast else "普通模式"
+        return f"⏱️ 等待耗时（{mode}）: 固定 sleep {self.sleep_seconds:.1f}s，条件等待 {self.wait_seconds:.1f}s"
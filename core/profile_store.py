@@ -0,0 +1,99 @@
+"""按 GitHub 账号持久化的浏览器配置目录
+
+每次运行都从空白上下文开始时，GitHub 常把它当作新设备，要求设备验证。
+启用持久化配置（--profile-dir 或环境变量 ATHENA_PROFILE_DIR）后，每个 GitHub 账号
+使用固定的 Chromium 用户数据目录，设备 Cookie 与 HTTP 缓存在多次运行之间保留。
+
+同一目录同时只能被一个 Chromium 使用，通过目录旁的 .lock 文件（fcntl.flock）
+串行化并发运行，避免配置目录损坏。
+"""
+import os
+import re
+import time
+import fcntl
+import logging
+from typing import Optional, TextIO
+
+from core.constants import ProfileConfig
+
+logger = logging.getLogger(__name__)
+
+
+def profile_base_dir() -> Optional[str]:
+    """持久化配置的根目录（环境变量 ATHENA_PROFILE_DIR），未启用时返回 None"""
+    return os.environ.get("ATHENA_PROFILE_DIR") or None
+
+
+def profile_path(base_dir: str, username: str) -> str:
+    """账号对应的用户数据目录
+
+    Args:
+        base_dir: 持久化配置的根目录
+        username: GitHub 用户名
+
+    Returns:
+        用户数据目录路径（用户名中的特殊字符替换为下划线）
+    """
+    safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", username) or "default"
+    return os.path.join(base_dir, safe_name)
+
+
+class ProfileLock:
+    """用户数据目录的排他文件锁
+
+    Attributes:
+        path: 用户数据目录
+        timeout: 等待锁的最长时间（秒）
+    """
+
+    def __init__(self, path: str, timeout: float = ProfileConfig.LOCK_TIMEOUT):
+        """初始化
+
+        Args:
+            path: 用户数据目录
+            timeout: 等待锁的最长时间（秒）
+        """
+        self.path = path
+        self.timeout = timeout
+        self._file: Optional[TextIO] = None
+
+    def acquire(self) -> None:
+        """获取锁，其他进程持有时等待
+
+        Raises:
+            TimeoutError: 超时仍未获取到锁
+        """
+        os.makedirs(self.path, exist_ok=True)
+        # 锁文件需要在持有锁期间保持打开，由 release() 关闭
+        lock_file = open(  # pylint: disable=consider-using-with
+            f"{self.path}.lock", "a+", encoding="utf-8"
+        )
+        deadline = time.monotonic() + self.timeout
+        waited = False
+        while True:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    lock_file.close()
+                    raise TimeoutError(f"等待浏览器配置目录超时: {self.path}") from None
+                if not waited:
+                    logger.info(f"浏览器配置目录正在被其他进程使用，等待释放: {self.path}")
+                    waited = True
+                time.sleep(ProfileConfig.LOCK_POLL)
+        self._file = lock_file
+
+    def release(self) -> None:
+        """释放锁"""
+        if self._file is not None:
+            fcntl.flock(self._file, fcntl.LOCK_UN)
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "ProfileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
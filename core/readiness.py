@@ -0,0 +1,140 @@
+"""页面就绪等待
+
+SPA 控制台（如 ClawCloud）会持续轮询接口，networkidle 往往要等到超时。
+站点可以在 sites.yaml 的 ready 段为各步骤配置明确的就绪条件（元素可见、URL 匹配、
+出现指定响应），未配置时仍然等待 networkidle。
+"""
+import time
+from typing import Optional
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeout
+
+from core.types import ReadySpec
+
+
+class ReadyWaiter:
+    """单个步骤的就绪等待
+
+    需要在触发导航的操作（goto / click）之前创建：配置了 response 条件时，
+    创建时即开始监听响应，避免操作过程中到达的响应被错过。
+    同步与异步 Page 均可使用，分别调用 wait() / wait_async()；同步版需要在一个线程中
+    同时等待多个页面时，可以轮流调用 poll()。
+
+    Attributes:
+        page: Playwright Page 对象
+        spec: 就绪条件，为 None 时等待 networkidle
+        timeout: 超时时间（毫秒）
+        response_seen: 是否已出现匹配的响应
+    """
+
+    def __init__(self, page, spec: Optional[ReadySpec], default_timeout: int):
+        """初始化并开始监听响应
+
+        Args:
+            page: Playwright Page 对象
+            spec: 就绪条件，为 None 时等待 networkidle
+            default_timeout: 条件未指定 timeout 时的超时时间（秒）
+        """
+        self.page = page
+        self.spec = spec
+        self.timeout = ((spec and spec.timeout) or default_timeout) * 1000
+        self.response_seen = False
+        self.deadline: Optional[float] = None
+
+        if spec and spec.response:
+            page.on("response", self._on_response)
+
+    def _matches_response(self, response) -> bool:
+        """响应 URL 是否匹配 response 条件"""
+        return bool(self.spec and self.spec.response and self.spec.response in response.url)
+
+    def _matches_url(self, url: str) -> bool:
+        """页面 URL 是否匹配 url 条件"""
+        return bool(self.spec and self.spec.url and self.spec.url in url)
+
+    def _on_response(self, response) -> None:
+        """记录匹配的响应"""
+        if self._matches_response(response):
+            self.response_seen = True
+
+    def _stop_listening(self) -> None:
+        """停止监听响应"""
+        if self.spec and self.spec.response:
+            self.page.remove_listener("response", self._on_response)
+
+    def wait(self) -> None:
+        """等待就绪（同步 API），超时抛出 Playwright TimeoutError"""
+        page = self.page
+        if self.spec is None:
+            page.wait_for_load_state("networkidle", timeout=self.timeout)
+            return
+
+        try:
+            if self.spec.response and not self.response_seen:
+                page.wait_for_event(
+                    "response", predicate=self._matches_response, timeout=self.timeout
+                )
+        finally:
+            self._stop_listening()
+        if self.spec.url:
+            page.wait_for_url(self._matches_url, timeout=self.timeout, wait_until="commit")
+        if self.spec.selector:
+            page.locator(self.spec.selector).first.wait_for(state="visible", timeout=self.timeout)
+
+    def _is_ready(self) -> bool:
+        """当前是否已满足就绪条件（同步 API，不等待）"""
+        page = self.page
+        if self.spec is None:
+            try:
+                # 已处于 networkidle 时立即返回
+                page.wait_for_load_state("networkidle", timeout=1)
+                return True
+            except PlaywrightTimeout:
+                return False
+        if self.spec.response and not self.response_seen:
+            return False
+        if self.spec.url and not self._matches_url(page.url):
+            return False
+        if self.spec.selector and not page.locator(self.spec.selector).first.is_visible():
+            return False
+        return True
+
+    def poll(self) -> bool:
+        """检查是否已就绪（同步 API，不等待），超时计时从第一次调用开始
+
+        Returns:
+            是否已就绪
+
+        Raises:
+            PlaywrightTimeout: 超过 timeout 仍未就绪
+        """
+        if self.deadline is None:
+            self.deadline = time.monotonic() + self.timeout / 1000
+        if self._is_ready():
+            self._stop_listening()
+            return True
+        if time.monotonic() >= self.deadline:
+            self._stop_listening()
+            raise PlaywrightTimeout(f"等待页面就绪超时 {self.timeout}ms")
+        return False
+
+    async def wait_async(self) -> None:
+        """等待就绪（异步 API），语义同 wait()"""
+        page = self.page
+        if self.spec is None:
+            await page.wait_for_load_state("networkidle", timeout=self.timeout)
+            return
+
+        try:
+            if self.spec.response and not self.response_seen:
+                await page.wait_for_event(
+                    "response", predicate=self._matches_response, timeout=self.timeout
+                )
+        finally:
+            self._stop_listening()
+        if self.spec.url:
+            await page.wait_for_url(self._matches_url, timeout=self.timeout, wait_until="commit")
+        if self.spec.selector:
+            await page.locator(self.spec.selector).first.wait_for(
+                state="visible", timeout=self.timeout
+            )
@@ -0,0 +1,135 @@
+"""按站点拦截网络请求
+
+登录页与登录后的控制台会加载大量图片、字体与第三方统计脚本，自动登录并不需要它们。
+站点在 sites.yaml 的 block_resources 段配置拦截规则，适配器在 BrowserContext 上
+注册路由，命中规则的请求直接中止。
+
+注意：上下文注册了路由后 Playwright 会禁用 HTTP 缓存，持久化配置（ATHENA_PROFILE_DIR）
+中保留的缓存在启用拦截的站点上不会被使用。
+"""
+import re
+from fnmatch import fnmatch
+
+from core.types import BlockResourcesConfig
+
+# 拦截所有请求的路由模式
+ROUTE_PATTERN = "**/*"
+
+
+def match_url(pattern: str, url: str) -> bool:
+    """URL 是否匹配模式（glob，或以 re: 开头的正则）"""
+    if pattern.startswith("re:"):
+        return re.search(pattern[3:], url) is not None
+    return fnmatch(url, pattern)
+
+
+class ResourceBlocker:
+    """请求拦截器与统计
+
+    同步与异步 BrowserContext 均可使用，分别调用 install() / install_async()。
+
+    Attributes:
+        config: 拦截配置
+        blocked: 各资源类型被拦截的请求数
+        loaded_bytes: 放行请求的响应字节数（按 Content-Length 估算）
+    """
+
+    def __init__(self, config: BlockResourcesConfig):
+        """初始化拦截器
+
+        Args:
+            config: 拦截配置
+        """
+        self.config = config
+        self.blocked: dict[str, int] = {}
+        self.loaded_bytes = 0
+        self._context = None
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        """判断请求是否应被拦截
+
+        Args:
+            resource_type: 请求的资源类型
+            url: 请求 URL
+
+        Returns:
+            是否拦截（allow 优先）
+        """
+        if any(match_url(pattern, url) for pattern in self.config.allow):
+            return False
+        if resource_type in self.config.types:
+            return True
+        return any(match_url(pattern, url) for pattern in self.config.deny)
+
+    def _record_blocked(self, resource_type: str) -> None:
+        """记录被拦截的请求"""
+        self.blocked[resource_type] = self.blocked.get(resource_type, 0) + 1
+
+    def _on_response(self, response) -> None:
+        """累计放行请求的响应大小"""
+        try:
+            self.loaded_bytes += int(response.headers.get("content-length", 0))
+        except ValueError:
+            pass
+
+    def _route(self, route) -> None:
+        """路由处理（同步 API）"""
+        request = route.request
+        if self.should_block(request.resource_type, request.url):
+            self._record_blocked(request.resource_type)
+            route.abort()
+        else:
+            route.continue_()
+
+    async def _route_async(self, route) -> None:
+        """路由处理（异步 API）"""
+        request = route.request
+        if self.should_block(request.resource_type, request.url):
+            self._record_blocked(request.resource_type)
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def install(self, context) -> None:
+        """在 BrowserContext 上注册拦截路由（同步 API）"""
+        self._context = context
+        context.on("response", self._on_response)
+        context.route(ROUTE_PATTERN, self._route)
+
+    async def install_async(self, context) -> None:
+        """在 BrowserContext 上注册拦截路由（异步 API）"""
+        self._context = context
+        context.on("response", self._on_response)
+        await context.route(ROUTE_PATTERN, self._route_async)
+
+    def uninstall(self) -> None:
+        """取消拦截（同步 API），用于失败时完整渲染页面"""
+        if self._context is not None:
+            self._context.remove_listener("response", self._on_response)
+            self._context.unroute(ROUTE_PATTERN, self._route)
+            self._context = None
+
+    async def uninstall_async(self) -> None:
+        """取消拦截（异步 API）"""
+        if self._context is not None:
+            self._context.remove_listener("response", self._on_response)
+            await self._context.unroute(ROUTE_PATTERN, self._route_async)
+            self._context = None
+
+    @property
+    def blocked_total(self) -> int:
+        """被拦截的请求总数"""
+        return sum(self.blocked.values())
+
+    def metrics(self) -> dict[str, float]:
+        """拦截统计，写入 StateManager 的运行指标"""
+        return {"blocked_requests": self.blocked_total, "loaded_bytes": self.loaded_bytes}
+
+    def report(self) -> str:
+        """本次运行的拦截报告"""
+        details = ", ".join(f"{kind} {count}" for kind, count in sorted(self.blocked.items()))
+        return (
+            f"🚫 已拦截 {self.blocked_total} 个请求"
+            + (f"（{details}）" if details else "")
+            + f"，放行响应约 {self.loaded_bytes / 1024:.0f} KB"
+        )
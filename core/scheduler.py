@@ -0,0 +1,96 @@
+"""守护进程调度器"""
+import random
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+from core.types import LoginJob
+from core.state_manager import StateManager
+from core.jobs import job_priority
+
+
+class Scheduler:
+    """按站点刷新间隔调度登录任务
+
+    每个任务按所属站点的 schedule.interval 周期运行，并在间隔上随机延后
+    0 ~ schedule.jitter 秒，避免所有站点同时触发。失败的任务按连续失败次数
+    指数冷却后重试（不超过 interval）。下次运行时间保存在 StateManager 中，
+    守护进程重启后沿用之前的计划。
+
+    Attributes:
+        jobs: 任务键到登录任务的映射
+        state_manager: 状态管理器
+    """
+
+    def __init__(
+        self,
+        jobs: list[LoginJob],
+        state_manager: StateManager,
+        clock: Callable[[], datetime] = datetime.now,
+        rng: Callable[[], float] = random.random,
+    ):
+        """初始化调度器
+
+        Args:
+            jobs: 登录任务列表
+            state_manager: 状态管理器
+            clock: 当前时间函数（测试时可替换）
+            rng: [0, 1) 随机数函数（测试时可替换）
+        """
+        self.jobs = {job.key: job for job in jobs}
+        self.state_manager = state_manager
+        self.clock = clock
+        self.rng = rng
+
+    def next_run(self, key: str, now: Optional[datetime] = None) -> datetime:
+        """获取任务的下次运行时间，从未计划过的任务立即运行（返回 now）"""
+        return self.state_manager.get_next_run(key) or now or self.clock()
+
+    def due_jobs(self, now: Optional[datetime] = None) -> list[LoginJob]:
+        """获取已到期的任务
+
+        Args:
+            now: 当前时间（默认取 clock）
+
+        Returns:
+            到期任务列表，按优先级（健康状况、Cookie 过期时间）排序
+        """
+        now = now or self.clock()
+        due = [job for key, job in self.jobs.items() if self.next_run(key, now) <= now]
+        return sorted(
+            due,
+            key=lambda job: (*job_priority(job, self.state_manager), self.next_run(job.key, now)),
+        )
+
+    def schedule_next(self, key: str, now: Optional[datetime] = None) -> datetime:
+        """任务完成（结果已写入 StateManager）后计划下次运行
+
+        Args:
+            key: 任务键
+            now: 当前时间（默认取 clock）
+
+        Returns:
+            下次运行时间
+        """
+        schedule = self.jobs[key].config.schedule
+        cooldown = self.state_manager.cooldown_seconds(key)
+        if cooldown:
+            delay = min(cooldown, schedule.interval)
+        else:
+            delay = schedule.interval + self.rng() * schedule.jitter
+        next_run = (now or self.clock()) + timedelta(seconds=delay)
+        self.state_manager.set_next_run(key, next_run)
+        return next_run
+
+    def seconds_until_next(self, now: Optional[datetime] = None) -> float:
+        """距离最近一个任务到期的秒数（已到期返回 0）"""
+        if not self.jobs:
+            return float("inf")
+        now = now or self.clock()
+        earliest = min(self.next_run(key, now) for key in self.jobs)
+        return max(0.0, (earliest - now).total_seconds())
+
+    def snapshot(self, now: Optional[datetime] = None) -> list[tuple[str, datetime]]:
+        """所有任务的下次运行时间，按时间先后排序"""
+        now = now or self.clock()
+        runs = [(key, self.next_run(key, now)) for key in self.jobs]
+        return sorted(runs, key=lambda item: item[1])
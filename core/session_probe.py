@@ -0,0 +1,55 @@
+"""不启动浏览器检查 GitHub Session Cookie 是否有效
+
+login_only.py 在导入 Playwright 之前先用一次 HTTP 请求访问需要登录的页面：
+返回 200 说明会话有效，重定向到 /login 说明已失效。常见情况（GH_SESSION 仍有效）
+从一次约 10 秒的浏览器运行变为一次亚秒级的 HTTP 请求。
+"""
+import logging
+from typing import Optional
+
+import requests
+from requests.exceptions import RequestException
+
+from core.constants import Timeouts, GitHubUrls, CookieConfig, BrowserConfig
+
+logger = logging.getLogger(__name__)
+
+# 复用连接池
+_session = requests.Session()
+_session.headers["User-Agent"] = BrowserConfig.USER_AGENT
+
+
+def probe_github_session(
+    session_cookie: str, timeout: float = Timeouts.SESSION_PROBE
+) -> Optional[bool]:
+    """检查 Session Cookie 是否仍处于登录状态
+
+    Args:
+        session_cookie: user_session 的值
+        timeout: 请求超时（秒）
+
+    Returns:
+        True 表示有效，False 表示已失效，无法判断（网络错误、意外的状态码）时返回 None
+    """
+    cookies = {
+        CookieConfig.SESSION_COOKIE_NAME: session_cookie,
+        CookieConfig.LOGGED_IN_COOKIE_NAME: CookieConfig.LOGGED_IN_VALUE,
+    }
+    try:
+        response = _session.get(
+            GitHubUrls.SESSION_PROBE,
+            cookies=cookies,
+            allow_redirects=False,
+            timeout=timeout,
+        )
+    except RequestException as e:
+        logger.warning(f"Session Cookie 检查请求失败: {e}")
+        return None
+
+    if response.status_code == 200:
+        return True
+    if response.is_redirect and "/login" in response.headers.get("Location", ""):
+        return False
+
+    logger.warning(f"Session Cookie 检查返回意外的状态码: {response.status_code}")
+    return None
@@ -0,0 +1,197 @@
+"""多进程分片运行器"""
+import time
+import logging
+import multiprocessing
+from queue import Empty
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from core.types import LoginJob, SiteResult, NotifierInterface
+from core.state_manager import StateManager
+
+logger = logging.getLogger(__name__)
+
+
+class ShardedRunner:
+    """分片运行器
+
+    将登录任务（账号 × 站点）切分到多个进程，每个进程拥有独立的浏览器，
+    并以有限数量的 BrowserContext 并发执行。结果通过队列实时回传父进程，
+    由父进程统一写入 StateManager 并统计吞吐量。
+
+    Attributes:
+        jobs: 登录任务列表
+        notifier: 通知器实例（需可序列化，以传入子进程）
+        shards: 进程数
+        contexts_per_shard: 每个进程的最大并发 BrowserContext 数
+        state_manager: 状态管理器
+    """
+
+    def __init__(
+        self,
+        jobs: list[LoginJob],
+        notifier: NotifierInterface,
+        shards: int,
+        contexts_per_shard: int,
+        state_manager: Optional[StateManager] = None,
+        share_github_session: bool = True,
+    ):
+        """初始化分片运行器
+
+        Args:
+            jobs: 登录任务列表
+            notifier: 通知器实例
+            shards: 进程数
+            contexts_per_shard: 每个进程的最大并发 BrowserContext 数
+            state_manager: 状态管理器（为空时不记录状态）
+            share_github_session: 是否按账号复用 GitHub 会话（同一账号的任务分到同一进程）
+        """
+        self.jobs = jobs
+        self.notifier = notifier
+        self.shards = max(1, shards)
+        self.contexts_per_shard = max(1, contexts_per_shard)
+        self.state_manager = state_manager
+        self.share_github_session = share_github_session
+
+    def run(self) -> list[SiteResult]:
+        """运行所有任务
+
+        Returns:
+            按任务顺序排列的结果列表
+        """
+        shards = split_into_shards(self.jobs, self.shards, self.share_github_session)
+        if not shards:
+            return []
+
+        workers = f"{len(shards)} 个进程 × {self.contexts_per_shard} 个并发上下文"
+        print(f"🚀 分片运行 {len(self.jobs)} 个任务: {workers}")
+
+        results: dict[str, SiteResult] = {}
+        start = time.monotonic()
+
+        with multiprocessing.Manager() as manager:
+            queue = manager.Queue()
+            with ProcessPoolExecutor(max_workers=len(shards)) as pool:
+                futures = [
+                    pool.submit(
+                        _run_shard,
+                        shard,
+                        self.notifier,
+                        self.contexts_per_shard,
+                        queue,
+                        self.share_github_session,
+                    )
+                    for shard in shards
+                ]
+
+                while len(results) < len(self.jobs):
+                    try:
+                        result = queue.get(timeout=1)
+                    except Empty:
+                        if all(f.done() for f in futures):
+                            break
+                        continue
+
+                    results[result.key] = result
+                    self._merge_result(result)
+                    print(
+                        f"{'✅' if result.success else '❌'} [{len(results)}/{len(self.jobs)}] "
+                        f"{result.key} ({result.duration:.1f}s) | "
+                        f"{format_throughput(results.values(), time.monotonic() - start)}"
+                    )
+
+                for future in futures:
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.error(f"分片进程异常退出: {e}")
+
+        elapsed = time.monotonic() - start
+        ordered = []
+        for job in self.jobs:
+            result = results.get(job.key)
+            if result is None:
+                result = SiteResult(
+                    site=job.site, account=job.account, success=False, error="分片进程异常退出"
+                )
+                self._merge_result(result)
+            ordered.append(result)
+
+        print(f"📈 吞吐量: {format_throughput(ordered, elapsed)}（总耗时 {elapsed:.1f}s）")
+        return ordered
+
+    def _merge_result(self, result: SiteResult) -> None:
+        """将结果写入状态管理器"""
+        if self.state_manager:
+            self.state_manager.record_result(result)
+
+
+def split_into_shards(
+    jobs: list[LoginJob], shards: int, group_by_account: bool = False
+) -> list[list[LoginJob]]:
+    """将任务分配到各分片
+
+    默认轮询分配，同一站点的任务会被分散到不同进程；
+    按账号分组时同一账号的任务留在同一进程，以便复用该账号的 GitHub 会话，
+    各账号依次分配给当前任务最少的分片。
+
+    Args:
+        jobs: 登录任务列表
+        shards: 分片数
+        group_by_account: 是否按账号分组
+
+    Returns:
+        非空分片列表
+    """
+    buckets: list[list[LoginJob]] = [[] for _ in range(max(1, shards))]
+
+    if group_by_account:
+        groups: dict[tuple[str, str], list[LoginJob]] = {}
+        for job in jobs:
+            groups.setdefault((job.account, job.credentials.username), []).append(job)
+        for group in sorted(groups.values(), key=len, reverse=True):
+            min(buckets, key=len).extend(group)
+    else:
+        for i, job in enumerate(jobs):
+            buckets[i % len(buckets)].append(job)
+
+    return [bucket for bucket in buckets if bucket]
+
+
+def format_throughput(results, elapsed: float) -> str:
+    """格式化吞吐量（每分钟登录数）
+
+    Args:
+        results: 已完成的结果
+        elapsed: 已用时间（秒）
+
+    Returns:
+        吞吐量文本
+    """
+    results = list(results)
+    minutes = max(elapsed, 1e-6) / 60
+    succeeded = sum(1 for r in results if r.success)
+    return f"{len(results) / minutes:.1f} 任务/分钟，{succeeded / minutes:.1f} 成功登录/分钟"
+
+
+def _run_shard(
+    jobs: list[LoginJob],
+    notifier: NotifierInterface,
+    concurrency: int,
+    queue,
+    share_github_session: bool,
+) -> None:
+    """子进程入口：用独立浏览器运行一个分片，并把每个结果放入队列
+
+    各分片总是本地启动自己的浏览器：连接常驻浏览器服务会让所有分片共用一个 Chromium。
+    """
+    from core.batch_runner import BatchRunner
+
+    BatchRunner(
+        jobs,
+        notifier,
+        concurrency,
+        on_result=queue.put,
+        share_github_session=share_github_session,
+        launch_local=True,
+    ).run()
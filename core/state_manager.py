@@ -1,10 +1,13 @@
 """状态持久化管理"""
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, Dict, Any
 import logging
 
+from core.types import SiteResult
+from core.constants import HealthConfig
+
 logger = logging.getLogger(__name__)
 
 
@@ -46,6 +49,10 @@ class StateManager:
         error_message: str = "",
         two_factor_used: bool = False,
         device_verification_used: bool = False,
+        cookies_saved: bool = False,
+        cookies_expire_at: Optional[float] = None,
+        metrics: Optional[Dict[str, float]] = None,
+        persistent_profile: bool = False,
     ) -> None:
         """记录登录尝试
 
@@ -55,16 +62,12 @@ class StateManager:
             error_message: 错误消息（如果失败）
             two_factor_used: 是否使用了双因素认证
             device_verification_used: 是否使用了设备验证
+            cookies_saved: 是否提取并保存了 Cookie
+            cookies_expire_at: 已保存 Cookie 中最早的过期时间（Unix 时间戳，会话 Cookie 为空）
+            metrics: 本次运行的指标（如设备验证节省的字节数），累加到站点状态中
+            persistent_profile: 是否使用了持久化浏览器配置，设备验证频率按此分别统计
         """
-        if site not in self.state:
-            self.state[site] = {
-                "total_attempts": 0,
-                "total_successes": 0,
-                "total_failures": 0,
-                "consecutive_failures": 0,
-            }
-
-        site_state = self.state[site]
+        site_state = self._site_entry(site)
 
         # 更新统计
         site_state["total_attempts"] += 1
@@ -77,13 +80,88 @@ class StateManager:
             site_state["last_success_time"] = datetime.now().isoformat()
             site_state["two_factor_used"] = two_factor_used
             site_state["device_verification_used"] = device_verification_used
+            if cookies_saved:
+                site_state["last_cookie_saved_time"] = site_state["last_success_time"]
+                site_state["cookie_expires_time"] = (
+                    datetime.fromtimestamp(cookies_expire_at).isoformat()
+                    if cookies_expire_at
+                    else None
+                )
         else:
             site_state["total_failures"] += 1
             site_state["consecutive_failures"] = site_state.get("consecutive_failures", 0) + 1
             site_state["last_error"] = error_message
 
+        if metrics:
+            totals = site_state.setdefault("metrics", {})
+            for name, value in metrics.items():
+                totals[name] = totals.get(name, 0) + value
+
+            logins = metrics.get("github_password_logins", 0)
+            if logins:
+                mode = "persistent" if persistent_profile else "ephemeral"
+                counts = site_state.setdefault("device_verification", {}).setdefault(
+                    mode, {"logins": 0, "verifications": 0}
+                )
+                counts["logins"] += logins
+                counts["verifications"] += metrics.get("device_verifications", 0)
+
         self.save()
 
+    def record_result(self, result: SiteResult) -> None:
+        """记录批量运行中单个任务的结果
+
+        Args:
+            result: 任务结果
+        """
+        self.record_login_attempt(
+            result.key,
+            result.success,
+            error_message=result.error,
+            cookies_saved=result.cookies_saved,
+            cookies_expire_at=result.cookies_expire_at,
+            metrics=result.metrics,
+            persistent_profile=result.persistent_profile,
+        )
+
+    def _site_entry(self, site: str) -> Dict[str, Any]:
+        """获取站点状态，不存在时初始化"""
+        if site not in self.state:
+            self.state[site] = {
+                "total_attempts": 0,
+                "total_successes": 0,
+                "total_failures": 0,
+                "consecutive_failures": 0,
+            }
+        return self.state[site]
+
+    def set_next_run(self, site: str, next_run: datetime) -> None:
+        """记录站点的下次计划运行时间
+
+        Args:
+            site: 站点名称
+            next_run: 下次运行时间
+        """
+        self._site_entry(site)["next_run_time"] = next_run.isoformat()
+        self.save()
+
+    def get_next_run(self, site: str) -> Optional[datetime]:
+        """获取站点的下次计划运行时间
+
+        Args:
+            site: 站点名称
+
+        Returns:
+            下次运行时间，未计划时返回 None
+        """
+        site_state = self.get_site_state(site)
+        if not site_state or not site_state.get("next_run_time"):
+            return None
+        try:
+            return datetime.fromisoformat(site_state["next_run_time"])
+        except ValueError:
+            return None
+
     def get_site_state(self, site: str) -> Optional[Dict[str, Any]]:
         """获取站点状态
 
@@ -95,7 +173,9 @@ class StateManager:
         """
         return self.state.get(site)
 
-    def is_healthy(self, site: str, max_consecutive_failures: int = 3) -> bool:
+    def is_healthy(
+        self, site: str, max_consecutive_failures: int = HealthConfig.MAX_CONSECUTIVE_FAILURES
+    ) -> bool:
         """检查站点是否健康
 
         Args:
@@ -112,6 +192,113 @@ class StateManager:
         consecutive_failures = site_state.get("consecutive_failures", 0)
         return consecutive_failures < max_consecutive_failures
 
+    def get_cookie_expiry(self, site: str) -> Optional[datetime]:
+        """获取站点已保存 Cookie 的过期时间
+
+        Args:
+            site: 站点名称
+
+        Returns:
+            过期时间，未保存过 Cookie 或为会话 Cookie 时返回 None
+        """
+        site_state = self.get_site_state(site) or {}
+        try:
+            return datetime.fromisoformat(site_state["cookie_expires_time"])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def cooldown_seconds(self, site: str) -> float:
+        """按连续失败次数计算的冷却时间（指数增长）
+
+        第 n 次连续失败后冷却 COOLDOWN_BASE × 2^(n-1) 秒，不超过 COOLDOWN_MAX。
+
+        Args:
+            site: 站点名称
+
+        Returns:
+            冷却秒数，没有连续失败时为 0
+        """
+        failures = (self.get_site_state(site) or {}).get("consecutive_failures", 0)
+        if failures <= 0:
+            return 0
+        return min(HealthConfig.COOLDOWN_BASE * 2 ** (failures - 1), HealthConfig.COOLDOWN_MAX)
+
+    def cooldown_until(self, site: str) -> Optional[datetime]:
+        """不健康站点的冷却结束时间
+
+        Args:
+            site: 站点名称
+
+        Returns:
+            冷却结束时间，健康站点返回 None
+        """
+        site_state = self.get_site_state(site) or {}
+        if self.is_healthy(site) or not site_state.get("last_attempt_time"):
+            return None
+        try:
+            last_attempt = datetime.fromisoformat(site_state["last_attempt_time"])
+        except ValueError:
+            return None
+        return last_attempt + timedelta(seconds=self.cooldown_seconds(site))
+
+    def is_fresh(self, site: str, ttl: int, now: Optional[datetime] = None) -> bool:
+        """检查站点的登录状态是否仍然新鲜
+
+        最近一次尝试成功，且最后成功时间与 Cookie 保存时间都在 ttl 秒以内时视为新鲜，
+        此时无需再次运行登录流程。
+
+        Args:
+            site: 站点名称
+            ttl: 新鲜期（秒），0 表示不跳过
+            now: 当前时间（默认取当前时间）
+
+        Returns:
+            是否新鲜
+        """
+        site_state = self.get_site_state(site)
+        if ttl <= 0 or not site_state or not site_state.get("last_attempt_success"):
+            return False
+
+        now = now or datetime.now()
+        for field in ("last_success_time", "last_cookie_saved_time"):
+            try:
+                timestamp = datetime.fromisoformat(site_state[field])
+            except (KeyError, TypeError, ValueError):
+                return False
+            if (now - timestamp).total_seconds() >= ttl:
+                return False
+        return True
+
+    def device_verification_rate(self, site: str, persistent_profile: bool) -> Optional[float]:
+        """GitHub 密码登录中触发设备验证的比例
+
+        Args:
+            site: 站点名称
+            persistent_profile: 统计持久化配置（True）还是空白上下文（False）的登录
+
+        Returns:
+            设备验证次数 / 密码登录次数，没有登录记录时返回 None
+        """
+        mode = "persistent" if persistent_profile else "ephemeral"
+        counts = (self.get_site_state(site) or {}).get("device_verification", {}).get(mode)
+        if not counts or not counts["logins"]:
+            return None
+        return counts["verifications"] / counts["logins"]
+
+    def storage_state_hit_rate(self, site: str) -> Optional[float]:
+        """storage_state 缓存命中率（恢复缓存后首次导航即已登录的比例）
+
+        Args:
+            site: 站点名称
+
+        Returns:
+            命中次数 / (命中 + 未命中)，没有记录时返回 None
+        """
+        totals = (self.get_site_state(site) or {}).get("metrics", {})
+        hits = totals.get("storage_state_hits", 0)
+        lookups = hits + totals.get("storage_state_misses", 0)
+        return hits / lookups if lookups else None
+
     def get_stats(self, site: str) -> str:
         """获取站点统计信息文本
 
@@ -133,10 +320,20 @@ class StateManager:
         last_success = site_state.get("last_success_time", "N/A")
         consecutive_failures = site_state.get("consecutive_failures", 0)
 
-        return f"""📊 {site} 统计信息：
+        stats = f"""📊 {site} 统计信息：
 总尝试次数: {total}
 成功次数: {successes}
 失败次数: {failures}
 成功率: {success_rate:.1f}%
 连续失败: {consecutive_failures}
 最后成功: {last_success}"""
+
+        for persistent, label in ((False, "空白上下文"), (True, "持久化配置")):
+            rate = self.device_verification_rate(site, persistent)
+            if rate is not None:
+                stats += f"\n设备验证频率（{label}）: {rate * 100:.1f}%"
+
+        hit_rate = self.storage_state_hit_rate(site)
+        if hit_rate is not None:
+            stats += f"\nstorage_state 缓存命中率: {hit_rate * 100:.1f}%"
+        return stats
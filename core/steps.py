@@ -0,0 +1,133 @@
+"""同步版与异步版共用的步骤生成器
+
+登录、OAuth 与站点流程写成生成器，每个 Playwright / 通知调用都用 yield 交给驱动函数，
+驱动函数再把结果送回生成器：
+
+- 同步 API 的调用在 yield 之前已经完成，run_steps 把结果原样送回；
+- 异步 API 的调用返回协程，run_steps_async 等待后送回，出错时把异常抛回生成器，
+  由流程自身的 try/except 处理。
+
+这样流程只写一份（在 *Base 类中），同步版与异步版只通过 SyncStepIO / AsyncStepIO
+提供各自的 I/O 实现（等待、就绪条件、线程、定位器）。
+"""
+import asyncio
+import inspect
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Generator, Optional, TypeVar
+
+from core.pacing import Pacer
+from core.readiness import ReadyWaiter
+from core.locators import first_visible, first_visible_async, wait_visible, wait_visible_async
+
+T = TypeVar("T")
+
+# yield 出 I/O 调用（或其协程），接收调用结果，最终返回 T
+Steps = Generator[Any, Any, T]
+
+
+def run_steps(steps: Steps[T]) -> T:
+    """驱动步骤生成器（同步版）：yield 出的已经是调用结果，原样送回"""
+    try:
+        result = next(steps)
+        while True:
+            result = steps.send(result)
+    except StopIteration as stop:
+        value: T = stop.value
+        return value
+
+
+async def run_steps_async(steps: Steps[T]) -> T:
+    """驱动步骤生成器（异步版）：等待 yield 出的协程并送回结果，出错时把异常抛回生成器"""
+    result: Any = None
+    error: Optional[BaseException] = None
+    while True:
+        try:
+            pending = steps.throw(error) if error is not None else steps.send(result)
+        except StopIteration as stop:
+            value: T = stop.value
+            return value
+        error = None
+        try:
+            result = await pending if inspect.isawaitable(pending) else pending
+        except BaseException as e:  # pylint: disable=broad-exception-caught
+            result, error = None, e
+
+
+class StepIO(ABC):
+    """步骤生成器用到的 I/O，由 SyncStepIO / AsyncStepIO 实现
+
+    这些方法在同步版中直接执行并返回结果，在异步版中返回协程，流程中一律 yield 其返回值。
+
+    Attributes:
+        pacer: 步骤间等待策略
+    """
+
+    pacer: Pacer
+
+    @abstractmethod
+    def _run(self, steps: Steps[T]) -> Any:
+        """驱动步骤生成器：同步版返回结果，异步版返回协程"""
+
+    @abstractmethod
+    def _pause(self, seconds: float, ready: Optional[Callable[[], Any]] = None) -> Any:
+        """步骤间等待（Pacer.pause / Pacer.pause_async）"""
+
+    @abstractmethod
+    def _wait_ready(self, waiter: ReadyWaiter) -> Any:
+        """等待就绪条件（ReadyWaiter.wait / ReadyWaiter.wait_async）"""
+
+    @abstractmethod
+    def _in_thread(self, func: Callable[..., Any], *args: Any) -> Any:
+        """执行阻塞调用（通知、Cookie 保存、文件读写），异步版放到线程中"""
+
+    @abstractmethod
+    def _wait_visible(self, page, selectors: list[str], timeout: int) -> Any:
+        """等待任一候选选择器可见（core.locators.wait_visible）"""
+
+    @abstractmethod
+    def _first_visible(self, page, selectors: list[str], timeout: int) -> Any:
+        """等待任一候选选择器可见并返回命中的选择器（core.locators.first_visible）"""
+
+
+class SyncStepIO(StepIO):
+    """基于 playwright.sync_api 的 I/O"""
+
+    def _run(self, steps: Steps[T]) -> T:
+        return run_steps(steps)
+
+    def _pause(self, seconds: float, ready: Optional[Callable[[], Any]] = None) -> None:
+        self.pacer.pause(seconds, ready)
+
+    def _wait_ready(self, waiter: ReadyWaiter) -> None:
+        waiter.wait()
+
+    def _in_thread(self, func: Callable[..., Any], *args: Any) -> Any:
+        return func(*args)
+
+    def _wait_visible(self, page, selectors: list[str], timeout: int) -> Any:
+        return wait_visible(page, selectors, timeout)
+
+    def _first_visible(self, page, selectors: list[str], timeout: int) -> Any:
+        return first_visible(page, selectors, timeout)
+
+
+class AsyncStepIO(StepIO):
+    """基于 playwright.async_api 的 I/O，阻塞调用放到线程中，避免阻塞事件循环"""
+
+    def _run(self, steps: Steps[T]) -> Awaitable[T]:
+        return run_steps_async(steps)
+
+    def _pause(self, seconds: float, ready: Optional[Callable[[], Any]] = None) -> Any:
+        return self.pacer.pause_async(seconds, ready)
+
+    def _wait_ready(self, waiter: ReadyWaiter) -> Any:
+        return waiter.wait_async()
+
+    def _in_thread(self, func: Callable[..., Any], *args: Any) -> Any:
+        return asyncio.to_thread(func, *args)
+
+    def _wait_visible(self, page, selectors: list[str], timeout: int) -> Any:
+        return wait_visible_async(page, selectors, timeout)
+
+    def _first_visible(self, page, selectors: list[str], timeout: int) -> Any:
+        return first_visible_async(page, selectors, timeout)
@@ -0,0 +1,168 @@
+"""站点 storage_state 磁盘缓存
+
+运行之间默认只保留 GitHub 的 user_session，站点自身的会话仍然有效时也要重新走一遍
+OAuth。成功登录后把上下文的 storage_state（Cookie 与 localStorage）按站点 × 账号
+写入缓存，下次运行开始时恢复，首次导航即可判定为已登录。
+
+缓存只保存站点自身的状态：github.com 的 Cookie 与 localStorage 在写入前去掉，
+GitHub 会话仍由 GH_SESSION / 预登录管理。缓存文件先写入同目录的临时文件再原子替换，
+权限为 600。设置 ATHENA_STORAGE_KEY 时默认启用并加密：由口令经 argon2id 与每个文件
+随机生成的盐派生密钥（pynacl SecretBox），盐保存在文件开头。
+"""
+import os
+import re
+import json
+import logging
+import tempfile
+from typing import Optional
+
+from core.constants import StorageStateConfig
+
+logger = logging.getLogger(__name__)
+
+# 不写入缓存的域名（GitHub 会话单独管理）
+EXCLUDED_DOMAIN = "github.com"
+
+
+def storage_dir() -> str:
+    """缓存目录（环境变量 ATHENA_STORAGE_DIR，默认 .athena_storage）"""
+    return os.environ.get("ATHENA_STORAGE_DIR") or StorageStateConfig.DIR
+
+
+def cache_enabled(setting: Optional[bool]) -> bool:
+    """站点是否启用 storage_state 缓存
+
+    Args:
+        setting: 站点的 storage_state_cache 配置，未配置时为 None
+
+    Returns:
+        未配置时仅在设置了 ATHENA_STORAGE_KEY 时启用；显式启用但没有口令时照常启用并警告
+    """
+    has_key = bool(os.environ.get(StorageStateConfig.KEY_ENV))
+    if setting is None:
+        return has_key
+    if setting and not has_key:
+        print(
+            f"⚠️ 警告: 未设置 {StorageStateConfig.KEY_ENV}，站点会话将以明文缓存到 "
+            f"{storage_dir()}/，请确认该目录不会被上传或共享"
+        )
+    return setting
+
+
+def site_state(state: dict) -> dict:
+    """去掉 storage_state 中 github.com 的 Cookie 与 localStorage"""
+    return {
+        "cookies": [
+            cookie
+            for cookie in state.get("cookies", [])
+            if EXCLUDED_DOMAIN not in cookie.get("domain", "")
+        ],
+        "origins": [
+            origin
+            for origin in state.get("origins", [])
+            if EXCLUDED_DOMAIN not in origin.get("origin", "")
+        ],
+    }
+
+
+class StorageStateCache:
+    """单个站点 × 账号的 storage_state 缓存
+
+    Attributes:
+        path: 缓存文件路径
+        secret: 加密口令，为空时明文保存
+    """
+
+    def __init__(self, key: str, directory: Optional[str] = None, secret: Optional[str] = None):
+        """初始化
+
+        Args:
+            key: 缓存键（站点与账号），特殊字符替换为下划线
+            directory: 缓存目录（默认 storage_dir()）
+            secret: 加密口令（默认读取环境变量 ATHENA_STORAGE_KEY）
+        """
+        self.secret = secret if secret is not None else os.environ.get(StorageStateConfig.KEY_ENV)
+        safe_key = re.sub(r"[^A-Za-z0-9_.-]", "_", key)
+        suffix = ".json.enc" if self.secret else ".json"
+        self.path = os.path.join(directory or storage_dir(), safe_key + suffix)
+
+    @staticmethod
+    def _derive_key(secret: str, salt: bytes) -> bytes:
+        """由口令与盐经 argon2id 派生 SecretBox 密钥"""
+        from nacl.pwhash import argon2id
+        from nacl.secret import SecretBox
+
+        key: bytes = argon2id.kdf(
+            SecretBox.KEY_SIZE,
+            secret.encode("utf-8"),
+            salt,
+            opslimit=argon2id.OPSLIMIT_INTERACTIVE,
+            memlimit=argon2id.MEMLIMIT_INTERACTIVE,
+        )
+        return key
+
+    @classmethod
+    def _encrypt(cls, data: bytes, secret: str) -> bytes:
+        """加密，输出为 盐 + 密文"""
+        from nacl.pwhash import argon2id
+        from nacl.secret import SecretBox
+
+        salt = os.urandom(argon2id.SALTBYTES)
+        return salt + bytes(SecretBox(cls._derive_key(secret, salt)).encrypt(data))
+
+    @classmethod
+    def _decrypt(cls, data: bytes, secret: str) -> bytes:
+        """解密 _encrypt() 的输出"""
+        from nacl.pwhash import argon2id
+        from nacl.secret import SecretBox
+
+        salt, ciphertext = data[: argon2id.SALTBYTES], data[argon2id.SALTBYTES :]
+        return bytes(SecretBox(cls._derive_key(secret, salt)).decrypt(ciphertext))
+
+    def load(self) -> Optional[dict]:
+        """读取缓存
+
+        Returns:
+            storage_state，缓存不存在或无法读取（损坏、口令不匹配、缺少 pynacl）时返回 None
+        """
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"读取 storage_state 缓存失败: {e}")
+            return None
+
+        try:
+            if self.secret:
+                data = self._decrypt(data, self.secret)
+            state: dict = json.loads(data.decode("utf-8"))
+            return state
+        except Exception as e:
+            logger.warning(f"storage_state 缓存无法解析，忽略: {self.path}（{e}）")
+            return None
+
+    def save(self, state: dict) -> None:
+        """去掉 GitHub 的状态后原子写入缓存
+
+        Args:
+            state: BrowserContext.storage_state() 的返回值
+        """
+        data = json.dumps(site_state(state), ensure_ascii=False).encode("utf-8")
+        if self.secret:
+            data = self._encrypt(data, self.secret)
+
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            # mkstemp 创建的文件权限为 600
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
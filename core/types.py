@@ -3,6 +3,8 @@ from dataclasses import dataclass, field
 from typing import Optional, Protocol, Literal
 from abc import ABC, abstractmethod
 
+from core.constants import BrowserConfig
+
 
 @dataclass
 class GitHubCredentials:
@@ -38,6 +40,14 @@ class TimeoutConfig:
     network_idle: int = 15
 
 
+@dataclass
+class ScheduleConfig:
+    """守护进程调度配置（秒）"""
+
+    interval: int = 432000
+    jitter: int = 0
+
+
 @dataclass
 class CookieTarget:
     """Cookie 存储目标"""
@@ -48,12 +58,80 @@ class CookieTarget:
     encrypt: bool = False
 
 
+@dataclass
+class ReadySpec:
+    """页面就绪条件，代替 networkidle 等待
+
+    配置多项时需全部满足；均未配置时等同于未设置。
+
+    Attributes:
+        selector: 可见即就绪的元素选择器
+        url: 当前 URL 包含该字符串即就绪
+        response: 出现 URL 包含该字符串的响应即就绪
+        timeout: 每项条件的超时时间（秒），默认取 timeouts.network_idle
+    """
+
+    selector: Optional[str] = None
+    url: Optional[str] = None
+    response: Optional[str] = None
+    timeout: Optional[int] = None
+
+
+@dataclass
+class BlockResourcesConfig:
+    """请求拦截配置
+
+    Attributes:
+        types: 拦截的资源类型（image / font / media 等 Playwright resource_type）
+        deny: 额外拦截的 URL 模式（glob，或以 re: 开头的正则）
+        allow: 始终放行的 URL 模式，优先于 types 与 deny
+        render_on_failure: 登录失败时取消拦截并重新加载页面，截取完整渲染的诊断截图
+    """
+
+    types: list[str] = field(default_factory=list)
+    deny: list[str] = field(default_factory=list)
+    allow: list[str] = field(default_factory=list)
+    render_on_failure: bool = True
+
+
+@dataclass
+class HttpOAuthConfig:
+    """不启动浏览器的 OAuth 重定向链配置
+
+    Attributes:
+        start_url: 站点发起 GitHub OAuth 的地址（OAuth 按钮指向的 URL，响应 302 到 GitHub 授权页）
+        max_redirects: 最多跟随的重定向次数
+    """
+
+    start_url: str
+    max_redirects: int = 10
+
+
 @dataclass
 class KeepAliveURL:
-    """保活 URL"""
+    """保活 URL
+
+    mode 为 page 时在页面中导航并等待就绪；为 http 时通过 BrowserContext 的请求客户端
+    （与浏览器共享 Cookie）发送 GET，只检查状态码，不渲染页面。
+    """
 
     url: str
     name: str
+    ready: Optional[ReadySpec] = None
+    mode: Literal["page", "http"] = "page"
+
+
+@dataclass
+class KeepAliveResult:
+    """单个保活 URL 的访问结果"""
+
+    name: str
+    url: str
+    mode: str
+    success: bool
+    duration: float
+    bytes: Optional[int] = None  # 响应体大小，page 模式不统计
+    error: str = ""
 
 
 @dataclass
@@ -69,9 +147,67 @@ class SiteConfig:
     device_verification: DeviceVerificationConfig
     timeouts: TimeoutConfig
     keepalive_urls: list[KeepAliveURL] = field(default_factory=list)
+    # mode: page 的保活 URL 同时使用的标签页数
+    keepalive_parallelism: int = BrowserConfig.KEEPALIVE_PARALLELISM
     cookie_domain: str = "github.com"
     cookie_names: list[str] = field(default_factory=lambda: ["user_session"])
     cookie_targets: list[CookieTarget] = field(default_factory=list)
+    schedule: ScheduleConfig = field(default_factory=ScheduleConfig)
+    min_refresh_interval: int = 0
+    # 步骤名称（login_page / oauth_redirect / authorize / keepalive）到就绪条件的映射，
+    # 未配置的步骤等待 networkidle
+    ready: dict[str, ReadySpec] = field(default_factory=dict)
+    block_resources: Optional[BlockResourcesConfig] = None
+    # 配置后先用 HTTP 请求跟随 OAuth 重定向链，失败时回退浏览器流程
+    http_oauth: Optional[HttpOAuthConfig] = None
+    # 成功登录后缓存站点的 storage_state，下次运行开始时恢复；
+    # 未配置时仅在设置了 ATHENA_STORAGE_KEY（加密缓存）时启用
+    storage_state_cache: Optional[bool] = None
+
+
+@dataclass
+class AccountConfig:
+    """凭据文件中的单个 GitHub 账号"""
+
+    name: str
+    credentials: GitHubCredentials
+    cookie_targets: list[CookieTarget] = field(default_factory=list)
+    sites: Optional[list[str]] = None
+
+
+@dataclass
+class LoginJob:
+    """一次登录任务（账号 × 站点）"""
+
+    site: str
+    config: SiteConfig
+    credentials: GitHubCredentials
+    account: str = ""
+
+    @property
+    def key(self) -> str:
+        """状态记录使用的键，单账号时与站点名相同"""
+        return f"{self.account}:{self.site}" if self.account else self.site
+
+
+@dataclass
+class SiteResult:
+    """单个站点的运行结果"""
+
+    site: str
+    success: bool
+    duration: float = 0.0
+    error: str = ""
+    account: str = ""
+    cookies_saved: bool = False
+    cookies_expire_at: Optional[float] = None
+    metrics: dict[str, float] = field(default_factory=dict)
+    persistent_profile: bool = False
+
+    @property
+    def key(self) -> str:
+        """状态记录使用的键，与 LoginJob.key 一致"""
+        return f"{self.account}:{self.site}" if self.account else self.site
 
 
 class NotifierInterface(ABC):
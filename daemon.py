@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""常驻调度守护进程
+
+只加载一次站点配置并保持浏览器常驻，按各站点的 schedule 配置周期刷新登录，
+避免每次刷新都重新启动解释器、Playwright 与 Chromium。
+"""
+import os
+import sys
+import signal
+import asyncio
+import argparse
+import logging
+from datetime import datetime
+from typing import Optional
+
+from core.types import LoginJob, NotifierInterface
+from core.constants import BrowserConfig
+from core.launch_profiles import PROFILES
+from core.config_loader import load_enabled_sites
+from core.credentials import load_env_credentials, load_accounts
+from core.jobs import build_jobs, build_account_jobs
+from core.scheduler import Scheduler
+from core.state_manager import StateManager
+from utils.table import format_table
+
+logger = logging.getLogger(__name__)
+
+# 空闲时最长休眠时间（秒），到期后重新检查计划，也用于出错后的重试间隔
+MAX_IDLE_SLEEP = 60
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """解析命令行参数"""
+    parser = argparse.ArgumentParser(
+        description="常驻调度守护进程：按站点刷新间隔自动登录",
+        epilog="示例: python daemon.py | python daemon.py --status",
+    )
+    parser.add_argument("--status", action="store_true", help="显示各任务的下次运行时间后退出")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=BrowserConfig.BATCH_CONCURRENCY,
+        help=f"同时运行的到期任务数（默认 {BrowserConfig.BATCH_CONCURRENCY}）",
+    )
+    parser.add_argument(
+        "--no-shared-session",
+        action="store_true",
+        help="每个站点各自登录 GitHub（默认每个账号只登录一次，会话复用于所有站点）",
+    )
+    parser.add_argument(
+        "--credentials",
+        default=os.environ.get("GH_CREDENTIALS_FILE"),
+        help="多账号凭据文件（如 config/credentials.yaml），也可通过 GH_CREDENTIALS_FILE 设置",
+    )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="快速模式：用就绪条件（URL 变化、元素可见）代替步骤间的固定 sleep，也可通过 ATHENA_FAST=1 设置",
+    )
+    parser.add_argument(
+        "--launch-profile",
+        choices=list(PROFILES),
+        default=os.environ.get("ATHENA_LAUNCH_PROFILE"),
+        help="浏览器启动配置（默认 default），也可通过 ATHENA_LAUNCH_PROFILE 设置",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        default=os.environ.get("ATHENA_PROFILE_DIR"),
+        help="持久化浏览器配置的根目录（每个 GitHub 账号一个子目录，减少设备验证），"
+        "也可通过 ATHENA_PROFILE_DIR 设置",
+    )
+    return parser.parse_args(argv)
+
+
+def load_jobs(credentials_file: Optional[str]) -> list[LoginJob]:
+    """加载所有启用站点的登录任务
+
+    Args:
+        credentials_file: 多账号凭据文件，为空时使用环境变量中的单个账号
+
+    Returns:
+        登录任务列表
+    """
+    sites = load_enabled_sites()
+    if credentials_file:
+        return build_account_jobs(sites, load_accounts(credentials_file))
+    return build_jobs(sites, load_env_credentials())
+
+
+def format_remaining(seconds: float) -> str:
+    """格式化剩余时间，如 "4天 23小时"、"12分钟"
+
+    Args:
+        seconds: 剩余秒数
+
+    Returns:
+        剩余时间文本，已到期返回 "已到期"
+    """
+    if seconds <= 0:
+        return "已到期"
+
+    minutes = int(seconds // 60)
+    days, minutes = divmod(minutes, 24 * 60)
+    hours, minutes = divmod(minutes, 60)
+    if days:
+        return f"{days}天 {hours}小时"
+    if hours:
+        return f"{hours}小时 {minutes}分钟"
+    return f"{max(minutes, 1)}分钟"
+
+
+def format_schedule(scheduler: Scheduler, now: Optional[datetime] = None) -> str:
+    """格式化各任务的调度状态
+
+    Args:
+        scheduler: 调度器
+        now: 当前时间（默认取调度器时钟）
+
+    Returns:
+        表格文本
+    """
+    now = now or scheduler.clock()
+    rows = []
+    for key, next_run in scheduler.snapshot(now):
+        state = scheduler.state_manager.get_site_state(key) or {}
+        if "last_attempt_success" in state:
+            last = "✅" if state["last_attempt_success"] else "❌"
+            last = f"{last} {state['last_attempt_time'][:16].replace('T', ' ')}"
+        else:
+            last = "-"
+        rows.append(
+            [
+                key,
+                f"{next_run:%Y-%m-%d %H:%M}",
+                format_remaining((next_run - now).total_seconds()),
+                last,
+            ]
+        )
+    return format_table(["任务", "下次运行", "剩余", "上次结果"], rows)
+
+
+async def run_daemon(
+    scheduler: Scheduler,
+    notifier: NotifierInterface,
+    concurrency: int,
+    share_github_session: bool = True,
+) -> None:
+    """守护进程主循环
+
+    浏览器只启动一次并在各轮之间保持常驻（断开时自动重启）。
+    每轮运行所有到期任务，结果写入 StateManager 并计划下次运行；
+    收到 SIGINT / SIGTERM 后在当前轮结束时退出。
+
+    Args:
+        scheduler: 调度器
+        notifier: 通知器实例
+        concurrency: 最大并发任务数
+        share_github_session: 是否按账号复用 GitHub 会话
+    """
+    from playwright.async_api import async_playwright
+    from core.batch_runner import BatchRunner
+    from core.launch_profiles import get_launch_profile
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    def record(result) -> None:
+        scheduler.state_manager.record_result(result)
+        next_run = scheduler.schedule_next(result.key)
+        print(
+            f"{'✅' if result.success else '❌'} {result.key} ({result.duration:.1f}s)，"
+            f"下次运行: {next_run:%Y-%m-%d %H:%M}"
+        )
+
+    async with async_playwright() as p:
+        browser = None
+        try:
+            while not stop.is_set():
+                wait = None
+                due = scheduler.due_jobs()
+                if due:
+                    try:
+                        if browser is None or not browser.is_connected():
+                            browser = await p.chromium.launch(
+                                **get_launch_profile().launch_options()
+                            )
+                            print("🌐 浏览器已启动")
+
+                        print(f"⏰ {len(due)} 个任务到期: {', '.join(job.key for job in due)}")
+                        await BatchRunner(
+                            due,
+                            notifier,
+                            concurrency,
+                            on_result=record,
+                            share_github_session=share_github_session,
+                        ).run_on_browser(browser)
+                    except Exception as e:
+                        logger.error(f"本轮运行异常，{MAX_IDLE_SLEEP} 秒后重试: {e}")
+                        wait = MAX_IDLE_SLEEP
+
+                if wait is None:
+                    wait = min(scheduler.seconds_until_next(), MAX_IDLE_SLEEP)
+                try:
+                    await asyncio.wait_for(stop.wait(), timeout=wait)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            if browser is not None:
+                await browser.close()
+
+    print("👋 守护进程已退出")
+
+
+def main():
+    """主函数"""
+    args = parse_args()
+    if args.fast:
+        os.environ["ATHENA_FAST"] = "1"
+    if args.launch_profile:
+        os.environ["ATHENA_LAUNCH_PROFILE"] = args.launch_profile
+    if args.profile_dir:
+        os.environ["ATHENA_PROFILE_DIR"] = args.profile_dir
+
+    try:
+        jobs = load_jobs(args.credentials)
+        scheduler = Scheduler(jobs, StateManager())
+
+        if args.status:
+            print(format_schedule(scheduler))
+            sys.exit(0)
+
+        if not args.credentials and not all(
+            job.credentials.username and job.credentials.password for job in jobs
+        ):
+            print("❌ 缺少 GitHub 凭据")
+            print("请设置环境变量: GH_USERNAME, GH_PASSWORD，或通过 --credentials 指定凭据文件")
+            sys.exit(1)
+
+        if not jobs:
+            print("⚠️ 没有需要运行的任务")
+            sys.exit(0)
+
+        from notifiers.telegram import TelegramNotifier
+
+        print(f"🚀 守护进程启动，共 {len(jobs)} 个任务")
+        print(format_schedule(scheduler))
+        asyncio.run(
+            run_daemon(
+                scheduler, TelegramNotifier(), args.concurrency, not args.no_shared_session
+            )
+        )
+
+    except Exception as e:
+        print(f"❌ 错误: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
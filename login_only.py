@@ -2,13 +2,15 @@
 """
 GitHub OAuth 自动登录 - 仅登录模式
 只负责登录 GitHub（含 2FA），输出 Session Cookie 供其他流程使用
+
+GH_SESSION 仍有效时只发送一次 HTTP 请求确认，不导入 Playwright、不启动浏览器。
 """
 import os
 import sys
+import time
 from datetime import datetime
-from playwright.sync_api import sync_playwright
 
-from core.github_auth import GitHubAuthenticator
+from core.session_probe import probe_github_session
 from core.types import GitHubCredentials, TwoFactorConfig, DeviceVerificationConfig
 from notifiers.telegram import TelegramNotifier
 
@@ -66,126 +68,160 @@ def main():
     else:
         print("⚠️  未配置 Telegram（2FA 需要手动处理）")
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context()
-        page = context.new_page()
+    start = time.monotonic()
+    valid = None
+    if credentials.session_cookie:
+        print("🔎 检查 Session Cookie（HTTP）...")
+        valid = probe_github_session(credentials.session_cookie)
+        if valid:
+            print(f"✅ Session Cookie 仍有效（{time.monotonic() - start:.2f}s），无需启动浏览器")
+            output_to_github_actions(credentials.session_cookie, "success")
+            sys.exit(0)
+        print("🔐 Session Cookie 已失效" if valid is False else "⚠️  无法确认 Session Cookie，启动浏览器")
+
+    from playwright.sync_api import sync_playwright
+    from core.browser_server import connect_or_launch, report_first_navigation
+    from core.launch_profiles import get_launch_profile
+    from core.profile_store import ProfileLock, profile_base_dir, profile_path
+    from core.github_auth import GitHubAuthenticator
 
+    base_dir = profile_base_dir()
+    with sync_playwright() as p:
+        lock = browser = None
         try:
-            # 预加载已有 Cookie
-            if credentials.session_cookie:
-                print("🍪 使用已有 Session Cookie 快速登录")
-                context.add_cookies([{
-                    'name': 'user_session',
-                    'value': credentials.session_cookie,
-                    'domain': '.github.com',
-                    'path': '/',
-                    'secure': True,
-                    'httpOnly': True
-                }])
-
-            # 访问 GitHub 登录页
-            print("🌐 访问 GitHub 登录页...")
-            page.goto("https://github.com/login", wait_until="domcontentloaded")
-
-            # 检查是否已登录
-            try:
-                page.wait_for_selector('[data-login]', timeout=5000)
-                print("✅ 已登录 GitHub")
-                is_logged_in = True
-            except:
-                print("🔐 需要执行登录流程")
-                is_logged_in = False
-
-            # 执行登录
-            if not is_logged_in:
-                authenticator = GitHubAuthenticator(notifier)
-
-                two_factor_config = TwoFactorConfig(
-                    strategy="auto",
-                    mobile_wait=120,
-                    totp_wait=120
+            if base_dir:
+                # 持久化配置（ATHENA_PROFILE_DIR）：同一账号的用户数据目录同时只允许一个浏览器使用
+                lock = ProfileLock(profile_path(base_dir, credentials.username))
+                lock.acquire()
+                profile = get_launch_profile()
+                context = p.chromium.launch_persistent_context(
+                    lock.path, **profile.launch_options(), **profile.context_options()
                 )
+                browser, mode = context, "persistent"
+                page = context.pages[0] if context.pages else context.new_page()
+            else:
+                browser, mode = connect_or_launch(p)
+                context = browser.new_context(**get_launch_profile().context_options())
+                page = context.new_page()
+            report_first_navigation(page, start, mode)
 
-                device_config = DeviceVerificationConfig(wait=30)
+            try:
+                # 预加载已有 Cookie（HTTP 检查已确认失效时跳过）
+                if credentials.session_cookie and valid is not False:
+                    print("🍪 使用已有 Session Cookie 快速登录")
+                    context.add_cookies([{
+                        'name': 'user_session',
+                        'value': credentials.session_cookie,
+                        'domain': '.github.com',
+                        'path': '/',
+                        'secure': True,
+                        'httpOnly': True
+                    }])
+
+                # 访问 GitHub 登录页
+                print("🌐 访问 GitHub 登录页...")
+                page.goto("https://github.com/login", wait_until="domcontentloaded")
+
+                # 检查是否已登录
+                try:
+                    page.wait_for_selector('[data-login]', timeout=5000)
+                    print("✅ 已登录 GitHub")
+                    is_logged_in = True
+                except:
+                    print("🔐 需要执行登录流程")
+                    is_logged_in = False
+
+                # 执行登录
+                if not is_logged_in:
+                    authenticator = GitHubAuthenticator(notifier)
+
+                    two_factor_config = TwoFactorConfig(
+                        strategy="auto",
+                        mobile_wait=120,
+                        totp_wait=120
+                    )
 
-                success = authenticator.login(
-                    page, credentials,
-                    two_factor_config, device_config
-                )
+                    device_config = DeviceVerificationConfig(wait=30)
 
-                if not success:
-                    print("❌ 登录失败")
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    screenshot_path = f"login_failed_{timestamp}.png"
-                    page.screenshot(path=screenshot_path, full_page=True)
-                    print(f"📸 失败截图: {screenshot_path}")
+                    success = authenticator.login(
+                        page, credentials,
+                        two_factor_config, device_config
+                    )
+
+                    if not success:
+                        print("❌ 登录失败")
+                        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                        screenshot_path = f"login_failed_{timestamp}.png"
+                        page.screenshot(path=screenshot_path, full_page=True)
+                        print(f"📸 失败截图: {screenshot_path}")
+
+                        output_to_github_actions("", "failed")
+                        sys.exit(1)
+
+                # 提取 Session Cookie
+                print("🍪 提取 Session Cookie...")
+                cookies = context.cookies()
+                session_cookie = next(
+                    (c['value'] for c in cookies
+                     if c['name'] == 'user_session' and 'github.com' in c['domain']),
+                    None
+                )
 
+                if not session_cookie:
+                    print("❌ 未找到 GitHub Session Cookie")
                     output_to_github_actions("", "failed")
-                    browser.close()
                     sys.exit(1)
 
-            # 提取 Session Cookie
-            print("🍪 提取 Session Cookie...")
-            cookies = context.cookies()
-            session_cookie = next(
-                (c['value'] for c in cookies
-                 if c['name'] == 'user_session' and 'github.com' in c['domain']),
-                None
-            )
-
-            if not session_cookie:
-                print("❌ 未找到 GitHub Session Cookie")
-                output_to_github_actions("", "failed")
-                browser.close()
-                sys.exit(1)
-
-            # 输出结果
-            print("=" * 60)
-            print("✅ GitHub 登录成功")
-            print(f"🍪 Session Cookie: {session_cookie[:20]}...")
-            print("=" * 60)
-
-            output_to_github_actions(session_cookie, "success")
-
-            # 自动更新 GitHub Secret（持久化）
-            if os.getenv("REPO_TOKEN") and os.getenv("GITHUB_REPOSITORY"):
-                try:
-                    from core.cookie_manager import CookieManager
-                    from core.types import CookieTarget
-
-                    cookie_manager = CookieManager(notifier)
-                    cookie_manager.save_cookies(
-                        session_cookie,
-                        [CookieTarget(type="github_secret", secret_name="GH_SESSION")]
+                # 输出结果
+                print("=" * 60)
+                print("✅ GitHub 登录成功")
+                print(f"🍪 Session Cookie: {session_cookie[:20]}...")
+                print("=" * 60)
+
+                output_to_github_actions(session_cookie, "success")
+
+                # 自动更新 GitHub Secret（持久化）
+                if os.getenv("REPO_TOKEN") and os.getenv("GITHUB_REPOSITORY"):
+                    try:
+                        from core.cookie_manager import CookieManager
+                        from core.types import CookieTarget
+
+                        cookie_manager = CookieManager(notifier)
+                        cookie_manager.save_cookies(
+                            session_cookie,
+                            [CookieTarget(type="github_secret", secret_name="GH_SESSION")]
+                        )
+                        print("✅ 已自动更新 GH_SESSION Secret（下次可直接使用）")
+                    except Exception as e:
+                        print(f"⚠️  自动更新 Secret 失败: {e}")
+
+                if notifier:
+                    notifier.notify(
+                        f"✅ GitHub 登录成功\n🍪 Session: {session_cookie[:20]}...\n💾 已更新 Secret",
+                        level="SUCCESS"
                     )
-                    print("✅ 已自动更新 GH_SESSION Secret（下次可直接使用）")
-                except Exception as e:
-                    print(f"⚠️  自动更新 Secret 失败: {e}")
-
-            if notifier:
-                notifier.notify(
-                    f"✅ GitHub 登录成功\n🍪 Session: {session_cookie[:20]}...\n💾 已更新 Secret",
-                    level="SUCCESS"
-                )
 
-            browser.close()
-            sys.exit(0)
+                sys.exit(0)
 
-        except Exception as e:
-            print(f"❌ 登录过程出错: {e}")
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            screenshot_path = f"login_failed_{timestamp}.png"
-            page.screenshot(path=screenshot_path, full_page=True)
+            except Exception as e:
+                print(f"❌ 登录过程出错: {e}")
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                screenshot_path = f"login_failed_{timestamp}.png"
+                page.screenshot(path=screenshot_path, full_page=True)
 
-            output_to_github_actions("", "failed")
+                output_to_github_actions("", "failed")
 
-            if notifier:
-                notifier.notify(f"❌ 登录失败: {e}", level="ERROR")
-                notifier.send_photo(screenshot_path, "登录失败截图")
+                if notifier:
+                    notifier.notify(f"❌ 登录失败: {e}", level="ERROR")
+                    notifier.send_photo(screenshot_path, "登录失败截图")
 
-            browser.close()
-            sys.exit(1)
+                sys.exit(1)
+        finally:
+            # 锁与浏览器在任何退出路径（包括 sys.exit 与启动失败）上都会释放
+            if browser:
+                browser.close()
+            if lock:
+                lock.release()
 
 
 if __name__ == "__main__":
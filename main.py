@@ -1,112 +1,306 @@
 #!/usr/bin/env python3
-"""通用 GitHub OAuth 自动登录工具"""
+"""通用 GitHub OAuth 自动登录工具
+
+Playwright 与站点适配器在确定需要运行后才导入，状态仍新鲜的站点直接退出。
+"""
 import os
 import sys
-import yaml
-from playwright.sync_api import sync_playwright
-from core.types import GitHubCredentials, SiteConfig, TwoFactorConfig, DeviceVerificationConfig, TimeoutConfig, KeepAliveURL, CookieTarget
+import time
+import argparse
+from typing import Optional
+from core.types import GitHubCredentials, SiteConfig, LoginJob
+from core.constants import BrowserConfig
+from core.launch_profiles import PROFILES
+from core.config_loader import load_site_config, load_enabled_sites
+from core.credentials import load_env_credentials
+from core.state_manager import StateManager
 from notifiers.telegram import TelegramNotifier
-from sites.clawcloud import ClawCloudAdapter
 
 
 def load_config(site_name: str) -> SiteConfig:
     """加载站点配置"""
-    with open('config/sites.yaml', 'r') as f:
-        config_data = yaml.safe_load(f)
-
-    site_data = config_data.get(site_name)
-    if not site_data:
-        raise ValueError(f"站点 '{site_name}' 未配置")
-
-    if not site_data.get('enabled', True):
-        raise ValueError(f"站点 '{site_name}' 已禁用")
-
-    return SiteConfig(
-        name=site_data['name'],
-        enabled=site_data['enabled'],
-        login_url=site_data['login_url'],
-        success_url_patterns=site_data['success_url_patterns'],
-        oauth_button_selectors=site_data['oauth_button_selectors'],
-        two_factor=TwoFactorConfig(
-            strategy=site_data['two_factor']['strategy'],
-            mobile_wait=site_data['two_factor']['mobile_wait'],
-            totp_wait=site_data['two_factor']['totp_wait']
-        ),
-        device_verification=DeviceVerificationConfig(
-            wait=site_data['device_verification']['wait']
-        ),
-        timeouts=TimeoutConfig(
-            page_load=site_data['timeouts']['page_load'],
-            oauth_callback=site_data['timeouts']['oauth_callback'],
-            network_idle=site_data['timeouts']['network_idle']
-        ),
-        keepalive_urls=[
-            KeepAliveURL(url=item['url'], name=item['name'])
-            for item in site_data.get('keepalive_urls', [])
-        ],
-        cookie_domain=site_data.get('cookie_domain', 'github.com'),
-        cookie_names=site_data.get('cookie_names', ['user_session']),
-        cookie_targets=[
-            CookieTarget(
-                type=target['type'],
-                secret_name=target.get('secret_name'),
-                path=target.get('path'),
-                encrypt=target.get('encrypt', False)
-            )
-            for target in site_data.get('cookie_targets', [])
-        ]
-    )
+    return load_site_config(site_name)
 
 
 def load_credentials() -> GitHubCredentials:
     """加载凭据"""
-    return GitHubCredentials(
-        username=os.environ.get('GH_USERNAME', ''),
-        password=os.environ.get('GH_PASSWORD', ''),
-        session_cookie=os.environ.get('GH_SESSION', '').strip()
+    return load_env_credentials()
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """解析命令行参数"""
+    parser = argparse.ArgumentParser(
+        description="通用 GitHub OAuth 自动登录工具",
+        epilog=(
+            "示例: python main.py clawcloud | python main.py --all --concurrency 4 | "
+            "python main.py --all --credentials config/credentials.yaml"
+        ),
+    )
+    parser.add_argument("site_name", nargs="?", help="站点名称（config/sites.yaml 中的键）")
+    parser.add_argument("--all", action="store_true", help="运行所有启用的站点（共享一个浏览器）")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=BrowserConfig.BATCH_CONCURRENCY,
+        help=f"--all 模式下（每个进程）同时运行的站点数（默认 {BrowserConfig.BATCH_CONCURRENCY}）",
+    )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=1,
+        help="--all 模式下的进程数，每个进程独立启动浏览器（默认 1）",
+    )
+    parser.add_argument(
+        "--no-shared-session",
+        action="store_true",
+        help="批量模式下每个站点各自登录 GitHub（默认每个账号只登录一次，会话复用于所有站点）",
+    )
+    parser.add_argument(
+        "--credentials",
+        default=os.environ.get("GH_CREDENTIALS_FILE"),
+        help="多账号凭据文件（如 config/credentials.yaml），也可通过 GH_CREDENTIALS_FILE 设置",
+    )
+    parser.add_argument(
+        "--lease-db",
+        default=os.environ.get("ATHENA_LEASE_DB"),
+        help="多节点租约队列的 SQLite 文件（位于共享存储），也可通过 ATHENA_LEASE_DB 设置",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="忽略站点的 min_refresh_interval 与失败冷却期，强制运行",
+    )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="快速模式：用就绪条件（URL 变化、元素可见）代替步骤间的固定 sleep，也可通过 ATHENA_FAST=1 设置",
+    )
+    parser.add_argument(
+        "--launch-profile",
+        choices=list(PROFILES),
+        default=os.environ.get("ATHENA_LAUNCH_PROFILE"),
+        help="浏览器启动配置（默认 default），也可通过 ATHENA_LAUNCH_PROFILE 设置",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        default=os.environ.get("ATHENA_PROFILE_DIR"),
+        help="持久化浏览器配置的根目录（每个 GitHub 账号一个子目录，减少设备验证），"
+        "也可通过 ATHENA_PROFILE_DIR 设置",
+    )
+    args = parser.parse_args(argv)
+
+    if not args.all and not args.site_name:
+        parser.print_usage()
+        sys.exit(1)
+
+    return args
+
+
+def run_single(
+    site_name: str,
+    credentials: GitHubCredentials,
+    notifier: TelegramNotifier,
+    force: bool = False,
+) -> bool:
+    """运行单个站点"""
+    config = load_config(site_name)
+    state_manager = StateManager()
+
+    if not force and state_manager.is_fresh(site_name, config.min_refresh_interval):
+        print(f"⏭️ {site_name} 最近已成功登录（{config.min_refresh_interval} 秒内），跳过")
+        return True
+
+    from playwright.sync_api import sync_playwright
+    from core.browser_server import connect_or_launch, report_first_navigation
+    from core.launch_profiles import get_launch_profile
+    from core.profile_store import ProfileLock, profile_base_dir, profile_path
+    from sites.registry import get_adapter_class
+
+    adapter = get_adapter_class(site_name)(config, credentials, notifier)
+
+    start = time.monotonic()
+    base_dir = profile_base_dir()
+    if adapter.try_http_oauth():
+        # HTTP 授权链已完成登录，无需启动浏览器
+        state_manager.record_login_attempt(
+            site_name,
+            True,
+            cookies_saved=adapter.cookies_saved,
+            cookies_expire_at=adapter.cookies_expire_at,
+            metrics=adapter.run_metrics(),
+        )
+        return True
+
+    with sync_playwright() as p:
+        lock = browser = None
+        try:
+            if base_dir:
+                # 持久化配置：同一账号的用户数据目录同时只允许一个浏览器使用
+                lock = ProfileLock(profile_path(base_dir, credentials.username))
+                lock.acquire()
+                profile = get_launch_profile()
+                context = p.chromium.launch_persistent_context(
+                    lock.path, **profile.launch_options(), **profile.context_options()
+                )
+                browser, mode = context, "persistent"
+                page = context.pages[0] if context.pages else context.new_page()
+            else:
+                browser, mode = connect_or_launch(p)
+                context = browser.new_context(**get_launch_profile().context_options())
+                page = context.new_page()
+            report_first_navigation(page, start, mode)
+
+            success = adapter.run(context, page)
+        finally:
+            # 获取锁或启动浏览器失败时同样释放已获取的资源
+            if browser:
+                browser.close()
+            if lock:
+                lock.release()
+
+    state_manager.record_login_attempt(
+        site_name,
+        success,
+        error_message="" if success else "登录流程失败",
+        cookies_saved=adapter.cookies_saved,
+        cookies_expire_at=adapter.cookies_expire_at,
+        metrics=adapter.run_metrics(),
+        persistent_profile=base_dir is not None,
+    )
+    return success
+
+
+def run_jobs(
+    jobs: list[LoginJob],
+    notifier: TelegramNotifier,
+    concurrency: int,
+    shards: int = 1,
+    share_github_session: bool = True,
+    force: bool = False,
+    lease_db: Optional[str] = None,
+) -> bool:
+    """批量运行登录任务"""
+    from core.jobs import split_fresh_jobs, prioritize_jobs
+
+    if not jobs:
+        print("⚠️ 没有需要运行的任务")
+        return True
+
+    state_manager = StateManager()
+
+    if not force:
+        jobs, fresh = split_fresh_jobs(jobs, state_manager)
+        for job in fresh:
+            print(f"⏭️ {job.key} 最近已成功登录，跳过")
+        if not jobs:
+            print("✅ 所有任务均在新鲜期内，无需启动浏览器")
+            return True
+
+    # Cookie 最先过期的任务优先运行，冷却中的不健康站点推迟
+    jobs, cooling = prioritize_jobs(jobs, state_manager)
+    if force:
+        jobs, cooling = jobs + [job for job, _ in cooling], []
+    for job, until in cooling:
+        print(f"🧊 {job.key} 连续失败，冷却至 {until:%Y-%m-%d %H:%M}，跳过")
+    if not jobs:
+        print("⚠️ 所有待运行任务均在冷却期内")
+        return False
+
+    from core.batch_runner import BatchRunner, format_results_table
+    from core.sharded_runner import ShardedRunner
+
+    if lease_db:
+        from core.lease_queue import LeaseQueue
+        from core.lease_runner import LeaseRunner
+
+        if shards > 1:
+            print("⚠️ 租约模式下忽略 --shards，可在更多节点上运行以扩展吞吐量")
+        results = LeaseRunner(
+            jobs, notifier, LeaseQueue(lease_db), concurrency, state_manager, share_github_session
+        ).run()
+    elif shards > 1:
+        results = ShardedRunner(
+            jobs, notifier, shards, concurrency, state_manager, share_github_session
+        ).run()
+    else:
+        results = BatchRunner(
+            jobs,
+            notifier,
+            concurrency,
+            on_result=state_manager.record_result,
+            share_github_session=share_github_session,
+        ).run()
+
+    print(f"\n{'='*50}")
+    print(format_results_table(results))
+    print(f"{'='*50}\n")
+
+    # 冷却中的任务仍视为失败，避免掩盖持续失效的站点
+    return all(r.success for r in results) and not cooling
+
+
+def run_accounts(args: argparse.Namespace, notifier: TelegramNotifier) -> bool:
+    """按凭据文件运行所有账号"""
+    from core.jobs import build_account_jobs
+    from core.credentials import load_accounts
+
+    accounts = load_accounts(args.credentials)
+    sites = load_enabled_sites() if args.all else {args.site_name: load_config(args.site_name)}
+
+    print(f"👥 {len(accounts)} 个账号 × {len(sites)} 个站点: {', '.join(sites)}")
+    return run_jobs(
+        build_account_jobs(sites, accounts),
+        notifier,
+        args.concurrency,
+        args.shards,
+        not args.no_shared_session,
+        args.force,
+        args.lease_db,
     )
 
 
 def main():
     """主函数"""
-    if len(sys.argv) < 2:
-        print("用法: python main.py <site_name>")
-        print("示例: python main.py clawcloud")
-        sys.exit(1)
-
-    site_name = sys.argv[1]
+    args = parse_args()
+    if args.fast:
+        # 通过环境变量传递，分片子进程同样生效
+        os.environ["ATHENA_FAST"] = "1"
+    if args.launch_profile:
+        os.environ["ATHENA_LAUNCH_PROFILE"] = args.launch_profile
+    if args.profile_dir:
+        os.environ["ATHENA_PROFILE_DIR"] = args.profile_dir
 
     try:
-        # 加载配置
-        config = load_config(site_name)
-        credentials = load_credentials()
         notifier = TelegramNotifier()
 
-        if not credentials.username or not credentials.password:
-            print("❌ 缺少 GitHub 凭据")
-            print("请设置环境变量: GH_USERNAME, GH_PASSWORD")
-            sys.exit(1)
-
-        # 创建适配器
-        adapter = ClawCloudAdapter(config, credentials, notifier)
-
-        # 运行登录
-        with sync_playwright() as p:
-            browser = p.chromium.launch(
-                headless=True,
-                args=['--no-sandbox']
-            )
-            context = browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            )
-            page = context.new_page()
-
-            try:
-                success = adapter.run(context, page)
-                sys.exit(0 if success else 1)
-            finally:
-                browser.close()
+        if args.credentials:
+            success = run_accounts(args, notifier)
+        else:
+            credentials = load_credentials()
+
+            if not credentials.username or not credentials.password:
+                print("❌ 缺少 GitHub 凭据")
+                print("请设置环境变量: GH_USERNAME, GH_PASSWORD，或通过 --credentials 指定凭据文件")
+                sys.exit(1)
+
+            if args.all:
+                from core.jobs import build_jobs
+
+                sites = load_enabled_sites()
+                print(f"🚀 批量运行 {len(sites)} 个站点: {', '.join(sites)}")
+                success = run_jobs(
+                    build_jobs(sites, credentials),
+                    notifier,
+                    args.concurrency,
+                    args.shards,
+                    not args.no_shared_session,
+                    args.force,
+                    args.lease_db,
+                )
+            else:
+                success = run_single(args.site_name, credentials, notifier, args.force)
+
+        sys.exit(0 if success else 1)
 
     except Exception as e:
         print(f"❌ 错误: {e}")
@@ -0,0 +1,87 @@
+"""站点适配器基类（异步版）"""
+import time
+import asyncio
+from abc import ABC
+
+from core.async_github_auth import AsyncGitHubAuthenticator
+from core.async_oauth_handler import AsyncOAuthFlowController
+from core.steps import AsyncStepIO
+from sites.base import SiteAdapterBase
+
+
+class AsyncSiteAdapter(AsyncStepIO, SiteAdapterBase, ABC):
+    """站点适配器基类（异步版）
+
+    流程与 SiteAdapter 一致（见 SiteAdapterBase），基于 playwright.async_api，
+    同一个事件循环可以同时驱动多个站点。
+    """
+
+    authenticator_class = AsyncGitHubAuthenticator
+    oauth_handler_class = AsyncOAuthFlowController
+
+    async def run(self, context, page) -> bool:
+        """执行完整登录流程（同 SiteAdapter.run）"""
+        return await self._run(self._run_steps(context, page))
+
+    async def _install_blocker(self, context) -> None:
+        if self.blocker is not None:
+            await self.blocker.install_async(context)
+
+    async def _uninstall_blocker(self) -> None:
+        if self.blocker is not None:
+            await self.blocker.uninstall_async()
+
+    async def _do_post_login(self, page):
+        """登录后操作
+
+        所有保活 URL 同时进行：mode: http 的直接发送请求；mode: page 的由至多
+        keepalive_parallelism 个标签页组成的工作池领取，慢页面只占用自己的标签页。
+        """
+        if not self.config.keepalive_urls:
+            return
+
+        print("🔹 步骤6: 保活")
+        queue: asyncio.Queue = asyncio.Queue()
+        requests = []
+        for keepalive in self.config.keepalive_urls:
+            if keepalive.mode == "http":
+                requests.append(self._visit_keepalive_request(page.context, keepalive))
+            else:
+                queue.put_nowait(keepalive)
+
+        parallelism = min(self.config.keepalive_parallelism, queue.qsize())
+        tabs = [page] + [await page.context.new_page() for _ in range(parallelism - 1)]
+
+        async def worker(tab) -> None:
+            while not queue.empty():
+                await self._visit_keepalive_page(tab, queue.get_nowait())
+
+        try:
+            workers = [worker(tab) for tab in tabs] if parallelism else []
+            await asyncio.gather(*requests, *workers)
+        finally:
+            for tab in tabs[1:]:
+                await tab.close()
+
+    async def _visit_keepalive_request(self, context, keepalive) -> None:
+        """访问 mode: http 的保活 URL 并记录结果"""
+        start = time.monotonic()
+        try:
+            size = await self._keepalive_request(context, self._keepalive_full_url(keepalive.url))
+            self._record_keepalive(keepalive, start, size)
+        except Exception as e:
+            self._record_keepalive(keepalive, start, error=self._error_message(e))
+
+    async def _visit_keepalive_page(self, tab, keepalive) -> None:
+        """在标签页中访问 mode: page 的保活 URL 并记录结果"""
+        start = time.monotonic()
+        try:
+            ready = self._ready_waiter(tab, "keepalive", keepalive.ready)
+            await tab.goto(self._keepalive_full_url(keepalive.url), timeout=30000)
+            with self.pacer.waiting():
+                await ready.wait_async()
+            self._record_keepalive(keepalive, start)
+            # 页面已经就绪，快速模式下无需额外等待
+            await self.pacer.pause_async(2)
+        except Exception as e:
+            self._record_keepalive(keepalive, start, error=self._error_message(e))
@@ -1,15 +1,48 @@
 """站点适配器基类"""
+import json
 import time
-from abc import ABC, abstractmethod
-from typing import Optional
-from core.types import SiteConfig, GitHubCredentials, NotifierInterface
+from collections import deque
+from abc import ABC
+from typing import Any, Callable, Optional
+from core.types import (
+    SiteConfig,
+    GitHubCredentials,
+    NotifierInterface,
+    ReadySpec,
+    KeepAliveURL,
+    KeepAliveResult,
+)
 from core.github_auth import GitHubAuthenticator
 from core.oauth_handler import OAuthFlowController
-from core.cookie_manager import CookieManager
+from core.cookie_manager import CookieManager, build_github_session_cookies
+from core.constants import GitHubUrls, Timeouts
+from core.pacing import Pacer
+from core.readiness import ReadyWaiter
+from core.locators import combined_locator
+from core.resource_blocker import ResourceBlocker
+from core.http_oauth import HttpOAuthChain, HttpOAuthFallback
+from core.storage_state_cache import StorageStateCache, cache_enabled, site_state
+from core.steps import Steps, StepIO, SyncStepIO
+from utils.table import format_table
 
 
-class SiteAdapter(ABC):
-    """站点适配器基类"""
+class SiteAdapterBase(StepIO, ABC):
+    """站点适配器公共逻辑
+
+    同步版 SiteAdapter 与异步版 AsyncSiteAdapter 共享配置、组件创建以及登录流程：
+    流程以步骤生成器实现（见 core.steps），子类通过类属性指定认证组件实现，
+    并提供请求拦截与保活这两处同步/异步实现不同的 I/O。
+    公开方法在同步版中返回结果，在异步版中返回协程。
+    """
+
+    authenticator_class: type = GitHubAuthenticator
+    oauth_handler_class: type = OAuthFlowController
+
+    # 同步版与异步版分别实现（异步版为协程函数）：注册/取消请求拦截，
+    # 以及登录后访问保活 URL（两者的并发方式不同）
+    _install_blocker: Callable[[Any], Any]
+    _uninstall_blocker: Callable[[], Any]
+    _do_post_login: Callable[[Any], Any]
 
     def __init__(
         self, config: SiteConfig, credentials: GitHubCredentials, notifier: NotifierInterface
@@ -18,12 +51,292 @@ class SiteAdapter(ABC):
         self.credentials = credentials
         self.notifier = notifier
 
-        self.github_auth = GitHubAuthenticator(notifier)
-        self.oauth_handler = OAuthFlowController(notifier)
+        # 步骤间等待策略与耗时统计，认证组件共用
+        self.pacer = Pacer()
+        self.github_auth = self.authenticator_class(notifier, self.pacer)
+        self.oauth_handler = self.oauth_handler_class(notifier, self.pacer)
+        # 站点配置了 block_resources 时拦截不需要的请求
+        self.blocker = ResourceBlocker(config.block_resources) if config.block_resources else None
         self.cookie_manager = CookieManager(notifier)
+        # 所有 cookie_names 均已提取并保存时为 True，用于记录 Cookie 新鲜度
+        self.cookies_saved = False
+        # 已保存 Cookie 中最早的过期时间（Unix 时间戳），用于按过期时间排定优先级
+        self.cookies_expire_at: Optional[float] = None
+        # HTTP OAuth 授权链的结果：None 表示尚未尝试
+        self.http_oauth_success: Optional[bool] = None
+        self._http_oauth_metrics: dict[str, float] = {}
+        # 本次运行各保活 URL 的访问结果
+        self.keepalive_results: list[KeepAliveResult] = []
+        # 站点 storage_state 缓存（站点 × 账号）
+        self.state_cache = (
+            StorageStateCache(f"{config.name}_{credentials.username}")
+            if cache_enabled(config.storage_state_cache)
+            else None
+        )
+        self.storage_state_restored = False
+        # 首次打开登录页即判定为已登录（未经过 OAuth）
+        self.already_logged_in = False
 
-    def run(self, context, page) -> bool:
-        """执行完整登录流程"""
+    def _session_cookies(self) -> list[dict]:
+        """构造需要预加载的 GitHub Session Cookie"""
+        return build_github_session_cookies(self.credentials.session_cookie)
+
+    def _check_already_logged_in(self, page) -> bool:
+        """检查是否已登录"""
+        return self._is_success_url(page.url)
+
+    def _is_success_url(self, url: str) -> bool:
+        """URL 是否满足 success_url_patterns"""
+        for pattern in self.config.success_url_patterns:
+            if pattern.startswith("!"):
+                # 反向匹配
+                if pattern[1:] in url:
+                    return False
+            else:
+                # 正向匹配
+                if pattern not in url:
+                    return False
+        return True
+
+    def try_http_oauth(self, session_cookie: Optional[str] = None) -> bool:
+        """不启动浏览器，用 HTTP 请求跟随 OAuth 重定向链完成登录（阻塞，只尝试一次）
+
+        站点配置了 http_oauth 且有 GitHub Session Cookie 时，跟随站点 OAuth 入口到回调的
+        重定向链，成功后访问保活 URL 并保存 cookie_names。任何意外都返回 False，
+        调用方继续走浏览器流程。
+
+        Args:
+            session_cookie: GitHub user_session（默认使用凭据中的 Session Cookie）
+
+        Returns:
+            是否已通过 HTTP 完成登录
+        """
+        session_cookie = session_cookie or self.credentials.session_cookie
+        if self.http_oauth_success is not None or not self.config.http_oauth or not session_cookie:
+            return bool(self.http_oauth_success)
+
+        print(f"🔹 HTTP OAuth: 跟随 {self.config.name} 的授权重定向链")
+        chain = HttpOAuthChain(self.config.http_oauth, session_cookie)
+        try:
+            final_url = chain.run(self._is_success_url)
+        except HttpOAuthFallback as e:
+            print(f"⚠️ HTTP OAuth 未完成（{e}），回退浏览器登录")
+            self.http_oauth_success = False
+            self._http_oauth_metrics = {"http_oauth_fallbacks": 1, "http_requests": chain.requests}
+            return False
+
+        print(f"✅ HTTP OAuth 完成: {final_url}")
+        for keepalive in self.config.keepalive_urls:
+            start = time.monotonic()
+            ok = chain.visit(self._keepalive_full_url(keepalive.url))
+            self._record_keepalive(keepalive, start, error="" if ok else "请求失败")
+
+        for cookie_name, value in self._collect_cookies(chain.cookies()):
+            print(f"✅ 提取 Cookie: {cookie_name}")
+            self.cookie_manager.save_cookies(value, self.config.cookie_targets)
+
+        self.http_oauth_success = True
+        self._http_oauth_metrics = {"http_oauth_logins": 1, "http_requests": chain.requests}
+        return True
+
+    def _ready_waiter(self, page, step: str, spec: Optional[ReadySpec] = None) -> ReadyWaiter:
+        """创建步骤的就绪等待（需在触发导航之前调用）
+
+        Args:
+            page: Page 对象
+            step: 步骤名称（sites.yaml 中 ready 段的键）
+            spec: 优先使用的就绪条件（如单个保活 URL 的 ready）
+
+        Returns:
+            就绪等待，未配置条件时等待 networkidle
+        """
+        return ReadyWaiter(
+            page, spec or self.config.ready.get(step), self.config.timeouts.network_idle
+        )
+
+    def run_metrics(self) -> dict[str, float]:
+        """本次运行的指标（认证指标与等待耗时），由调用方写入 StateManager"""
+        metrics = {**self.github_auth.metrics, **self.pacer.metrics(), **self._http_oauth_metrics}
+        if self.state_cache and not self.http_oauth_success:
+            # 恢复了缓存且首次导航即已登录才算命中
+            hit = self.storage_state_restored and self.already_logged_in
+            metrics["storage_state_hits"] = int(hit)
+            metrics["storage_state_misses"] = int(not hit)
+        if self.blocker:
+            metrics.update(self.blocker.metrics())
+        if self.keepalive_results:
+            metrics["keepalive_seconds"] = round(sum(r.duration for r in self.keepalive_results), 3)
+            metrics["keepalive_bytes"] = sum(r.bytes or 0 for r in self.keepalive_results)
+        return metrics
+
+    def _print_report(self) -> None:
+        """打印本次运行的等待、拦截与保活统计"""
+        print(self.pacer.report())
+        if self.blocker:
+            print(self.blocker.report())
+        if self.keepalive_results:
+            print(self._keepalive_report())
+
+    def _record_keepalive(
+        self,
+        keepalive: KeepAliveURL,
+        start: float,
+        size: Optional[int] = None,
+        error: str = "",
+    ) -> None:
+        """记录单个保活 URL 的访问结果
+
+        Args:
+            keepalive: 保活 URL
+            start: 开始访问的时间（time.monotonic()）
+            size: 响应体字节数（page 模式为 None）
+            error: 失败原因，为空表示成功
+        """
+        result = KeepAliveResult(
+            name=keepalive.name,
+            url=keepalive.url,
+            mode=keepalive.mode,
+            success=not error,
+            duration=time.monotonic() - start,
+            bytes=size,
+            error=error,
+        )
+        self.keepalive_results.append(result)
+        if result.success:
+            print(f"✅ 已访问: {keepalive.name}（{result.duration * 1000:.0f}ms）")
+        else:
+            print(f"⚠️ 保活失败: {keepalive.name}（{error}）")
+
+    @staticmethod
+    def _error_message(error: Exception) -> str:
+        """异常的简短描述（Playwright 的异常消息包含多行调用日志，只保留第一行）"""
+        return str(error).split("\n")[0] or type(error).__name__
+
+    def _keepalive_report(self) -> str:
+        """各保活 URL 的耗时与响应大小"""
+        rows = [
+            (
+                r.name,
+                r.mode,
+                "✅" if r.success else f"❌ {r.error}",
+                f"{r.duration * 1000:.0f}ms",
+                f"{r.bytes / 1024:.1f} KB" if r.bytes is not None else "-",
+            )
+            for r in self.keepalive_results
+        ]
+        return format_table(("保活", "方式", "状态", "耗时", "大小"), rows)
+
+    def _render_on_failure(self) -> bool:
+        """失败时是否需要取消拦截、完整渲染页面后截图"""
+        settings = self.config.block_resources
+        return bool(self.blocker is not None and settings and settings.render_on_failure)
+
+    def _collect_cookies(self, cookies: list[dict]) -> list[tuple[str, str]]:
+        """从 Cookie 列表中找出 cookie_names 对应的值
+
+        同时更新 cookies_saved 与 cookies_expire_at。
+
+        Args:
+            cookies: BrowserContext.cookies() 返回的 Cookie 列表
+
+        Returns:
+            (Cookie 名称, 值) 列表
+        """
+        found = []
+        expiries = []
+        for cookie_name in self.config.cookie_names:
+            cookie = self.cookie_manager.find_cookie_entry(
+                cookies, self.config.cookie_domain, cookie_name
+            )
+            if cookie and cookie.get("value"):
+                found.append((cookie_name, cookie["value"]))
+                if cookie.get("expires", -1) > 0:
+                    expiries.append(cookie["expires"])
+            else:
+                print(f"⚠️ 未获取到 {cookie_name}")
+
+        self.cookies_saved = bool(found) and len(found) == len(self.config.cookie_names)
+        self.cookies_expire_at = min(expiries) if expiries else None
+        return found
+
+    def _cached_storage_state(self) -> Optional[dict]:
+        """读取缓存的站点 storage_state
+
+        GitHub 会话由 Session Cookie / 预登录单独管理，恢复时同样去掉 github.com 的状态
+        （兼容旧版缓存），并丢弃已过期的 Cookie。
+
+        Returns:
+            {"cookies": [...], "origins": [...]}，没有可用缓存时返回 None
+        """
+        state = self.state_cache.load() if self.state_cache is not None else None
+        if not state:
+            return None
+        state = site_state(state)
+        now = time.time()
+        state["cookies"] = [
+            cookie
+            for cookie in state["cookies"]
+            if cookie.get("expires", -1) <= 0 or cookie["expires"] > now
+        ]
+        return state
+
+    @staticmethod
+    def _local_storage_script(origins: list[dict]) -> str:
+        """恢复 localStorage 的初始化脚本（只写入页面中尚不存在的键）"""
+        items = {
+            origin["origin"]: {entry["name"]: entry["value"] for entry in origin["localStorage"]}
+            for origin in origins
+        }
+        return (
+            f"(() => {{ const items = {json.dumps(items)}[location.origin] || {{}};"
+            " for (const [k, v] of Object.entries(items))"
+            " if (localStorage.getItem(k) === null) localStorage.setItem(k, v); })();"
+        )
+
+    def _keepalive_full_url(self, url: str) -> str:
+        """将保活 URL 转换为完整 URL"""
+        if url.startswith("http"):
+            return url
+        # 相对 URL，需要拼接基础 URL
+        base_url = self.config.login_url.rsplit("/", 1)[0]
+        return f"{base_url}{url}"
+
+    def _keepalive_request(self, context, url: str):
+        """通过上下文的请求客户端访问保活 URL（共享浏览器 Cookie，不渲染页面）
+
+        Returns:
+            响应体字节数
+
+        Raises:
+            RuntimeError: 响应状态码不是 2xx
+        """
+        return self._run(self._keepalive_request_steps(context, url))
+
+    def _wait_for_login_page(self, page):
+        """快速模式下登录页的就绪条件：已登录，或 OAuth 按钮可见"""
+        return self._run(self._login_page_ready_steps(page))
+
+    def _run_steps(self, context, page) -> Steps[bool]:
+        """完整登录流程（HTTP 授权链、storage_state 缓存与请求拦截，见 SiteAdapter.run）"""
+        if (yield self._in_thread(self.try_http_oauth)):
+            return True
+
+        if self.state_cache:
+            yield from self._restore_storage_state_steps(context)
+        if self.blocker:
+            yield self._install_blocker(context)
+
+        success = yield from self._login_flow_steps(context, page)
+        if success and self.state_cache:
+            yield from self._save_storage_state_steps(context)
+        if not success and self._render_on_failure():
+            yield from self._capture_full_render_steps(page)
+
+        self._print_report()
+        return success
+
+    def _login_flow_steps(self, context, page) -> Steps[bool]:
+        """登录流程各步骤"""
         print(f"\n{'='*50}")
         print(f"🚀 {self.config.name} 自动登录")
         print(f"{'='*50}\n")
@@ -31,54 +344,75 @@ class SiteAdapter(ABC):
         try:
             # 1. 预加载 Cookie
             if self.credentials.session_cookie:
-                self._load_session_cookie(context)
+                yield from self._load_session_cookie_steps(context)
 
             # 2. 访问登录页
             print(f"🔹 步骤1: 访问 {self.config.name}")
-            page.goto(self.config.login_url, timeout=60000)
-            page.wait_for_load_state(
-                "networkidle", timeout=self.config.timeouts.network_idle * 1000
-            )
-            time.sleep(2)
+            ready = self._ready_waiter(page, "login_page")
+            yield page.goto(self.config.login_url, timeout=60000)
+            with self.pacer.waiting():
+                yield self._wait_ready(ready)
+            yield self._pause(2, lambda: self._wait_for_login_page(page))
 
             # 检查是否已登录
             if self._check_already_logged_in(page):
                 print("✅ 已登录！")
-                self._do_post_login(page)
-                self._extract_and_save_cookies(context)
+                self.already_logged_in = True
+                yield self._do_post_login(page)
+                yield from self._extract_and_save_cookies_steps(context)
                 return True
 
             # 3. 点击 OAuth 按钮
             print("🔹 步骤2: 点击 GitHub 登录")
-            if not self.oauth_handler.click_oauth_button(
-                page, self.config.oauth_button_selectors, "GitHub"
+            login_page_url = page.url
+            ready = self._ready_waiter(page, "oauth_redirect")
+            if not (
+                yield self.oauth_handler.click_oauth_button(
+                    page, self.config.oauth_button_selectors, "GitHub"
+                )
             ):
                 print("❌ 未找到 OAuth 按钮")
                 return False
 
-            time.sleep(3)
-            page.wait_for_load_state(
-                "networkidle", timeout=self.config.timeouts.network_idle * 1000
+            yield self._pause(
+                3,
+                lambda: page.wait_for_url(
+                    lambda url: url != login_page_url,
+                    timeout=Timeouts.READY,
+                    wait_until="commit",
+                ),
             )
+            with self.pacer.waiting():
+                yield self._wait_ready(ready)
 
             # 4. GitHub 认证
             print("🔹 步骤3: GitHub 认证")
             url = page.url
 
-            if "github.com/login" in url or "github.com/session" in url:
-                if not self.github_auth.login(
-                    page, self.credentials, self.config.two_factor, self.config.device_verification
+            # 授权页 URL 同样包含 github.com/login，需要先判断
+            if GitHubUrls.OAUTH_AUTHORIZE in url:
+                print("✅ Cookie 有效")
+                yield self.oauth_handler.handle_authorization(
+                    page, self.config.ready.get("authorize")
+                )
+            elif "github.com/login" in url or GitHubUrls.SESSION in url:
+                if not (
+                    yield self.github_auth.login(
+                        page,
+                        self.credentials,
+                        self.config.two_factor,
+                        self.config.device_verification,
+                    )
                 ):
                     print("❌ GitHub 登录失败")
                     return False
-            elif "github.com/login/oauth/authorize" in url:
-                print("✅ Cookie 有效")
-                self.oauth_handler.handle_authorization(page)
 
             # 5. 等待回调
             print("🔹 步骤4: 等待回调")
-            if not self.oauth_handler.wait_callback(
-                page, self.config.success_url_patterns, self.config.timeouts.oauth_callback
+            if not (
+                yield self.oauth_handler.wait_callback(
+                    page, self.config.success_url_patterns, self.config.timeouts.oauth_callback
+                )
             ):
                 print("❌ 回调失败")
                 return False
@@ -90,10 +424,10 @@ class SiteAdapter(ABC):
                 return False
 
             # 7. 登录后操作
-            self._do_post_login(page)
+            yield self._do_post_login(page)
 
             # 8. 提取并保存 Cookie
-            self._extract_and_save_cookies(context)
+            yield from self._extract_and_save_cookies_steps(context)
 
             print(f"\n{'='*50}")
             print("✅ 成功！")
@@ -108,69 +442,180 @@ class SiteAdapter(ABC):
             traceback.print_exc()
             return False
 
-    def _load_session_cookie(self, context):
-        """加载 Session Cookie"""
+    def _restore_storage_state_steps(self, context) -> Steps[None]:
+        """把缓存的站点 Cookie 与 localStorage 恢复到上下文"""
         try:
-            context.add_cookies(
-                [
-                    {
-                        "name": "user_session",
-                        "value": self.credentials.session_cookie,
-                        "domain": "github.com",
-                        "path": "/",
-                    },
-                    {"name": "logged_in", "value": "yes", "domain": "github.com", "path": "/"},
-                ]
+            state = yield self._in_thread(self._cached_storage_state)
+            if not state:
+                return
+            if state["cookies"]:
+                yield context.add_cookies(state["cookies"])
+            if state["origins"]:
+                yield context.add_init_script(script=self._local_storage_script(state["origins"]))
+            self.storage_state_restored = True
+            print("✅ 已恢复站点 storage_state 缓存")
+        except Exception as e:
+            print(f"⚠️ 恢复 storage_state 缓存失败: {e}")
+
+    def _save_storage_state_steps(self, context) -> Steps[None]:
+        """缓存上下文的 storage_state"""
+        if self.state_cache is None:
+            return
+        try:
+            state = yield context.storage_state()
+            yield self._in_thread(self.state_cache.save, state)
+        except Exception as e:
+            print(f"⚠️ 保存 storage_state 缓存失败: {e}")
+
+    def _capture_full_render_steps(self, page) -> Steps[None]:
+        """取消请求拦截，重新加载当前页面后截图"""
+        try:
+            if self.blocker is not None:
+                yield self._uninstall_blocker()
+            yield page.reload(wait_until="load", timeout=30000)
+        except Exception as e:
+            print(f"⚠️ 完整渲染失败页面失败: {e}")
+        yield self.github_auth._screenshot(page, "失败_完整渲染")
+
+    def _login_page_ready_steps(self, page) -> Steps[None]:
+        """已登录时直接返回，否则等待 OAuth 按钮可见"""
+        if not self._check_already_logged_in(page):
+            yield combined_locator(page, self.config.oauth_button_selectors).wait_for(
+                state="visible", timeout=Timeouts.READY
             )
+
+    def _load_session_cookie_steps(self, context) -> Steps[None]:
+        """加载 Session Cookie"""
+        try:
+            yield context.add_cookies(self._session_cookies())
             print("✅ 已加载 Session Cookie")
         except Exception:
             print("⚠️ 加载 Cookie 失败")
 
-    def _check_already_logged_in(self, page) -> bool:
-        """检查是否已登录"""
-        for pattern in self.config.success_url_patterns:
-            if pattern.startswith("!"):
-                # 反向匹配
-                if pattern[1:] in page.url:
-                    return False
-            else:
-                # 正向匹配
-                if pattern not in page.url:
-                    return False
-        return True
+    def _keepalive_request_steps(self, context, url: str) -> Steps[int]:
+        """请求保活 URL 并读取响应体，最后释放响应"""
+        response = yield context.request.get(url, timeout=Timeouts.PAGE_LOAD)
+        try:
+            if not response.ok:
+                raise RuntimeError(f"HTTP {response.status}")
+            return len((yield response.body()))
+        finally:
+            yield response.dispose()
+
+    def _extract_and_save_cookies_steps(self, context) -> Steps[None]:
+        """提取并保存 Cookie"""
+        print("🔹 步骤7: 更新 Cookie")
+
+        for cookie_name, value in self._collect_cookies((yield context.cookies())):
+            print(f"✅ 提取 Cookie: {cookie_name}")
+            # Cookie 保存涉及阻塞的网络请求，异步版放到线程中执行
+            yield self._in_thread(
+                self.cookie_manager.save_cookies, value, self.config.cookie_targets
+            )
+
+
+class SiteAdapter(SyncStepIO, SiteAdapterBase, ABC):
+    """站点适配器基类"""
+
+    def run(self, context, page) -> bool:
+        """执行完整登录流程
+
+        配置了 http_oauth 时先尝试不经过页面的 HTTP 授权链。
+        启用 storage_state_cache 时先恢复上次成功登录后缓存的站点会话，成功后更新缓存。
+        配置了 block_resources 时先在上下文上注册请求拦截；失败时按配置取消拦截，
+        完整渲染当前页面并截图，便于诊断。
+
+        Returns:
+            是否成功
+        """
+        return self._run(self._run_steps(context, page))
+
+    def _install_blocker(self, context) -> None:
+        if self.blocker is not None:
+            self.blocker.install(context)
+
+    def _uninstall_blocker(self) -> None:
+        if self.blocker is not None:
+            self.blocker.uninstall()
 
     def _do_post_login(self, page):
-        """登录后操作"""
+        """登录后操作
+
+        mode: http 的保活 URL 逐个发送请求；mode: page 的保活 URL 分批在至多
+        keepalive_parallelism 个标签页中同时导航，每批先发起所有导航，再依次等待就绪。
+        """
         if not self.config.keepalive_urls:
             return
 
         print("🔹 步骤6: 保活")
+        page_keepalives = []
         for keepalive in self.config.keepalive_urls:
+            if keepalive.mode != "http":
+                page_keepalives.append(keepalive)
+                continue
+            full_url = self._keepalive_full_url(keepalive.url)
+            start = time.monotonic()
             try:
-                full_url = keepalive.url
-                if not full_url.startswith("http"):
-                    # 相对 URL，需要拼接基础 URL
-                    base_url = self.config.login_url.rsplit("/", 1)[0]
-                    full_url = f"{base_url}{keepalive.url}"
-
-                page.goto(full_url, timeout=30000)
-                page.wait_for_load_state("networkidle", timeout=15000)
-                print(f"✅ 已访问: {keepalive.name}")
-                time.sleep(2)
-            except Exception:
-                pass
-
-    def _extract_and_save_cookies(self, context):
-        """提取并保存 Cookie"""
-        print("🔹 步骤7: 更新 Cookie")
+                size = self._keepalive_request(page.context, full_url)
+                self._record_keepalive(keepalive, start, size)
+            except Exception as e:
+                self._record_keepalive(keepalive, start, error=self._error_message(e))
 
-        for cookie_name in self.config.cookie_names:
-            value = self.cookie_manager.extract_session(
-                context, self.config.cookie_domain, cookie_name
-            )
+        if page_keepalives:
+            self._visit_keepalive_pages(page, page_keepalives)
 
-            if value:
-                print(f"✅ 提取 Cookie: {cookie_name}")
-                self.cookie_manager.save_cookies(value, self.config.cookie_targets)
-            else:
-                print(f"⚠️ 未获取到 {cookie_name}")
+    def _visit_keepalive_pages(self, page, keepalives: list[KeepAliveURL]) -> None:
+        """在登录页与额外打开的标签页中访问保活页面
+
+        Args:
+            page: 登录使用的页面（作为第一个标签页）
+            keepalives: mode: page 的保活 URL
+        """
+        parallelism = min(self.config.keepalive_parallelism, len(keepalives))
+        tabs = [page] + [page.context.new_page() for _ in range(parallelism - 1)]
+        pending = deque(keepalives)
+        # 标签页 -> (保活 URL, 开始时间, 就绪等待)
+        loading: dict = {}
+
+        def start_next(tab) -> None:
+            """在空闲的标签页中开始下一个保活 URL 的导航（只等到 commit）"""
+            while pending:
+                keepalive = pending.popleft()
+                start = time.monotonic()
+                try:
+                    ready = self._ready_waiter(tab, "keepalive", keepalive.ready)
+                    tab.goto(
+                        self._keepalive_full_url(keepalive.url),
+                        timeout=30000,
+                        wait_until="commit",
+                    )
+                    loading[tab] = (keepalive, start, ready)
+                    return
+                except Exception as e:
+                    self._record_keepalive(keepalive, start, error=self._error_message(e))
+
+        try:
+            for tab in tabs:
+                start_next(tab)
+            # 同步 API 只能在一个线程中使用：轮流检查各标签页，
+            # 某个页面就绪后立即让该标签页开始下一个 URL，慢页面不阻塞其他页面
+            with self.pacer.waiting():
+                while loading:
+                    finished = False
+                    for tab, (keepalive, start, ready) in list(loading.items()):
+                        try:
+                            if not ready.poll():
+                                continue
+                            self._record_keepalive(keepalive, start)
+                        except Exception as e:
+                            self._record_keepalive(keepalive, start, error=self._error_message(e))
+                        del loading[tab]
+                        finished = True
+                        start_next(tab)
+                    if loading and not finished:
+                        page.wait_for_timeout(Timeouts.READY_POLL)
+            # 页面已经就绪，快速模式下无需额外等待
+            self.pacer.pause(2)
+        finally:
+            for tab in tabs[1:]:
+                tab.close()
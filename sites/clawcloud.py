@@ -1,8 +1,15 @@
 """ClawCloud 站点适配器"""
 from sites.base import SiteAdapter
+from sites.async_base import AsyncSiteAdapter
 
 
 class ClawCloudAdapter(SiteAdapter):
     """ClawCloud 站点适配器"""
 
     pass
+
+
+class AsyncClawCloudAdapter(AsyncSiteAdapter):
+    """ClawCloud 站点适配器（异步版）"""
+
+    pass
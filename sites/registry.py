@@ -0,0 +1,37 @@
+"""站点适配器注册表"""
+from sites.base import SiteAdapter
+from sites.async_base import AsyncSiteAdapter
+from sites.clawcloud import ClawCloudAdapter, AsyncClawCloudAdapter
+
+# 站点名称（sites.yaml 中的键）到适配器类的映射，未注册的站点使用通用基类
+SITE_ADAPTERS: dict[str, type[SiteAdapter]] = {
+    "clawcloud": ClawCloudAdapter,
+}
+
+ASYNC_SITE_ADAPTERS: dict[str, type[AsyncSiteAdapter]] = {
+    "clawcloud": AsyncClawCloudAdapter,
+}
+
+
+def get_adapter_class(site_name: str) -> type[SiteAdapter]:
+    """获取站点对应的适配器类
+
+    Args:
+        site_name: 站点名称
+
+    Returns:
+        适配器类
+    """
+    return SITE_ADAPTERS.get(site_name, SiteAdapter)
+
+
+def get_async_adapter_class(site_name: str) -> type[AsyncSiteAdapter]:
+    """获取站点对应的异步适配器类
+
+    Args:
+        site_name: 站点名称
+
+    Returns:
+        异步适配器类
+    """
+    return ASYNC_SITE_ADAPTERS.get(site_name, AsyncSiteAdapter)
@@ -0,0 +1,139 @@
+"""站点适配器测试（异步版）
+
+用按脚本产生导航的模拟异步页面驱动 AsyncSiteAdapter.run，覆盖已登录、Cookie 有效直接授权、
+需要 GitHub 登录三条路径，以及回调与保活。
+"""
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from playwright.async_api import TimeoutError as PlaywrightTimeout
+
+from core.config_loader import parse_site_config
+from sites.clawcloud import AsyncClawCloudAdapter
+from tests.test_keepalive import SITE
+
+LOGIN_URL = "https://alpha.example.com/signin"
+CONSOLE_URL = "https://alpha.example.com/console"
+AUTHORIZE_URL = "https://github.com/login/oauth/authorize?client_id=abc"
+GITHUB_LOGIN_URL = "https://github.com/login?return_to=%2Flogin%2Foauth%2Fauthorize"
+
+
+class FakeSitePage:
+    """模拟异步页面：打开登录页时跳转到 landing，之后按顺序产生导航
+
+    所有定位器都指向同一个可见的按钮，点击记录在 clicks 中。
+    """
+
+    def __init__(self, landing, navigations=()):
+        self.url = "about:blank"
+        self.landing = landing
+        self.navigations = list(navigations)
+        self.clicks = 0
+        self.visited = []
+        self.context = Mock()
+        self.context.add_cookies = AsyncMock()
+        self.context.cookies = AsyncMock(return_value=[])
+        response = Mock(ok=True, status=200, body=AsyncMock(return_value=b"x" * 1024))
+        response.dispose = AsyncMock()
+        self.context.request.get = AsyncMock(return_value=response)
+        self.button = AsyncMock()
+        self.button.is_visible = AsyncMock(return_value=True)
+        self.button.click = AsyncMock(side_effect=self._click)
+        self.on = Mock()
+
+    def _click(self):
+        self.clicks += 1
+
+    def locator(self, selector):
+        locator = Mock()
+        locator.first = self.button
+        locator.or_ = Mock(return_value=locator)
+        return locator
+
+    async def goto(self, url, timeout=0, wait_until="load"):
+        self.visited.append(url)
+        self.url = self.landing if url == LOGIN_URL else url
+
+    async def wait_for_load_state(self, state, timeout=0):
+        pass
+
+    async def wait_for_url(self, predicate, timeout, wait_until):
+        while self.navigations:
+            self.url = self.navigations.pop(0)
+            if predicate(self.url):
+                return
+        raise PlaywrightTimeout("timeout")
+
+
+@pytest.fixture
+def adapter(monkeypatch, mock_credentials, mock_notifier):
+    """ClawCloud 异步适配器（快速模式，不启用缓存与拦截）"""
+    monkeypatch.setenv("ATHENA_FAST", "1")
+    monkeypatch.delenv("ATHENA_STORAGE_KEY", raising=False)
+    return AsyncClawCloudAdapter(parse_site_config(SITE), mock_credentials, mock_notifier)
+
+
+def run(adapter, page):
+    """执行完整登录流程"""
+    return asyncio.run(adapter.run(page.context, page))
+
+
+class TestAsyncSiteAdapter:
+    """测试异步版登录流程"""
+
+    def test_already_logged_in(self, adapter):
+        """测试站点会话有效时跳过 OAuth，直接保活并提取 Cookie"""
+        page = FakeSitePage(CONSOLE_URL)
+
+        assert run(adapter, page)
+        assert adapter.already_logged_in
+        assert page.clicks == 0
+        page.context.add_cookies.assert_awaited_once()
+        page.context.cookies.assert_awaited_once()
+        assert [r.success for r in adapter.keepalive_results] == [True, True]
+        assert adapter.run_metrics()["keepalive_bytes"] == 2048
+
+    def test_valid_cookie_authorizes(self, adapter):
+        """测试 GitHub 会话有效时点击 OAuth 按钮与授权按钮后等到回调"""
+        page = FakeSitePage(LOGIN_URL, [AUTHORIZE_URL, CONSOLE_URL])
+        adapter.github_auth.login = AsyncMock()
+
+        assert run(adapter, page)
+        assert page.clicks == 2
+        adapter.github_auth.login.assert_not_awaited()
+        assert page.url == CONSOLE_URL
+        assert len(adapter.keepalive_results) == 2
+
+    def test_github_login_then_callback(self, adapter):
+        """测试需要 GitHub 登录时先登录，再在授权页点击授权并等到回调"""
+        page = FakeSitePage(LOGIN_URL, [GITHUB_LOGIN_URL])
+
+        async def login(*args):
+            page.url = AUTHORIZE_URL
+            page.navigations = [CONSOLE_URL]
+            return True
+
+        adapter.github_auth.login = AsyncMock(side_effect=login)
+
+        assert run(adapter, page)
+        adapter.github_auth.login.assert_awaited_once()
+        assert page.clicks == 2  # OAuth 按钮 + 回调等待中的授权按钮
+        assert page.url == CONSOLE_URL
+
+    def test_github_login_failure(self, adapter):
+        """测试 GitHub 登录失败时不再等待回调与保活"""
+        page = FakeSitePage(LOGIN_URL, [GITHUB_LOGIN_URL])
+        adapter.github_auth.login = AsyncMock(return_value=False)
+
+        assert not run(adapter, page)
+        assert adapter.keepalive_results == []
+        page.context.cookies.assert_not_awaited()
+
+    def test_oauth_button_missing(self, adapter):
+        """测试找不到 OAuth 按钮时失败"""
+        page = FakeSitePage(LOGIN_URL)
+        page.button.wait_for = AsyncMock(side_effect=PlaywrightTimeout("timeout"))
+
+        assert not run(adapter, page)
+        assert page.clicks == 0
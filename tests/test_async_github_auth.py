@@ -0,0 +1,234 @@
+"""GitHub 认证器测试（异步版）
+
+与 tests/test_github_auth.py 的场景一一对应，并覆盖完整登录流程中的设备验证与 2FA 分支。
+"""
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+from playwright.async_api import TimeoutError as PlaywrightTimeout
+
+from core.async_github_auth import AsyncGitHubAuthenticator
+from core.pacing import Pacer
+from tests.test_github_auth import VERIFY_URL, make_response, run_fill_totp, run_mobile
+
+AUTHORIZE_URL = "https://github.com/login/oauth/authorize?client_id=1"
+
+
+def make_async_response(status, location=None, body=b"<html></html>"):
+    """构造异步探测响应"""
+    response = make_response(status, location, body)
+    response.body = AsyncMock(return_value=body)
+    return response
+
+
+def make_page(url, navigations=()):
+    """按顺序产生导航的模拟异步页面，所有候选输入框与按钮均可用"""
+    page = Mock()
+    page.url = url
+    navigations = list(navigations)
+
+    async def wait_for_url(predicate, timeout, wait_until):
+        while navigations:
+            page.url = navigations.pop(0)
+            if predicate(page.url):
+                return
+        raise PlaywrightTimeout("timeout")
+
+    async def goto(url, **kwargs):
+        page.url = url
+
+    page.wait_for_url = AsyncMock(side_effect=wait_for_url)
+    page.goto = AsyncMock(side_effect=goto)
+    page.wait_for_load_state = AsyncMock()
+    page.screenshot = AsyncMock()
+    page.evaluate = AsyncMock(return_value=100_000)
+    page.keyboard.press = AsyncMock()
+
+    locator = page.locator.return_value
+    locator.fill = AsyncMock()
+    locator.first.click = AsyncMock()
+    locator.first.is_visible = AsyncMock(return_value=False)
+    combined = locator.or_.return_value.or_.return_value.first
+    combined.wait_for = AsyncMock()
+    combined.fill = AsyncMock()
+    return page
+
+
+def run_login(auth, page, credentials, two_factor, device):
+    """执行完整登录流程"""
+    return asyncio.run(auth.login(page, credentials, two_factor, device))
+
+
+class TestLogin:
+    """测试完整登录流程"""
+
+    def test_password_login(
+        self, mock_notifier, mock_credentials, mock_two_factor_config, mock_device_config
+    ):
+        """测试无需额外验证的密码登录"""
+        page = make_page("https://github.com/login", [AUTHORIZE_URL])
+        auth = AsyncGitHubAuthenticator(mock_notifier, Pacer(fast=True))
+
+        assert run_login(auth, page, mock_credentials, mock_two_factor_config, mock_device_config)
+        page.locator.return_value.fill.assert_any_await(mock_credentials.username)
+        page.locator.return_value.fill.assert_any_await(mock_credentials.password)
+        assert auth.metrics == {"github_password_logins": 1}
+
+    def test_login_error(
+        self, mock_notifier, mock_credentials, mock_two_factor_config, mock_device_config
+    ):
+        """测试页面显示登录错误时失败"""
+        page = make_page("https://github.com/login", ["https://github.com/session"])
+        page.locator.return_value.first.is_visible = AsyncMock(return_value=True)
+        page.locator.return_value.first.inner_text = AsyncMock(return_value="Incorrect password")
+        auth = AsyncGitHubAuthenticator(mock_notifier, Pacer(fast=True))
+
+        assert not run_login(
+            auth, page, mock_credentials, mock_two_factor_config, mock_device_config
+        )
+
+    def test_device_verification_then_mobile_2fa(
+        self, mock_notifier, mock_credentials, mock_two_factor_config, mock_device_config
+    ):
+        """测试登录后依次经过设备验证与 GitHub Mobile 批准"""
+        page = make_page(
+            "https://github.com/login",
+            [VERIFY_URL, "https://github.com/sessions/two-factor/mobile", AUTHORIZE_URL],
+        )
+        auth = AsyncGitHubAuthenticator(mock_notifier, Pacer(fast=True))
+
+        assert run_login(auth, page, mock_credentials, mock_two_factor_config, mock_device_config)
+        assert page.url == AUTHORIZE_URL
+        assert auth.metrics["device_verifications"] == 1
+        assert auth.metrics["two_factor_mobile_approvals"] == 1
+
+    def test_totp_2fa(
+        self, mock_notifier, mock_credentials, mock_two_factor_config, mock_device_config
+    ):
+        """测试通过通知器收到验证码后填入并提交"""
+        page = make_page(
+            "https://github.com/login",
+            ["https://github.com/sessions/two-factor/app", AUTHORIZE_URL],
+        )
+        mock_notifier.wait_user_input = Mock(return_value="123456")
+        auth = AsyncGitHubAuthenticator(mock_notifier, Pacer(fast=True))
+
+        assert run_login(auth, page, mock_credentials, mock_two_factor_config, mock_device_config)
+        combined = page.locator.return_value.or_.return_value.or_.return_value.first
+        combined.fill.assert_awaited_once_with("123456")
+
+    def test_totp_timeout(
+        self, mock_notifier, mock_credentials, mock_two_factor_config, mock_device_config
+    ):
+        """测试等待验证码超时"""
+        page = make_page("https://github.com/login", ["https://github.com/sessions/two-factor/app"])
+        auth = AsyncGitHubAuthenticator(mock_notifier, Pacer(fast=True))
+
+        assert not run_login(
+            auth, page, mock_credentials, mock_two_factor_config, mock_device_config
+        )
+
+
+class TestEnsureLoggedIn:
+    """测试已有会话的判断"""
+
+    def test_existing_session_skips_login(
+        self, mock_notifier, mock_credentials, mock_two_factor_config, mock_device_config
+    ):
+        """测试登录页显示登录标识时不再输入凭据"""
+        page = make_page("https://github.com/")
+        page.wait_for_selector = AsyncMock()
+        auth = AsyncGitHubAuthenticator(mock_notifier, Pacer(fast=True))
+
+        assert asyncio.run(
+            auth.ensure_logged_in(
+                page, mock_credentials, mock_two_factor_config, mock_device_config
+            )
+        )
+        page.locator.return_value.fill.assert_not_awaited()
+
+
+class TestDeviceVerification:
+    """测试设备验证等待"""
+
+    def test_probe_detects_approval_without_reload(self, mock_notifier, mock_device_config):
+        """测试探测到重定向后直接跳转，不整页刷新"""
+        page = make_page(VERIFY_URL)
+        page.request.get = AsyncMock(
+            side_effect=[
+                make_async_response(200),
+                make_async_response(302, "/login/oauth/authorize?client_id=1"),
+            ]
+        )
+        auth = AsyncGitHubAuthenticator(mock_notifier)
+
+        assert asyncio.run(auth.handle_device_verification(page, mock_device_config))
+        page.goto.assert_awaited_once_with(AUTHORIZE_URL, wait_until="domcontentloaded")
+        page.reload.assert_not_called()
+        assert page.request.get.await_count == 2
+        assert "device_verification_bytes_saved" in auth.metrics
+
+    def test_navigation_detects_approval(self, mock_notifier, mock_device_config):
+        """测试页面自身离开验证页时立即通过"""
+        page = make_page(VERIFY_URL, ["https://github.com/"])
+        page.request.get = AsyncMock()
+        auth = AsyncGitHubAuthenticator(mock_notifier)
+
+        assert asyncio.run(auth.handle_device_verification(page, mock_device_config))
+        page.request.get.assert_not_awaited()
+
+
+class TestMobileTwoFactor:
+    """测试 GitHub Mobile 批准等待"""
+
+    MOBILE_URL = "https://github.com/sessions/two-factor/mobile"
+
+    def test_approval_waits_on_single_navigation(self, mock_notifier):
+        """测试批准通过一次导航事件检测，并记录批准耗时"""
+        page = make_page(self.MOBILE_URL, [AUTHORIZE_URL])
+        auth = AsyncGitHubAuthenticator(mock_notifier)
+
+        assert asyncio.run(run_mobile(auth, page))
+        page.wait_for_url.assert_awaited_once()
+        assert page.wait_for_url.call_args.kwargs["timeout"] == 120000
+        assert auth.metrics["two_factor_mobile_approvals"] == 1
+
+    def test_redirect_to_login_fails(self, mock_notifier):
+        """测试被重定向回登录页时失败"""
+        page = make_page(self.MOBILE_URL, ["https://github.com/login"])
+
+        assert not asyncio.run(run_mobile(AsyncGitHubAuthenticator(mock_notifier), page))
+
+    def test_timeout(self, mock_notifier):
+        """测试超时未批准"""
+        page = make_page(self.MOBILE_URL)
+        auth = AsyncGitHubAuthenticator(mock_notifier)
+
+        assert not asyncio.run(run_mobile(auth, page))
+        assert auth.metrics == {}
+
+
+class TestFillTotpCode:
+    """测试 TOTP 输入框查找"""
+
+    def test_single_wait_for_all_inputs(self, mock_notifier):
+        """测试所有候选输入框共用一次等待"""
+        page = make_page("https://github.com/sessions/two-factor/app", [AUTHORIZE_URL])
+        combined = page.locator.return_value.or_.return_value.or_.return_value.first
+        page.locator.return_value.first.click = AsyncMock(side_effect=PlaywrightTimeout("timeout"))
+        auth = AsyncGitHubAuthenticator(mock_notifier, Pacer(fast=True))
+
+        assert asyncio.run(run_fill_totp(auth, page))
+        combined.wait_for.assert_awaited_once()
+        combined.fill.assert_awaited_once_with("123456")
+        page.keyboard.press.assert_awaited_once_with("Enter")
+
+    def test_input_not_found(self, mock_notifier):
+        """测试没有可见的输入框"""
+        page = make_page("https://github.com/sessions/two-factor/app")
+        combined = page.locator.return_value.or_.return_value.or_.return_value.first
+        combined.wait_for = AsyncMock(side_effect=PlaywrightTimeout("timeout"))
+        auth = AsyncGitHubAuthenticator(mock_notifier, Pacer(fast=True))
+
+        assert not asyncio.run(run_fill_totp(auth, page))
+        combined.fill.assert_not_awaited()
@@ -0,0 +1,205 @@
+"""OAuth 流程控制器测试（异步版）
+
+与 tests/test_oauth_handler.py 的场景一一对应，模拟页面复用同步版并把 I/O 方法改为协程。
+"""
+import asyncio
+from unittest.mock import AsyncMock
+
+from playwright.async_api import TimeoutError as PlaywrightTimeout
+
+from core.async_oauth_handler import AsyncOAuthFlowController
+from tests.test_oauth_handler import (
+    AUTHORIZE_URL,
+    CALLBACK_URL,
+    FakeButtonPage,
+    FakeLocator,
+    FakePage,
+)
+
+
+class AsyncFakePage(FakePage):
+    """按顺序产生导航的模拟异步页面"""
+
+    def __init__(self, url, navigations):
+        super().__init__(url, navigations)
+        self.authorize_button = AsyncMock()
+        self.authorize_button.is_visible = AsyncMock(return_value=True)
+
+    async def wait_for_url(self, predicate, timeout, wait_until):
+        super().wait_for_url(predicate, timeout, wait_until)
+
+    async def wait_for_load_state(self, state, timeout):
+        pass
+
+
+class AsyncFakeLocator(FakeLocator):
+    """模拟异步定位器（first / or_ 与 Playwright 一样仍是同步的）"""
+
+    async def is_visible(self):
+        return super().is_visible()
+
+    async def wait_for(self, state, timeout):
+        self.page.waits.append(timeout)
+        if not FakeLocator.is_visible(self):
+            raise PlaywrightTimeout("timeout")
+
+    async def click(self):
+        super().click()
+
+
+class AsyncFakeButtonPage(FakeButtonPage):
+    """按 DOM 顺序排列的元素，部分隐藏（异步版）"""
+
+    locator_class = AsyncFakeLocator
+
+
+class TestWaitCallback:
+    """测试基于导航事件的回调等待"""
+
+    def test_returns_on_callback_navigation(self, mock_notifier):
+        """测试回调页面提交后立即返回"""
+        page = AsyncFakePage("https://github.com/session", [CALLBACK_URL])
+        controller = AsyncOAuthFlowController(mock_notifier)
+
+        assert asyncio.run(controller.wait_callback(page, ["example.com"], 60))
+        assert len(page.waits) == 1
+        assert 59000 < page.waits[0] <= 60000
+
+    def test_authorizes_once_per_visit(self, mock_notifier):
+        """测试每次进入授权页只点击一次授权按钮"""
+        page = AsyncFakePage(AUTHORIZE_URL, [AUTHORIZE_URL, CALLBACK_URL])
+        controller = AsyncOAuthFlowController(mock_notifier)
+
+        assert asyncio.run(controller.wait_callback(page, ["example.com"], 60))
+        page.authorize_button.click.assert_awaited_once()
+
+    def _stuck_on_authorize(self, monkeypatch, navigations=()):
+        """停留在授权页、使用模拟时钟的页面"""
+        page = AsyncFakePage(AUTHORIZE_URL, navigations)
+        page.clock = [0.0]
+        monkeypatch.setattr("core.oauth_handler.time.monotonic", lambda: page.clock[0])
+        return page
+
+    def test_does_not_resubmit_same_document(self, mock_notifier, monkeypatch):
+        """测试点击后停留在同一文档时按间隔等待，但不重复提交授权"""
+        page = self._stuck_on_authorize(monkeypatch)
+        controller = AsyncOAuthFlowController(mock_notifier)
+
+        assert not asyncio.run(controller.wait_callback(page, ["example.com"], 3))
+        page.authorize_button.click.assert_awaited_once()
+        assert page.waits[-3:] == [1000, 1000, 1000]
+
+    def test_retries_when_authorize_page_rerenders(self, mock_notifier, monkeypatch):
+        """测试同一 URL 提交了新文档（重新渲染）时重新点击"""
+        page = self._stuck_on_authorize(monkeypatch, [AUTHORIZE_URL])
+        controller = AsyncOAuthFlowController(mock_notifier)
+
+        assert not asyncio.run(controller.wait_callback(page, ["example.com"], 3))
+        assert page.authorize_button.click.await_count == 2
+
+    def test_retries_when_button_missing(self, mock_notifier, monkeypatch):
+        """测试上次没有找到授权按钮时重新尝试"""
+        page = self._stuck_on_authorize(monkeypatch)
+        page.authorize_button.wait_for.side_effect = [PlaywrightTimeout("timeout"), None, None]
+        controller = AsyncOAuthFlowController(mock_notifier)
+
+        assert not asyncio.run(controller.wait_callback(page, ["example.com"], 3))
+        page.authorize_button.click.assert_awaited_once()
+        assert page.authorize_button.wait_for.await_count == 2
+
+    def test_negative_patterns_ignored(self, mock_notifier):
+        """测试反向模式不参与回调判断"""
+        page = AsyncFakePage("https://console.example.com/signin", [])
+        controller = AsyncOAuthFlowController(mock_notifier)
+
+        assert asyncio.run(controller.wait_callback(page, ["example.com", "!signin"], 1))
+        assert not asyncio.run(controller.wait_callback(page, ["!signin"], 0))
+
+
+class TestHandleAuthorization:
+    """测试授权页处理"""
+
+    def test_clicks_and_waits_for_ready(self, mock_notifier, monkeypatch):
+        """测试点击授权后等待离开授权页，再等待就绪"""
+        monkeypatch.setenv("ATHENA_FAST", "1")
+        page = AsyncFakePage(AUTHORIZE_URL, [CALLBACK_URL])
+        controller = AsyncOAuthFlowController(mock_notifier)
+
+        assert asyncio.run(controller.handle_authorization(page))
+        page.authorize_button.click.assert_awaited_once()
+        assert page.url == CALLBACK_URL
+
+    def test_click_not_repeated_while_waiting_callback(self, mock_notifier, monkeypatch):
+        """测试已点击过的授权页不会在等待回调时再次提交"""
+        monkeypatch.setenv("ATHENA_FAST", "1")
+        page = AsyncFakePage(AUTHORIZE_URL, [])
+        page.clock = [0.0]
+        monkeypatch.setattr("core.oauth_handler.time.monotonic", lambda: page.clock[0])
+        controller = AsyncOAuthFlowController(mock_notifier)
+
+        async def authorize_then_wait():
+            await controller.handle_authorization(page)
+            return await controller.wait_callback(page, ["example.com"], 2)
+
+        assert not asyncio.run(authorize_then_wait())
+        page.authorize_button.click.assert_awaited_once()
+
+    def test_skips_other_pages(self, mock_notifier):
+        """测试不在授权页时直接返回"""
+        page = AsyncFakePage(CALLBACK_URL, [])
+
+        assert asyncio.run(AsyncOAuthFlowController(mock_notifier).handle_authorization(page))
+        page.authorize_button.click.assert_not_awaited()
+
+
+class TestClickOAuthButton:
+    """测试合并所有候选选择器的 OAuth 按钮点击"""
+
+    SELECTORS = ['button:has-text("GitHub")', 'a:has-text("GitHub")', '[data-provider="github"]']
+
+    def click(self, mock_notifier, page):
+        """点击 OAuth 按钮"""
+        controller = AsyncOAuthFlowController(mock_notifier)
+        return asyncio.run(controller.click_oauth_button(page, self.SELECTORS))
+
+    def test_single_wait_for_last_selector(self, mock_notifier, capsys):
+        """测试命中最后一个选择器时也只等待一次，并输出命中的选择器"""
+        page = AsyncFakeButtonPage([('[data-provider="github"]', True)])
+
+        assert self.click(mock_notifier, page)
+        assert len(page.waits) == 1
+        assert page.clicked == [(0, '[data-provider="github"]')]
+        assert '[data-provider="github"]' in capsys.readouterr().out
+
+    def test_skips_hidden_earlier_match(self, mock_notifier):
+        """测试 DOM 中更靠前的隐藏匹配不影响后面可见的候选"""
+        page = AsyncFakeButtonPage(
+            [
+                ('a:has-text("GitHub")', False),
+                ('button:has-text("GitHub")', False),
+                ('button:has-text("GitHub")', True),
+            ]
+        )
+
+        assert self.click(mock_notifier, page)
+        assert page.clicked == [(2, 'button:has-text("GitHub")')]
+
+    def test_button_not_found(self, mock_notifier):
+        """测试没有候选按钮可见"""
+        page = AsyncFakeButtonPage([('button:has-text("GitHub")', False)])
+
+        assert not self.click(mock_notifier, page)
+        assert len(page.waits) == 1
+
+
+class TestClickAuthorize:
+    """测试授权按钮的可见性判断"""
+
+    def test_skips_hidden_earlier_match(self, mock_notifier):
+        """测试隐藏的授权按钮副本不影响后面可见的按钮"""
+        page = AsyncFakeButtonPage(
+            [('button[name="authorize"]', False), ('button:has-text("Authorize")', True)]
+        )
+
+        assert asyncio.run(AsyncOAuthFlowController(mock_notifier)._click_authorize(page))
+        assert page.clicked == [(1, 'button:has-text("Authorize")')]
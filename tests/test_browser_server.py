@@ -0,0 +1,51 @@
+"""常驻浏览器服务探测测试"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from core.browser_server import probe_server, server_url
+
+
+class VersionHandler(BaseHTTPRequestHandler):
+    """模拟 Chromium 的 /json/version 接口"""
+
+    def do_GET(self):
+        body = json.dumps({"webSocketDebuggerUrl": "ws://127.0.0.1/devtools/browser/abc"})
+        self.send_response(200)
+        self.end_headers()
+        self.wfile.write(body.encode())
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def cdp_server():
+    """本地模拟 CDP 服务"""
+    server = HTTPServer(("127.0.0.1", 0), VersionHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+def test_probe_reachable(cdp_server):
+    """测试服务可达时返回 WebSocket 端点"""
+    assert probe_server(cdp_server) == "ws://127.0.0.1/devtools/browser/abc"
+
+
+def test_probe_unreachable():
+    """测试服务不可达时返回 None"""
+    server = HTTPServer(("127.0.0.1", 0), VersionHandler)
+    port = server.server_port
+    server.server_close()
+
+    assert probe_server(f"http://127.0.0.1:{port}") is None
+
+
+def test_server_url_from_env(monkeypatch):
+    """测试 BROWSER_SERVER_URL 覆盖默认地址"""
+    monkeypatch.setenv("BROWSER_SERVER_URL", "http://127.0.0.1:9999/")
+    assert server_url() == "http://127.0.0.1:9999"
@@ -0,0 +1,124 @@
+"""站点配置加载测试"""
+import pytest
+from core.config_loader import (
+    load_site_config,
+    load_enabled_sites,
+    parse_ready_specs,
+    parse_block_resources,
+    parse_http_oauth,
+)
+
+SITES_YAML = """
+alpha:
+  name: "Alpha"
+  enabled: true
+  login_url: "https://alpha.example.com/login"
+  success_url_patterns: ["alpha.example.com", "!login"]
+  oauth_button_selectors: ['button:has-text("GitHub")']
+  two_factor: {strategy: "auto", mobile_wait: 120, totp_wait: 120}
+  device_verification: {wait: 30}
+  timeouts: {page_load: 30, oauth_callback: 60, network_idle: 15}
+  keepalive_urls:
+    - {url: "/", name: "首页"}
+    - url: "/apps"
+      name: "应用列表"
+      ready: {response: "/api/apps"}
+  cookie_targets:
+    - {type: "file", path: "./cookies/alpha.json"}
+  ready:
+    login_page: {selector: 'button:has-text("GitHub")', timeout: 5}
+  block_resources:
+    types: ["image", "font"]
+    deny: ["*google-analytics.com*"]
+  http_oauth:
+    start_url: "https://alpha.example.com/api/auth/github"
+
+beta:
+  name: "Beta"
+  enabled: false
+  login_url: "https://beta.example.com/login"
+  success_url_patterns: ["beta.example.com"]
+  oauth_button_selectors: ["button"]
+  two_factor: {strategy: "auto", mobile_wait: 120, totp_wait: 120}
+  device_verification: {wait: 30}
+  timeouts: {page_load: 30, oauth_callback: 60, network_idle: 15}
+"""
+
+
+class TestConfigLoader:
+    """测试站点配置加载"""
+
+    @pytest.fixture
+    def sites_file(self, tmp_path):
+        """临时站点配置文件"""
+        path = tmp_path / "sites.yaml"
+        path.write_text(SITES_YAML, encoding="utf-8")
+        return str(path)
+
+    def test_load_site_config(self, sites_file):
+        """测试加载单个站点"""
+        config = load_site_config("alpha", sites_file)
+        assert config.name == "Alpha"
+        assert config.keepalive_urls[0].name == "首页"
+        assert config.cookie_targets[0].path == "./cookies/alpha.json"
+        assert config.cookie_names == ["user_session"]
+
+    def test_load_missing_site(self, sites_file):
+        """测试站点未配置"""
+        with pytest.raises(ValueError, match="未配置"):
+            load_site_config("gamma", sites_file)
+
+    def test_load_disabled_site(self, sites_file):
+        """测试站点已禁用"""
+        with pytest.raises(ValueError, match="已禁用"):
+            load_site_config("beta", sites_file)
+
+    def test_load_enabled_sites(self, sites_file):
+        """测试只加载启用的站点"""
+        sites = load_enabled_sites(sites_file)
+        assert list(sites) == ["alpha"]
+
+    def test_ready_specs(self, sites_file):
+        """测试解析各步骤与保活 URL 的就绪条件"""
+        config = load_site_config("alpha", sites_file)
+
+        assert config.ready["login_page"].selector == 'button:has-text("GitHub")'
+        assert config.ready["login_page"].timeout == 5
+        assert "keepalive" not in config.ready
+        assert config.keepalive_urls[0].ready is None
+        assert config.keepalive_urls[1].ready.response == "/api/apps"
+
+    @pytest.mark.parametrize(
+        "data, message",
+        [({"dashboard": {"url": "/apps"}}, "未知的就绪步骤"), ({"login_page": {}}, "至少需要")],
+    )
+    def test_invalid_ready_specs(self, data, message):
+        """测试无效的就绪条件"""
+        with pytest.raises(ValueError, match=message):
+            parse_ready_specs(data)
+
+    def test_block_resources(self, sites_file):
+        """测试解析请求拦截配置"""
+        config = load_site_config("alpha", sites_file)
+
+        assert config.block_resources.types == ["image", "font"]
+        assert config.block_resources.deny == ["*google-analytics.com*"]
+        assert config.block_resources.allow == []
+        assert config.block_resources.render_on_failure is True
+        assert parse_block_resources(None) is None
+
+    def test_invalid_resource_type(self):
+        """测试无效的资源类型"""
+        with pytest.raises(ValueError, match="未知的资源类型"):
+            parse_block_resources({"types": ["images"]})
+
+    def test_http_oauth(self, sites_file):
+        """测试解析 HTTP OAuth 配置"""
+        config = load_site_config("alpha", sites_file)
+
+        assert config.http_oauth.start_url == "https://alpha.example.com/api/auth/github"
+        assert config.http_oauth.max_redirects == 10
+        assert parse_http_oauth(None) is None
+
+        with pytest.raises(ValueError, match="start_url"):
+            parse_http_oauth({"max_redirects": 5})
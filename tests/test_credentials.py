@@ -0,0 +1,76 @@
+"""多账号凭据文件测试"""
+import pytest
+from core.credentials import expand_env, load_accounts
+from core.jobs import build_account_jobs
+from core.config_loader import load_enabled_sites
+
+CREDENTIALS_YAML = """
+accounts:
+  - name: "alice"
+    username: "${TEST_GH_USER}"
+    password: "${TEST_GH_PASS}"
+    session_cookie: "${TEST_GH_SESSION}"
+    cookie_targets:
+      - {type: "github_secret", secret_name: "GH_SESSION_ALICE"}
+  - name: "bob"
+    username: "bob"
+    password: "password456"
+    sites: ["other"]
+"""
+
+
+class TestCredentials:
+    """测试凭据文件加载"""
+
+    @pytest.fixture
+    def credentials_file(self, tmp_path, monkeypatch):
+        """临时凭据文件"""
+        monkeypatch.setenv("TEST_GH_USER", "alice")
+        monkeypatch.setenv("TEST_GH_PASS", "password123")
+        monkeypatch.delenv("TEST_GH_SESSION", raising=False)
+        path = tmp_path / "credentials.yaml"
+        path.write_text(CREDENTIALS_YAML, encoding="utf-8")
+        return str(path)
+
+    def test_expand_env(self, monkeypatch):
+        """测试环境变量展开"""
+        monkeypatch.setenv("TEST_VALUE", "abc")
+        monkeypatch.delenv("TEST_MISSING", raising=False)
+        assert expand_env("${TEST_VALUE}-x") == "abc-x"
+        assert expand_env("${TEST_MISSING}") == ""
+        assert expand_env(None) == ""
+
+    def test_load_accounts(self, credentials_file):
+        """测试加载多个账号"""
+        accounts = load_accounts(credentials_file)
+        assert [a.name for a in accounts] == ["alice", "bob"]
+        assert accounts[0].credentials.username == "alice"
+        assert accounts[0].credentials.session_cookie is None
+        assert accounts[0].cookie_targets[0].secret_name == "GH_SESSION_ALICE"
+        assert accounts[1].sites == ["other"]
+
+    def test_invalid_account(self, tmp_path):
+        """测试凭据缺失时报错"""
+        path = tmp_path / "credentials.yaml"
+        path.write_text('accounts:\n  - name: "x"\n    username: "x"\n', encoding="utf-8")
+        with pytest.raises(ValueError, match="'x'"):
+            load_accounts(str(path))
+
+    def test_legacy_github_section(self, tmp_path):
+        """测试兼容旧版单账号格式"""
+        path = tmp_path / "credentials.yaml"
+        path.write_text(
+            'github:\n  username: "carol"\n  password: "password789"\n', encoding="utf-8"
+        )
+        accounts = load_accounts(str(path))
+        assert accounts[0].name == "default"
+
+    def test_build_account_jobs(self, credentials_file):
+        """测试账号 × 站点任务生成"""
+        accounts = load_accounts(credentials_file)
+        sites = load_enabled_sites("config/sites.yaml")
+        jobs = build_account_jobs(sites, accounts)
+
+        # bob 只运行 other 站点，不在启用站点中
+        assert [job.key for job in jobs] == [f"alice:{name}" for name in sites]
+        assert jobs[0].config.cookie_targets[0].secret_name == "GH_SESSION_ALICE"
@@ -0,0 +1,147 @@
+"""GitHub 认证器测试"""
+from unittest.mock import Mock
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeout
+
+from core.github_auth import GitHubAuthenticator
+from core.pacing import Pacer
+
+VERIFY_URL = "https://github.com/sessions/verified-device"
+
+
+def make_response(status, location=None, body=b"<html></html>"):
+    """构造探测响应"""
+    response = Mock()
+    response.status = status
+    response.headers = {"location": location} if location else {}
+    response.body = Mock(return_value=body)
+    return response
+
+
+def run_mobile(auth, page, timeout=120):
+    """执行 GitHub Mobile 批准等待步骤（异步版返回协程）"""
+    return auth._run(auth._mobile_2fa_steps(page, timeout))
+
+
+def run_fill_totp(auth, page, code="123456"):
+    """执行填写并提交 TOTP 验证码的步骤（异步版返回协程）"""
+    return auth._run(auth._fill_totp_code_steps(page, code))
+
+
+class TestDeviceVerification:
+    """测试设备验证等待"""
+
+    def make_page(self, responses):
+        """停留在设备验证页、由探测结果决定是否通过的模拟页面"""
+        page = Mock()
+        page.url = VERIFY_URL
+        page.evaluate = Mock(return_value=100_000)
+        page.wait_for_url = Mock(side_effect=PlaywrightTimeout("timeout"))
+        page.request.get = Mock(side_effect=responses)
+
+        def goto(url, **kwargs):
+            page.url = url
+
+        page.goto = Mock(side_effect=goto)
+        return page
+
+    def test_probe_detects_approval_without_reload(self, mock_notifier, mock_device_config):
+        """测试探测到重定向后直接跳转，不整页刷新"""
+        page = self.make_page(
+            [make_response(200), make_response(302, "/login/oauth/authorize?client_id=1")]
+        )
+        auth = GitHubAuthenticator(mock_notifier)
+
+        assert auth.handle_device_verification(page, mock_device_config)
+        page.goto.assert_called_once_with(
+            "https://github.com/login/oauth/authorize?client_id=1", wait_until="domcontentloaded"
+        )
+        page.reload.assert_not_called()
+        assert page.request.get.call_count == 2
+        assert "device_verification_bytes_saved" in auth.metrics
+
+    def test_navigation_detects_approval(self, mock_notifier, mock_device_config):
+        """测试页面自身离开验证页时立即通过"""
+        page = self.make_page([])
+
+        def wait_for_url(predicate, **kwargs):
+            page.url = "https://github.com/"
+            assert predicate(page.url)
+
+        page.wait_for_url = Mock(side_effect=wait_for_url)
+        auth = GitHubAuthenticator(mock_notifier)
+
+        assert auth.handle_device_verification(page, mock_device_config)
+        page.request.get.assert_not_called()
+
+
+class TestMobileTwoFactor:
+    """测试 GitHub Mobile 批准等待"""
+
+    def make_page(self, redirect_to):
+        """等待一次导航后跳转到 redirect_to 的模拟页面"""
+        page = Mock()
+        page.url = "https://github.com/sessions/two-factor/mobile"
+
+        def wait_for_url(predicate, timeout, wait_until):
+            if redirect_to is None:
+                raise PlaywrightTimeout("timeout")
+            page.url = redirect_to
+            assert predicate(page.url)
+
+        page.wait_for_url = Mock(side_effect=wait_for_url)
+        return page
+
+    def test_approval_waits_on_single_navigation(self, mock_notifier):
+        """测试批准通过一次导航事件检测，并记录批准耗时"""
+        page = self.make_page("https://github.com/login/oauth/authorize?client_id=1")
+        auth = GitHubAuthenticator(mock_notifier)
+
+        assert run_mobile(auth, page)
+        page.wait_for_url.assert_called_once()
+        assert page.wait_for_url.call_args.kwargs["timeout"] == 120000
+        assert auth.metrics["two_factor_mobile_approvals"] == 1
+
+    def test_redirect_to_login_fails(self, mock_notifier):
+        """测试被重定向回登录页时失败"""
+        page = self.make_page("https://github.com/login")
+
+        assert not run_mobile(GitHubAuthenticator(mock_notifier), page)
+
+    def test_timeout(self, mock_notifier):
+        """测试超时未批准"""
+        page = self.make_page(None)
+        auth = GitHubAuthenticator(mock_notifier)
+
+        assert not run_mobile(auth, page)
+        assert auth.metrics == {}
+
+
+class TestFillTotpCode:
+    """测试 TOTP 输入框查找"""
+
+    def test_single_wait_for_all_inputs(self, mock_notifier):
+        """测试所有候选输入框共用一次等待"""
+        page = Mock()
+        page.url = "https://github.com/sessions/two-factor/app"
+        combined = page.locator.return_value.or_.return_value.or_.return_value.first
+
+        def press_enter(key):
+            page.url = "https://github.com/login/oauth/authorize?client_id=1"
+
+        page.locator.return_value.first.click = Mock(side_effect=PlaywrightTimeout("timeout"))
+        page.keyboard.press = Mock(side_effect=press_enter)
+        auth = GitHubAuthenticator(mock_notifier, Pacer(fast=True))
+
+        assert run_fill_totp(auth, page)
+        combined.wait_for.assert_called_once()
+        combined.fill.assert_called_once_with("123456")
+
+    def test_input_not_found(self, mock_notifier):
+        """测试没有可见的输入框"""
+        page = Mock()
+        combined = page.locator.return_value.or_.return_value.or_.return_value.first
+        combined.wait_for = Mock(side_effect=PlaywrightTimeout("timeout"))
+
+        assert not run_fill_totp(GitHubAuthenticator(mock_notifier, Pacer(fast=True)), page)
+        combined.fill.assert_not_called()
@@ -0,0 +1,76 @@
+"""HTTP OAuth 授权链测试"""
+from unittest.mock import Mock
+
+import pytest
+
+from core.http_oauth import HttpOAuthChain, HttpOAuthFallback
+from core.types import HttpOAuthConfig
+
+START_URL = "https://alpha.example.com/api/auth/github"
+AUTHORIZE_URL = "https://github.com/login/oauth/authorize?client_id=abc"
+CALLBACK_URL = "https://alpha.example.com/api/auth/callback?code=xyz"
+
+
+def _redirect(location: str) -> Mock:
+    """构造 302 响应"""
+    return Mock(status_code=302, is_redirect=True, headers={"Location": location})
+
+
+def _page(status_code: int = 200, text: str = "<html>dashboard</html>") -> Mock:
+    """构造非重定向响应"""
+    return Mock(status_code=status_code, is_redirect=False, headers={}, text=text)
+
+
+def is_success_url(url: str) -> bool:
+    """站点的 success_url_patterns: alpha.example.com 且不含 login"""
+    return "alpha.example.com" in url and "login" not in url
+
+
+class TestHttpOAuthChain:
+    """测试 HttpOAuthChain.run"""
+
+    def _chain(self, *responses, max_redirects: int = 10) -> HttpOAuthChain:
+        """构造按顺序返回 responses 的授权链"""
+        chain = HttpOAuthChain(HttpOAuthConfig(START_URL, max_redirects), "session")
+        chain.session.get = Mock(side_effect=list(responses))
+        return chain
+
+    def test_follows_redirects_to_dashboard(self):
+        """测试已授权时逐跳跟随重定向到控制台"""
+        chain = self._chain(
+            _redirect(AUTHORIZE_URL), _redirect(CALLBACK_URL), _redirect("/dashboard"), _page()
+        )
+
+        assert chain.run(is_success_url) == "https://alpha.example.com/dashboard"
+        assert chain.requests == 4
+        assert chain.session.get.call_args_list[0].args == (START_URL,)
+        assert chain.session.get.call_args.kwargs["allow_redirects"] is False
+
+    @pytest.mark.parametrize(
+        "responses, message",
+        [
+            ((_redirect("https://github.com/login?return_to=x"),), "需要登录"),
+            ((_redirect(AUTHORIZE_URL), _page()), "尚未授权"),
+            ((_redirect(CALLBACK_URL), _page(500)), "意外的状态码"),
+            ((_redirect("https://alpha.example.com/login"), _page()), "意外的页面"),
+            (
+                (_redirect(CALLBACK_URL), _page(text='<form action="/session" method="post">')),
+                "GitHub 登录/授权页",
+            ),
+            (
+                (_page(text='<button class="js-oauth-authorize-btn">Authorize</button>'),),
+                "GitHub 登录/授权页",
+            ),
+        ],
+    )
+    def test_fallback(self, responses, message):
+        """测试链路中的意外情况回退浏览器"""
+        with pytest.raises(HttpOAuthFallback, match=message):
+            self._chain(*responses).run(is_success_url)
+
+    def test_too_many_redirects(self):
+        """测试重定向次数超限"""
+        chain = self._chain(*[_redirect(START_URL)] * 3, max_redirects=2)
+
+        with pytest.raises(HttpOAuthFallback, match="重定向超过 2 次"):
+            chain.run(is_success_url)
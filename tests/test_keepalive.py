@@ -0,0 +1,164 @@
+"""保活测试"""
+import time
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+from playwright.sync_api import TimeoutError as PlaywrightTimeout
+
+from core.config_loader import parse_site_config
+from sites.clawcloud import ClawCloudAdapter, AsyncClawCloudAdapter
+
+SITE = {
+    "name": "Alpha",
+    "login_url": "https://alpha.example.com/signin",
+    "success_url_patterns": ["alpha.example.com", "!signin"],
+    "oauth_button_selectors": ["button"],
+    "two_factor": {"strategy": "auto", "mobile_wait": 120, "totp_wait": 120},
+    "device_verification": {"wait": 30},
+    "timeouts": {"page_load": 30, "oauth_callback": 60, "network_idle": 15},
+    "keepalive_urls": [
+        {"url": "/", "name": "控制台", "mode": "http"},
+        {"url": "/apps", "name": "应用列表", "mode": "http"},
+    ],
+}
+
+
+def _api_response(status: int, body: bytes = b"") -> Mock:
+    """构造 APIResponse"""
+    return Mock(ok=200 <= status < 300, status=status, body=Mock(return_value=body))
+
+
+class TestHttpKeepalive:
+    """测试 mode: http 的保活"""
+
+    @pytest.fixture
+    def adapter(self, mock_credentials, mock_notifier):
+        """ClawCloud 适配器实例"""
+        return ClawCloudAdapter(parse_site_config(SITE), mock_credentials, mock_notifier)
+
+    def test_requests_without_navigation(self, adapter, mock_playwright_page):
+        """测试通过请求客户端访问，不在页面中导航"""
+        request = mock_playwright_page.context.request
+        request.get.side_effect = [_api_response(200, b"x" * 2048), _api_response(500)]
+
+        adapter._do_post_login(mock_playwright_page)
+
+        mock_playwright_page.goto.assert_not_called()
+        assert request.get.call_args_list[1].args == ("https://alpha.example.com/apps",)
+        first, second = adapter.keepalive_results
+        assert first.success and first.bytes == 2048
+        assert not second.success and second.error == "HTTP 500"
+        assert adapter.run_metrics()["keepalive_bytes"] == 2048
+        assert "控制台" in adapter._keepalive_report()
+
+    def test_invalid_mode(self):
+        """测试无效的保活方式"""
+        site = {**SITE, "keepalive_urls": [{"url": "/", "name": "首页", "mode": "fetch"}]}
+        with pytest.raises(ValueError, match="未知的保活方式"):
+            parse_site_config(site)
+
+
+class FakeTab:
+    """按 URL 模拟加载耗时的异步标签页"""
+
+    def __init__(self, context, delays: dict[str, float]):
+        self.context = context
+        self.delays = delays
+        self.closed = False
+
+    async def goto(self, url: str, timeout: int = 0) -> None:
+        await asyncio.sleep(self.delays.get(url, 0))
+
+    async def wait_for_load_state(self, state: str, timeout: int = 0) -> None:
+        pass
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeSyncTab:
+    """按 URL 模拟加载耗时的同步标签页：goto 立即返回，达到耗时后才进入 networkidle"""
+
+    def __init__(self, context, delays: dict[str, float]):
+        self.context = context
+        self.delays = delays
+        self.loaded_at = 0.0
+        self.closed = False
+
+    def goto(self, url: str, timeout: int = 0, wait_until: str = "load") -> None:
+        self.loaded_at = time.monotonic() + self.delays.get(url, 0)
+
+    def wait_for_load_state(self, state: str, timeout: int = 0) -> None:
+        if time.monotonic() < self.loaded_at:
+            raise PlaywrightTimeout("networkidle")
+
+    def wait_for_timeout(self, timeout: float) -> None:
+        time.sleep(timeout / 1000)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class TestParallelKeepalive:
+    """测试 mode: page 的保活在多个标签页中并行"""
+
+    def test_slow_url_does_not_delay_others(self, monkeypatch, mock_credentials, mock_notifier):
+        """测试总耗时接近最慢的 URL，而不是所有 URL 之和"""
+        monkeypatch.setenv("ATHENA_FAST", "1")
+        urls = [{"url": f"/page{i}", "name": f"页面{i}"} for i in range(4)]
+        config = parse_site_config({**SITE, "keepalive_urls": urls, "keepalive_parallelism": 3})
+        adapter = AsyncClawCloudAdapter(config, mock_credentials, mock_notifier)
+
+        # page0 耗时 0.3 秒，其余 0.1 秒；串行需要 0.6 秒
+        delays = {f"https://alpha.example.com/page{i}": 0.1 for i in range(1, 4)}
+        delays["https://alpha.example.com/page0"] = 0.3
+        context = Mock()
+        page = FakeTab(context, delays)
+        extra_tabs = []
+
+        async def new_page():
+            extra_tabs.append(FakeTab(context, delays))
+            return extra_tabs[-1]
+
+        context.new_page = new_page
+
+        start = time.monotonic()
+        asyncio.run(adapter._do_post_login(page))
+        elapsed = time.monotonic() - start
+
+        assert len(adapter.keepalive_results) == 4
+        assert all(r.success for r in adapter.keepalive_results)
+        assert adapter.keepalive_results[-1].name == "页面0"
+        assert elapsed < 0.45
+        assert len(extra_tabs) == 2 and all(tab.closed for tab in extra_tabs)
+
+    def test_sync_free_tab_takes_next_url(self, monkeypatch, mock_credentials, mock_notifier):
+        """测试同步版：慢页面占用一个标签页时，其余 URL 在另一个标签页中依次完成"""
+        monkeypatch.setenv("ATHENA_FAST", "1")
+        urls = [{"url": f"/page{i}", "name": f"页面{i}"} for i in range(5)]
+        config = parse_site_config({**SITE, "keepalive_urls": urls, "keepalive_parallelism": 2})
+        adapter = ClawCloudAdapter(config, mock_credentials, mock_notifier)
+
+        # page0 耗时 0.5 秒，其余 0.1 秒；按批次等待需要 0.5 + 0.1 + 0.1 = 0.7 秒
+        delays = {f"https://alpha.example.com/page{i}": 0.1 for i in range(1, 5)}
+        delays["https://alpha.example.com/page0"] = 0.5
+        context = Mock()
+        page = FakeSyncTab(context, delays)
+        extra_tabs = []
+
+        def new_page():
+            extra_tabs.append(FakeSyncTab(context, delays))
+            return extra_tabs[-1]
+
+        context.new_page = new_page
+
+        start = time.monotonic()
+        adapter._do_post_login(page)
+        elapsed = time.monotonic() - start
+
+        assert len(adapter.keepalive_results) == 5
+        assert all(r.success for r in adapter.keepalive_results)
+        assert adapter.keepalive_results[-1].name == "页面0"
+        assert elapsed < 0.62
+        assert len(extra_tabs) == 1 and extra_tabs[0].closed
@@ -0,0 +1,49 @@
+"""浏览器启动配置测试"""
+import pytest
+
+from core.constants import BrowserConfig
+from core.launch_profiles import PROFILES, get_launch_profile
+
+
+class TestLaunchProfiles:
+    """测试启动配置选择"""
+
+    def test_default_matches_legacy_launch(self, monkeypatch):
+        """测试未指定时使用与旧版一致的 default 配置"""
+        monkeypatch.delenv("ATHENA_LAUNCH_PROFILE", raising=False)
+        profile = get_launch_profile()
+
+        assert profile.name == "default"
+        assert profile.launch_options() == {"headless": True, "args": BrowserConfig.LAUNCH_ARGS}
+        assert profile.context_options()["viewport"] == BrowserConfig.VIEWPORT
+
+    def test_select_from_env(self, monkeypatch):
+        """测试通过环境变量选择配置"""
+        monkeypatch.setenv("ATHENA_LAUNCH_PROFILE", "lean")
+
+        assert get_launch_profile().name == "lean"
+        assert get_launch_profile("low-memory").name == "low-memory"
+
+    def test_unknown_profile(self):
+        """测试未知配置"""
+        with pytest.raises(ValueError, match="未知的启动配置"):
+            get_launch_profile("tiny")
+
+    def test_profiles_build_on_each_other(self):
+        """测试 lean 包含 default 的参数，low-memory 包含 lean 的参数"""
+        default, lean, low = (PROFILES[name].args for name in ("default", "lean", "low-memory"))
+
+        assert set(default) < set(lean) < set(low)
+
+    def test_launch_options_are_copies(self):
+        """测试修改返回的参数不影响配置本身"""
+        profile = PROFILES["lean"]
+        options = profile.launch_options()
+        options["args"].append("--remote-debugging-port=9333")
+
+        assert "--remote-debugging-port=9333" not in profile.args
+
+    def test_playwright_disable_features_not_overridden(self):
+        """测试不传 --disable-features，避免覆盖 Playwright 自带的禁用列表"""
+        for profile in PROFILES.values():
+            assert not any(arg.startswith("--disable-features") for arg in profile.args)
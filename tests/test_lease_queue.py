@@ -0,0 +1,154 @@
+"""租约队列测试"""
+import time
+import sqlite3
+import threading
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+import core.lease_runner as lease_runner
+from core.lease_queue import LeaseQueue
+from core.lease_runner import LeaseRunner
+from core.types import GitHubCredentials, SiteResult
+from tests.test_sharded_runner import make_job
+
+ALICE = GitHubCredentials("alice", "pass")
+BOB = GitHubCredentials("bob", "pass")
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """共享的 SQLite 文件"""
+    return str(tmp_path / "leases.db")
+
+
+@pytest.fixture
+def jobs():
+    """两个账号 × 两个站点"""
+    return [
+        make_job("a", "alice", ALICE),
+        make_job("b", "alice", ALICE),
+        make_job("a", "bob", BOB),
+        make_job("b", "bob", BOB),
+    ]
+
+
+def keys(jobs):
+    """任务键列表"""
+    return [job.key for job in jobs]
+
+
+class TestLeaseQueue:
+    """测试租约队列"""
+
+    def test_nodes_claim_disjoint_accounts(self, db_path, jobs):
+        """测试不同节点领取不同账号的全部任务"""
+        node1 = LeaseQueue(db_path, node="node1")
+        node2 = LeaseQueue(db_path, node="node2")
+
+        assert keys(node1.claim(jobs, 1)) == ["alice:a", "alice:b"]
+        assert keys(node2.claim(jobs, 1)) == ["bob:a", "bob:b"]
+        assert node1.claim(jobs, 1) == []
+
+    def test_finished_jobs_not_reclaimed(self, db_path, jobs):
+        """测试已完成的任务在 done_ttl 内不会被再次领取"""
+        node1 = LeaseQueue(db_path, node="node1")
+        node2 = LeaseQueue(db_path, node="node2")
+
+        for job in node1.claim(jobs, 10):
+            node1.release(job.key, True)
+
+        assert node2.claim(jobs, 10) == []
+        rows = {row["job_key"]: row for row in node2.snapshot()}
+        assert rows["alice:a"]["success"] == 1
+        assert rows["alice:a"]["attempts"] == 1
+
+    def test_account_busy_on_other_node_skipped(self, db_path, jobs):
+        """测试其他节点持有账号部分任务时，不领取该账号的其余任务"""
+        node1 = LeaseQueue(db_path, node="node1")
+        node2 = LeaseQueue(db_path, node="node2")
+
+        # node1 的新鲜度过滤只留下 alice:a
+        assert keys(node1.claim(jobs[:1], 10)) == ["alice:a"]
+        assert keys(node2.claim(jobs, 10)) == ["bob:a", "bob:b"]
+
+        node1.release("alice:a", True)
+        assert keys(node2.claim(jobs, 10)) == ["alice:b"]
+
+    def test_upgrades_table_without_username(self, db_path, jobs):
+        """测试旧版租约表自动补充 username 列"""
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE leases (job_key TEXT PRIMARY KEY, node TEXT, lease_expires REAL, "
+            "finished_at REAL, success INTEGER, error TEXT, attempts INTEGER NOT NULL DEFAULT 0)"
+        )
+        conn.execute("INSERT INTO leases (job_key) VALUES ('alice:a')")
+        conn.commit()
+        conn.close()
+
+        assert len(LeaseQueue(db_path, node="node1").claim(jobs, 10)) == 4
+
+    def test_expired_lease_reclaimed(self, db_path, jobs):
+        """测试租约过期（节点崩溃）后任务可被其他节点领取"""
+        crashed = LeaseQueue(db_path, node="crashed", lease_seconds=-1)
+        crashed.claim(jobs, 10)
+
+        node2 = LeaseQueue(db_path, node="node2")
+        assert len(node2.claim(jobs, 10)) == 4
+
+    def test_renew_and_abandon_only_own_leases(self, db_path, jobs):
+        """测试只能续约或放弃本节点持有的租约"""
+        node1 = LeaseQueue(db_path, node="node1", lease_seconds=60)
+        node2 = LeaseQueue(db_path, node="node2", lease_seconds=600)
+        node1.claim(jobs, 1)
+
+        node2.renew(["alice:a"])
+        node2.abandon(["alice:a"])
+        row = next(r for r in node1.snapshot() if r["job_key"] == "alice:a")
+        assert row["node"] == "node1"
+        assert row["lease_expires"] < time.time() + 120
+
+        node1.abandon(["alice:a", "alice:b"])
+        assert keys(node2.claim(jobs, 1)) == ["alice:a", "alice:b"]
+
+
+class TestLeaseRunner:
+    """测试租约运行器"""
+
+    def test_results_written_off_event_loop(self, db_path, jobs, monkeypatch):
+        """测试释放租约与写入状态在写入线程中依次执行，不阻塞事件循环"""
+        loop_threads = []
+        written = []
+
+        @asynccontextmanager
+        async def async_playwright():
+            yield Mock()
+
+        class FakeBatchRunner:
+            def __init__(self, claimed, notifier, concurrency, on_result, share_github_session):
+                self.claimed = claimed
+                self.on_result = on_result
+
+            async def run_on_browser(self, browser):
+                loop_threads.append(threading.current_thread())
+                for job in self.claimed:
+                    self.on_result(SiteResult(site=job.site, account=job.account, success=True))
+
+        state_manager = Mock()
+        state_manager.record_result.side_effect = lambda result: written.append(
+            (result.key, threading.current_thread())
+        )
+        monkeypatch.setattr(lease_runner, "async_playwright", async_playwright)
+        monkeypatch.setattr(
+            lease_runner, "connect_or_launch_async", AsyncMock(return_value=(AsyncMock(), ""))
+        )
+        monkeypatch.setattr(lease_runner, "BatchRunner", FakeBatchRunner)
+
+        queue = LeaseQueue(db_path, node="node1")
+        results = LeaseRunner(jobs, Mock(), queue, 2, state_manager).run()
+
+        assert [r.key for r in results] == [key for key, _ in written] == keys(jobs)
+        assert all(thread not in loop_threads for _, thread in written)
+        assert len({thread for _, thread in written}) == 1
+        assert LeaseQueue(db_path, node="node2").claim(jobs, 10) == []
@@ -0,0 +1,217 @@
+"""OAuth 流程控制器测试"""
+from unittest.mock import Mock
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeout
+
+from core.oauth_handler import OAuthFlowController
+
+AUTHORIZE_URL = "https://github.com/login/oauth/authorize?client_id=abc"
+CALLBACK_URL = "https://console.example.com/apps"
+
+
+class FakePage:
+    """按顺序产生导航的模拟页面"""
+
+    def __init__(self, url, navigations):
+        self.url = url
+        self.navigations = list(navigations)
+        self.waits = []
+        self.authorize_button = Mock()
+        self.authorize_button.is_visible = Mock(return_value=True)
+        # 模拟时钟（秒），设置后等待超时会推进时钟而不是立即返回
+        self.clock = None
+        self.main_frame = object()
+        self.listeners = {}
+
+    def on(self, event, handler):
+        self.listeners.setdefault(event, []).append(handler)
+
+    def locator(self, selector):
+        locator = Mock()
+        locator.first = self.authorize_button
+        locator.or_ = Mock(return_value=locator)
+        return locator
+
+    def wait_for_url(self, predicate, timeout, wait_until):
+        self.waits.append(timeout)
+        while self.navigations:
+            self.url = self.navigations.pop(0)
+            for handler in self.listeners.get("framenavigated", []):
+                handler(self.main_frame)
+            if predicate(self.url):
+                return
+        if self.clock:
+            self.clock[0] += timeout / 1000
+        raise PlaywrightTimeout("timeout")
+
+
+class TestWaitCallback:
+    """测试基于导航事件的回调等待"""
+
+    def test_returns_on_callback_navigation(self, mock_notifier):
+        """测试回调页面提交后立即返回"""
+        page = FakePage("https://github.com/session", [CALLBACK_URL])
+
+        assert OAuthFlowController(mock_notifier).wait_callback(page, ["example.com"], 60)
+        assert len(page.waits) == 1
+        assert 59000 < page.waits[0] <= 60000
+
+    def test_authorizes_once_per_visit(self, mock_notifier):
+        """测试每次进入授权页只点击一次授权按钮"""
+        page = FakePage(AUTHORIZE_URL, [AUTHORIZE_URL, CALLBACK_URL])
+
+        assert OAuthFlowController(mock_notifier).wait_callback(page, ["example.com"], 60)
+        page.authorize_button.click.assert_called_once()
+
+    def _stuck_on_authorize(self, monkeypatch, navigations=()):
+        """停留在授权页、使用模拟时钟的页面"""
+        page = FakePage(AUTHORIZE_URL, navigations)
+        page.clock = [0.0]
+        monkeypatch.setattr("core.oauth_handler.time.monotonic", lambda: page.clock[0])
+        return page
+
+    def test_does_not_resubmit_same_document(self, mock_notifier, monkeypatch):
+        """测试点击后停留在同一文档时按间隔等待，但不重复提交授权"""
+        page = self._stuck_on_authorize(monkeypatch)
+
+        assert not OAuthFlowController(mock_notifier).wait_callback(page, ["example.com"], 3)
+        page.authorize_button.click.assert_called_once()
+        assert page.waits[-3:] == [1000, 1000, 1000]
+
+    def test_retries_when_authorize_page_rerenders(self, mock_notifier, monkeypatch):
+        """测试同一 URL 提交了新文档（重新渲染）时重新点击"""
+        page = self._stuck_on_authorize(monkeypatch, [AUTHORIZE_URL])
+
+        assert not OAuthFlowController(mock_notifier).wait_callback(page, ["example.com"], 3)
+        assert page.authorize_button.click.call_count == 2
+
+    def test_retries_when_button_missing(self, mock_notifier, monkeypatch):
+        """测试上次没有找到授权按钮时重新尝试"""
+        page = self._stuck_on_authorize(monkeypatch)
+        page.authorize_button.wait_for.side_effect = [PlaywrightTimeout("timeout"), None, None]
+
+        assert not OAuthFlowController(mock_notifier).wait_callback(page, ["example.com"], 3)
+        page.authorize_button.click.assert_called_once()
+        assert page.authorize_button.wait_for.call_count == 2
+
+    def test_handle_authorization_click_not_repeated(self, mock_notifier, monkeypatch):
+        """测试 handle_authorization 已点击过的授权页不会在等待回调时再次提交"""
+        monkeypatch.setenv("ATHENA_FAST", "1")
+        page = self._stuck_on_authorize(monkeypatch)
+        page.wait_for_load_state = Mock()
+        controller = OAuthFlowController(mock_notifier)
+
+        controller.handle_authorization(page)
+        assert not controller.wait_callback(page, ["example.com"], 2)
+        page.authorize_button.click.assert_called_once()
+
+    def test_negative_patterns_ignored(self, mock_notifier):
+        """测试反向模式不参与回调判断"""
+        page = FakePage("https://console.example.com/signin", [])
+        controller = OAuthFlowController(mock_notifier)
+
+        assert controller.wait_callback(page, ["example.com", "!signin"], 1)
+        assert not controller.wait_callback(page, ["!signin"], 0)
+
+
+VISIBLE_SUFFIX = " >> visible=true"
+
+
+class FakeLocator:
+    """按 DOM 顺序匹配元素、支持 or_ 组合的模拟定位器
+
+    与 Playwright 一致：first 是 DOM 中的第一个匹配，不论是否可见。
+    """
+
+    def __init__(self, page, matches):
+        self.page = page
+        self.matches = matches  # [(DOM 序号, 选择器, 是否可见)]
+
+    @property
+    def first(self):
+        return type(self)(self.page, self.matches[:1])
+
+    def or_(self, other):
+        return type(self)(self.page, sorted(self.matches + other.matches))
+
+    def is_visible(self):
+        return bool(self.matches) and self.matches[0][2]
+
+    def wait_for(self, state, timeout):
+        self.page.waits.append(timeout)
+        if not self.is_visible():
+            raise PlaywrightTimeout("timeout")
+
+    def click(self):
+        self.page.clicked.append(self.matches[0][:2])
+
+
+class FakeButtonPage:
+    """按 DOM 顺序排列的元素，部分隐藏"""
+
+    locator_class = FakeLocator
+
+    def __init__(self, elements):
+        self.elements = elements  # [(选择器, 是否可见)]
+        self.waits = []
+        self.clicked = []
+
+    def locator(self, selector):
+        visible_only = selector.endswith(VISIBLE_SUFFIX)
+        selector = selector.removesuffix(VISIBLE_SUFFIX)
+        return self.locator_class(
+            self,
+            [
+                (index, candidate, visible)
+                for index, (candidate, visible) in enumerate(self.elements)
+                if candidate == selector and (visible or not visible_only)
+            ],
+        )
+
+
+class TestClickOAuthButton:
+    """测试合并所有候选选择器的 OAuth 按钮点击"""
+
+    SELECTORS = ['button:has-text("GitHub")', 'a:has-text("GitHub")', '[data-provider="github"]']
+
+    def test_single_wait_for_last_selector(self, mock_notifier, capsys):
+        """测试命中最后一个选择器时也只等待一次，并输出命中的选择器"""
+        page = FakeButtonPage([('[data-provider="github"]', True)])
+
+        assert OAuthFlowController(mock_notifier).click_oauth_button(page, self.SELECTORS)
+        assert len(page.waits) == 1
+        assert page.clicked == [(0, '[data-provider="github"]')]
+        assert '[data-provider="github"]' in capsys.readouterr().out
+
+    def test_skips_hidden_earlier_match(self, mock_notifier):
+        """测试 DOM 中更靠前的隐藏匹配不影响后面可见的候选"""
+        page = FakeButtonPage(
+            [
+                ('a:has-text("GitHub")', False),  # 折叠的移动端导航
+                ('button:has-text("GitHub")', False),  # display:none 的副本
+                ('button:has-text("GitHub")', True),
+            ]
+        )
+
+        assert OAuthFlowController(mock_notifier).click_oauth_button(page, self.SELECTORS)
+        assert page.clicked == [(2, 'button:has-text("GitHub")')]
+
+    def test_button_not_found(self, mock_notifier):
+        """测试没有候选按钮可见"""
+        page = FakeButtonPage([('button:has-text("GitHub")', False)])
+
+        assert not OAuthFlowController(mock_notifier).click_oauth_button(page, self.SELECTORS)
+        assert len(page.waits) == 1
+
+
+class TestClickAuthorize:
+    """测试授权按钮的可见性判断"""
+
+    def test_skips_hidden_earlier_match(self, mock_notifier):
+        """测试隐藏的授权按钮副本不影响后面可见的按钮"""
+        page = FakeButtonPage(
+            [('button[name="authorize"]', False), ('button:has-text("Authorize")', True)]
+        )
+
+        assert OAuthFlowController(mock_notifier)._click_authorize(page)
+        assert page.clicked == [(1, 'button:has-text("Authorize")')]
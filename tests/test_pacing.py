@@ -0,0 +1,81 @@
+"""步骤间等待策略测试"""
+import asyncio
+
+import pytest
+
+from core.pacing import Pacer, fast_mode_enabled
+
+
+class TestPacer:
+    """测试固定 sleep 与就绪条件的切换及耗时统计"""
+
+    def test_normal_mode_sleeps(self):
+        """测试普通模式固定 sleep，不执行就绪条件"""
+        calls = []
+        pacer = Pacer(fast=False)
+
+        pacer.pause(0.01, lambda: calls.append("ready"))
+
+        assert calls == []
+        assert pacer.sleep_seconds >= 0.01
+        assert pacer.wait_seconds == 0
+
+    def test_fast_mode_runs_ready_condition(self):
+        """测试快速模式执行就绪条件并计入条件等待"""
+        calls = []
+        pacer = Pacer(fast=True)
+
+        pacer.pause(5, lambda: calls.append("ready"))
+        pacer.pause(5)
+
+        assert calls == ["ready"]
+        assert pacer.sleep_seconds == 0
+
+    def test_fast_mode_ignores_ready_errors(self):
+        """测试就绪条件超时后继续执行"""
+
+        def ready():
+            raise TimeoutError("timeout")
+
+        pacer = Pacer(fast=True)
+        pacer.pause(5, ready)
+
+        assert pacer.sleep_seconds == 0
+
+    def test_async_pause(self):
+        """测试异步版本"""
+        calls = []
+
+        async def ready():
+            calls.append("ready")
+
+        async def run():
+            fast, normal = Pacer(fast=True), Pacer(fast=False)
+            await fast.pause_async(5, ready)
+            await normal.pause_async(0.01, ready)
+            return fast, normal
+
+        fast, normal = asyncio.run(run())
+
+        assert calls == ["ready"]
+        assert fast.sleep_seconds == 0
+        assert normal.sleep_seconds >= 0.01
+
+    def test_waiting_and_metrics(self):
+        """测试条件等待计时与指标输出"""
+        pacer = Pacer(fast=True)
+        with pacer.waiting():
+            pass
+
+        metrics = pacer.metrics()
+        assert set(metrics) == {"fixed_sleep_seconds", "ready_wait_seconds"}
+        assert metrics["fixed_sleep_seconds"] == 0
+        assert "快速模式" in pacer.report()
+
+    @pytest.mark.parametrize("value, expected", [("1", True), ("true", True), ("", False)])
+    def test_fast_mode_from_env(self, monkeypatch, value, expected):
+        """测试通过环境变量启用快速模式"""
+        monkeypatch.setenv("ATHENA_FAST", value)
+
+        assert fast_mode_enabled() is expected
+        assert Pacer().fast is expected
@@ -0,0 +1,65 @@
+"""持久化浏览器配置测试"""
+import os
+from contextlib import contextmanager
+from unittest.mock import Mock
+
+import pytest
+
+import main
+from core.config_loader import parse_site_config
+from core.profile_store import ProfileLock, profile_base_dir, profile_path
+from tests.test_keepalive import SITE
+
+
+class TestProfileStore:
+    """测试配置目录与文件锁"""
+
+    def test_profile_base_dir_from_env(self, monkeypatch):
+        """测试未设置环境变量时不启用"""
+        monkeypatch.delenv("ATHENA_PROFILE_DIR", raising=False)
+        assert profile_base_dir() is None
+
+        monkeypatch.setenv("ATHENA_PROFILE_DIR", "/tmp/profiles")
+        assert profile_base_dir() == "/tmp/profiles"
+
+    def test_profile_path_sanitizes_username(self):
+        """测试用户名中的特殊字符不会逃出根目录"""
+        assert profile_path("/profiles", "octocat") == os.path.join("/profiles", "octocat")
+        assert profile_path("/profiles", "../evil/user") == os.path.join(
+            "/profiles", ".._evil_user"
+        )
+
+    def test_lock_is_exclusive(self, tmp_path):
+        """测试同一目录的锁在释放前无法再次获取"""
+        path = str(tmp_path / "octocat")
+        with ProfileLock(path):
+            assert os.path.isdir(path)
+            with pytest.raises(TimeoutError):
+                ProfileLock(path, timeout=0).acquire()
+
+        # 释放后可再次获取
+        with ProfileLock(path, timeout=0):
+            pass
+
+    def test_run_single_releases_lock_when_launch_fails(
+        self, tmp_path, monkeypatch, mock_credentials, mock_notifier
+    ):
+        """测试启动持久化浏览器失败时释放配置目录锁"""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("ATHENA_PROFILE_DIR", str(tmp_path / "profiles"))
+        monkeypatch.setattr(main, "load_config", lambda name: parse_site_config(SITE))
+        playwright = Mock()
+        playwright.chromium.launch_persistent_context.side_effect = RuntimeError("启动失败")
+
+        @contextmanager
+        def sync_playwright():
+            yield playwright
+
+        monkeypatch.setattr("playwright.sync_api.sync_playwright", sync_playwright)
+
+        with pytest.raises(RuntimeError, match="启动失败"):
+            main.run_single("clawcloud", mock_credentials, mock_notifier, force=True)
+
+        path = profile_path(str(tmp_path / "profiles"), mock_credentials.username)
+        with ProfileLock(path, timeout=0):
+            pass
@@ -0,0 +1,107 @@
+"""页面就绪等待测试"""
+from unittest.mock import Mock
+
+import pytest
+from playwright.sync_api import TimeoutError as PlaywrightTimeout
+
+from core.readiness import ReadyWaiter
+from core.types import ReadySpec
+
+
+class FakePage:
+    """记录等待调用的模拟页面"""
+
+    def __init__(self, url="https://console.example.com/"):
+        self.url = url
+        self.calls = []
+        self.listeners = []
+        self.element = Mock()
+
+    def on(self, event, handler):
+        self.listeners.append(handler)
+
+    def remove_listener(self, event, handler):
+        self.listeners.remove(handler)
+
+    def emit_response(self, url):
+        for handler in list(self.listeners):
+            handler(Mock(url=url))
+
+    def wait_for_load_state(self, state, timeout):
+        self.calls.append(("load_state", state, timeout))
+
+    def wait_for_event(self, event, predicate, timeout):
+        self.calls.append(("event", event, timeout))
+
+    def wait_for_url(self, predicate, timeout, wait_until):
+        self.calls.append(("url", predicate(self.url), timeout))
+
+    def locator(self, selector):
+        self.calls.append(("selector", selector))
+        locator = Mock()
+        locator.first = self.element
+        return locator
+
+
+class TestReadyWaiter:
+    """测试就绪条件与 networkidle 回退"""
+
+    def test_falls_back_to_networkidle(self):
+        """测试未配置条件时等待 networkidle"""
+        page = FakePage()
+
+        ReadyWaiter(page, None, 15).wait()
+
+        assert page.calls == [("load_state", "networkidle", 15000)]
+
+    def test_response_seen_during_navigation(self):
+        """测试导航过程中已出现的响应不再等待"""
+        page = FakePage()
+        waiter = ReadyWaiter(page, ReadySpec(response="/api/apps"), 15)
+
+        page.emit_response("https://console.example.com/static/app.js")
+        assert not waiter.response_seen
+        page.emit_response("https://console.example.com/api/apps?page=1")
+        waiter.wait()
+
+        assert waiter.response_seen
+        assert page.calls == []
+        assert page.listeners == []
+
+    def test_waits_for_missing_response(self):
+        """测试响应尚未出现时等待响应事件"""
+        page = FakePage()
+
+        ReadyWaiter(page, ReadySpec(response="/api/apps", timeout=5), 15).wait()
+
+        assert page.calls == [("event", "response", 5000)]
+        assert page.listeners == []
+
+    def test_url_and_selector(self):
+        """测试同时配置 URL 与选择器时依次等待"""
+        page = FakePage("https://console.example.com/apps")
+
+        ReadyWaiter(page, ReadySpec(url="/apps", selector="#app-list"), 15).wait()
+
+        assert page.calls == [("url", True, 15000), ("selector", "#app-list")]
+        page.element.wait_for.assert_called_once_with(state="visible", timeout=15000)
+
+    def test_poll_does_not_wait(self, monkeypatch):
+        """测试 poll 只检查当前状态，超时后抛出异常并停止监听"""
+        clock = [100.0]
+        monkeypatch.setattr("core.readiness.time.monotonic", lambda: clock[0])
+        page = FakePage()
+        waiter = ReadyWaiter(page, ReadySpec(response="/api/apps", url="console"), 15)
+
+        assert waiter.poll() is False
+        page.emit_response("https://console.example.com/api/apps")
+        assert waiter.poll() is True
+        assert page.calls == [] and page.listeners == []
+
+        waiter = ReadyWaiter(page, ReadySpec(response="/api/apps"), 15)
+        clock[0] += 16
+        assert waiter.poll() is False
+        clock[0] += 16
+        with pytest.raises(PlaywrightTimeout):
+            waiter.poll()
+        assert page.listeners == []
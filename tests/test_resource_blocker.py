@@ -0,0 +1,83 @@
+"""请求拦截测试"""
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+from core.resource_blocker import ResourceBlocker, ROUTE_PATTERN, match_url
+from core.types import BlockResourcesConfig
+
+
+def make_route(resource_type, url):
+    """构造路由对象"""
+    route = Mock()
+    route.request.resource_type = resource_type
+    route.request.url = url
+    return route
+
+
+class TestResourceBlocker:
+    """测试拦截规则与统计"""
+
+    config = BlockResourcesConfig(
+        types=["image", "font"],
+        deny=["*google-analytics.com*", r"re:/collect\?"],
+        allow=["https://console.example.com/logo.png"],
+    )
+
+    def test_match_url(self):
+        """测试 glob 与正则模式"""
+        assert match_url("*.woff2", "https://cdn.example.com/a.woff2")
+        assert match_url(r"re:/track/\d+", "https://example.com/track/42")
+        assert not match_url(r"re:/track/\d+", "https://example.com/track/x")
+
+    def test_should_block(self):
+        """测试资源类型、拒绝列表与允许列表（允许优先）"""
+        blocker = ResourceBlocker(self.config)
+
+        assert blocker.should_block("image", "https://cdn.example.com/a.png")
+        assert blocker.should_block("script", "https://www.google-analytics.com/analytics.js")
+        assert blocker.should_block("xhr", "https://stats.example.com/collect?v=1")
+        assert not blocker.should_block("image", "https://console.example.com/logo.png")
+        assert not blocker.should_block("document", "https://console.example.com/")
+
+    def test_route_counts_blocked_requests(self):
+        """测试路由处理中止命中的请求并统计"""
+        context = Mock()
+        blocker = ResourceBlocker(self.config)
+        blocker.install(context)
+        handler = context.route.call_args.args[1]
+        assert context.route.call_args.args[0] == ROUTE_PATTERN
+
+        blocked = [
+            make_route("image", "https://cdn.example.com/a.png"),
+            make_route("font", "https://cdn.example.com/a.woff2"),
+        ]
+        allowed = make_route("document", "https://console.example.com/")
+        for route in blocked + [allowed]:
+            handler(route)
+
+        for route in blocked:
+            route.abort.assert_called_once()
+        allowed.continue_.assert_called_once()
+        assert blocker.blocked == {"image": 1, "font": 1}
+
+        blocker._on_response(Mock(headers={"content-length": "2048"}))
+        blocker._on_response(Mock(headers={}))
+        assert blocker.metrics() == {"blocked_requests": 2, "loaded_bytes": 2048}
+        assert "font 1, image 1" in blocker.report()
+
+        blocker.uninstall()
+        context.unroute.assert_called_once_with(ROUTE_PATTERN, handler)
+        context.remove_listener.assert_called_once_with("response", blocker._on_response)
+
+    def test_uninstall_async_removes_listener(self):
+        """测试异步版取消拦截时同时移除响应监听"""
+        context = Mock()
+        context.route = AsyncMock()
+        context.unroute = AsyncMock()
+        blocker = ResourceBlocker(self.config)
+
+        asyncio.run(blocker.install_async(context))
+        asyncio.run(blocker.uninstall_async())
+
+        context.unroute.assert_awaited_once_with(ROUTE_PATTERN, blocker._route_async)
+        context.remove_listener.assert_called_once_with("response", blocker._on_response)
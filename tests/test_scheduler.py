@@ -0,0 +1,134 @@
+"""守护进程调度器测试"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from core.jobs import prioritize_jobs
+from core.scheduler import Scheduler
+from core.state_manager import StateManager
+from core.types import (
+    GitHubCredentials,
+    LoginJob,
+    ScheduleConfig,
+    SiteConfig,
+    TwoFactorConfig,
+    DeviceVerificationConfig,
+    TimeoutConfig,
+)
+
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def make_job(site, interval=3600, jitter=0):
+    """构造带调度配置的登录任务"""
+    config = SiteConfig(
+        name=site,
+        enabled=True,
+        login_url=f"https://{site}.example.com/login",
+        success_url_patterns=[f"{site}.example.com"],
+        oauth_button_selectors=["button"],
+        two_factor=TwoFactorConfig(),
+        device_verification=DeviceVerificationConfig(),
+        timeouts=TimeoutConfig(),
+        schedule=ScheduleConfig(interval=interval, jitter=jitter),
+    )
+    return LoginJob(site=site, config=config, credentials=GitHubCredentials("user", "pass"))
+
+
+class TestScheduler:
+    """测试调度器"""
+
+    @pytest.fixture
+    def state_file(self, tmp_path):
+        """临时状态文件"""
+        return tmp_path / "test_state.json"
+
+    def make_scheduler(self, state_file, jobs, rng=lambda: 0.5):
+        """构造使用固定时钟的调度器"""
+        return Scheduler(jobs, StateManager(str(state_file)), clock=lambda: NOW, rng=rng)
+
+    def test_new_jobs_are_due(self, state_file):
+        """测试从未运行过的任务立即到期"""
+        scheduler = self.make_scheduler(state_file, [make_job("a"), make_job("b")])
+
+        assert [job.site for job in scheduler.due_jobs()] == ["a", "b"]
+        assert scheduler.seconds_until_next() == 0
+
+    def test_schedule_next_applies_interval_and_jitter(self, state_file):
+        """测试下次运行时间 = 间隔 + 随机抖动"""
+        scheduler = self.make_scheduler(state_file, [make_job("a", interval=3600, jitter=600)])
+
+        next_run = scheduler.schedule_next("a")
+
+        assert next_run == NOW + timedelta(seconds=3900)
+        assert scheduler.due_jobs() == []
+        assert scheduler.seconds_until_next() == 3900
+
+    def test_due_after_interval(self, state_file):
+        """测试间隔过后任务再次到期"""
+        scheduler = self.make_scheduler(state_file, [make_job("a", interval=60)])
+        scheduler.schedule_next("a")
+
+        assert scheduler.due_jobs(NOW + timedelta(seconds=59)) == []
+        assert [job.site for job in scheduler.due_jobs(NOW + timedelta(seconds=60))] == ["a"]
+
+    def test_next_run_persisted(self, state_file):
+        """测试下次运行时间在重启后保留"""
+        self.make_scheduler(state_file, [make_job("a")]).schedule_next("a")
+
+        restarted = self.make_scheduler(state_file, [make_job("a"), make_job("b")])
+
+        assert [job.site for job in restarted.due_jobs()] == ["b"]
+        assert restarted.snapshot() == [("b", NOW), ("a", NOW + timedelta(seconds=3600))]
+
+    def test_no_jobs(self, state_file):
+        """测试没有任务时不会到期"""
+        scheduler = self.make_scheduler(state_file, [])
+
+        assert scheduler.due_jobs() == []
+        assert scheduler.seconds_until_next() == float("inf")
+
+    def test_failed_job_retries_after_cooldown(self, state_file):
+        """测试失败的任务按指数冷却时间重试"""
+        scheduler = self.make_scheduler(state_file, [make_job("a", interval=86400, jitter=600)])
+
+        scheduler.state_manager.record_login_attempt("a", False)
+        assert scheduler.schedule_next("a") == NOW + timedelta(seconds=1800)
+
+        scheduler.state_manager.record_login_attempt("a", False)
+        assert scheduler.schedule_next("a") == NOW + timedelta(seconds=3600)
+
+    def test_due_jobs_ordered_by_cookie_expiry(self, state_file):
+        """测试到期任务按 Cookie 过期时间排序，从未登录的任务最优先"""
+        scheduler = self.make_scheduler(
+            state_file, [make_job("late"), make_job("soon"), make_job("new")]
+        )
+        state = scheduler.state_manager
+        state.record_login_attempt(
+            "late", True, cookies_saved=True, cookies_expire_at=datetime(2030, 1, 1).timestamp()
+        )
+        state.record_login_attempt(
+            "soon", True, cookies_saved=True, cookies_expire_at=datetime(2025, 1, 1).timestamp()
+        )
+
+        assert [job.site for job in scheduler.due_jobs()] == ["new", "soon", "late"]
+
+
+class TestPrioritizeJobs:
+    """测试批量任务的优先级排序"""
+
+    def test_unhealthy_jobs_cool_down(self, tmp_path):
+        """测试冷却中的不健康站点被推迟，冷却结束后排在健康站点之后"""
+        state_manager = StateManager(str(tmp_path / "state.json"))
+        for _ in range(3):
+            state_manager.record_login_attempt("broken", False)
+        jobs = [make_job("broken"), make_job("ok")]
+
+        ready, cooling = prioritize_jobs(jobs, state_manager)
+        assert [job.site for job in ready] == ["ok"]
+        assert [job.site for job, _ in cooling] == ["broken"]
+
+        later = datetime.now() + timedelta(hours=3)
+        ready, cooling = prioritize_jobs(jobs, state_manager, now=later)
+        assert [job.site for job in ready] == ["ok", "broken"]
+        assert cooling == []
@@ -0,0 +1,47 @@
+"""Session Cookie HTTP 检查测试"""
+from unittest.mock import Mock, patch
+
+from requests.exceptions import RequestException
+
+from core.session_probe import probe_github_session
+
+
+def _response(status_code: int, location: str = "") -> Mock:
+    """构造 HTTP 响应"""
+    return Mock(
+        status_code=status_code,
+        is_redirect=300 <= status_code < 400,
+        headers={"Location": location} if location else {},
+    )
+
+
+class TestProbeGitHubSession:
+    """测试 probe_github_session"""
+
+    @patch("core.session_probe._session")
+    def test_valid_session(self, session):
+        """测试需要登录的页面返回 200"""
+        session.get.return_value = _response(200)
+
+        assert probe_github_session("cookie") is True
+        kwargs = session.get.call_args.kwargs
+        assert kwargs["allow_redirects"] is False
+        assert kwargs["cookies"]["user_session"] == "cookie"
+
+    @patch("core.session_probe._session")
+    def test_redirect_to_login(self, session):
+        """测试重定向到登录页说明会话已失效"""
+        session.get.return_value = _response(
+            302, "https://github.com/login?return_to=%2Fsettings%2Fprofile"
+        )
+
+        assert probe_github_session("cookie") is False
+
+    @patch("core.session_probe._session")
+    def test_unknown_result(self, session):
+        """测试网络错误与意外状态码无法判断"""
+        session.get.return_value = _response(503)
+        assert probe_github_session("cookie") is None
+
+        session.get.side_effect = RequestException("timeout")
+        assert probe_github_session("cookie") is None
@@ -0,0 +1,93 @@
+"""分片运行器测试"""
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, Mock
+
+from core.batch_runner import BatchRunner
+from core.sharded_runner import _run_shard, split_into_shards, format_throughput
+from core.types import (
+    LoginJob,
+    SiteResult,
+    SiteConfig,
+    TwoFactorConfig,
+    DeviceVerificationConfig,
+    TimeoutConfig,
+)
+
+
+def make_job(site, account, credentials):
+    """构造登录任务"""
+    config = SiteConfig(
+        name=site,
+        enabled=True,
+        login_url=f"https://{site}.example.com/login",
+        success_url_patterns=[f"{site}.example.com"],
+        oauth_button_selectors=["button"],
+        two_factor=TwoFactorConfig(),
+        device_verification=DeviceVerificationConfig(),
+        timeouts=TimeoutConfig(),
+    )
+    return LoginJob(site=site, config=config, credentials=credentials, account=account)
+
+
+class TestSplitIntoShards:
+    """测试任务分片"""
+
+    def test_round_robin(self, mock_credentials):
+        """测试轮询分配"""
+        jobs = [make_job(f"s{i}", "alice", mock_credentials) for i in range(5)]
+        shards = split_into_shards(jobs, 2)
+        assert [[j.site for j in shard] for shard in shards] == [["s0", "s2", "s4"], ["s1", "s3"]]
+
+    def test_group_by_account(self, mock_credentials):
+        """测试按账号分组时同一账号的任务在同一分片"""
+        jobs = [make_job(f"s{i}", "alice", mock_credentials) for i in range(3)]
+        jobs += [make_job("s0", "bob", mock_credentials)]
+        shards = split_into_shards(jobs, 2, group_by_account=True)
+        assert [[j.key for j in shard] for shard in shards] == [
+            ["alice:s0", "alice:s1", "alice:s2"],
+            ["bob:s0"],
+        ]
+
+    def test_more_shards_than_jobs(self, mock_credentials):
+        """测试分片数多于任务数时不产生空分片"""
+        jobs = [make_job("s0", "", mock_credentials)]
+        assert len(split_into_shards(jobs, 4)) == 1
+
+    def test_job_key(self, mock_credentials):
+        """测试任务键"""
+        assert make_job("s0", "", mock_credentials).key == "s0"
+        assert make_job("s0", "alice", mock_credentials).key == "alice:s0"
+
+
+class TestFormatThroughput:
+    """测试吞吐量格式化"""
+
+    def test_per_minute(self):
+        """测试按分钟换算"""
+        results = [SiteResult("a", True), SiteResult("b", True), SiteResult("c", False)]
+        text = format_throughput(results, 30)
+        assert "6.0 任务/分钟" in text
+        assert "4.0 成功登录/分钟" in text
+
+
+class TestRunShard:
+    """测试分片子进程入口"""
+
+    def test_launches_own_browser_when_server_running(self, monkeypatch, mock_credentials):
+        """测试常驻浏览器服务可达时，分片仍本地启动自己的浏览器"""
+        playwright = Mock()
+        playwright.chromium.launch = AsyncMock()
+        playwright.chromium.connect_over_cdp = AsyncMock()
+
+        @asynccontextmanager
+        async def async_playwright():
+            yield playwright
+
+        monkeypatch.setattr("core.batch_runner.async_playwright", async_playwright)
+        monkeypatch.setattr("core.browser_server.probe_server", lambda url=None: "ws://cdp")
+        monkeypatch.setattr(BatchRunner, "run_on_browser", AsyncMock(return_value=[]))
+
+        _run_shard([make_job("a", "alice", mock_credentials)], Mock(), 1, Mock(), True)
+
+        playwright.chromium.launch.assert_awaited_once()
+        playwright.chromium.connect_over_cdp.assert_not_awaited()
@@ -1,6 +1,7 @@
 """状态管理器测试"""
 import pytest
 import json
+from datetime import datetime, timedelta
 from pathlib import Path
 from core.state_manager import StateManager
 
@@ -93,3 +94,83 @@ class TestStateManager:
         assert "成功次数: 1" in stats
         assert "失败次数: 1" in stats
         assert "成功率: 50.0%" in stats
+
+    def test_is_fresh(self, state_manager):
+        """测试新鲜期内成功且已保存 Cookie 的站点视为新鲜"""
+        state_manager.record_login_attempt("test_site", True, cookies_saved=True)
+
+        assert state_manager.is_fresh("test_site", 3600)
+        assert not state_manager.is_fresh("test_site", 0)
+        later = datetime.now() + timedelta(hours=2)
+        assert not state_manager.is_fresh("test_site", 3600, now=later)
+        assert not state_manager.is_fresh("unknown_site", 3600)
+
+    def test_is_fresh_requires_saved_cookie(self, state_manager):
+        """测试未保存 Cookie 或最近一次失败时不视为新鲜"""
+        state_manager.record_login_attempt("no_cookie", True)
+        state_manager.record_login_attempt("failed", True, cookies_saved=True)
+        state_manager.record_login_attempt("failed", False)
+
+        assert not state_manager.is_fresh("no_cookie", 3600)
+        assert not state_manager.is_fresh("failed", 3600)
+
+    def test_cooldown_grows_exponentially(self, state_manager):
+        """测试冷却时间随连续失败次数指数增长并有上限"""
+        assert state_manager.cooldown_seconds("test_site") == 0
+
+        state_manager.record_login_attempt("test_site", False)
+        assert state_manager.cooldown_seconds("test_site") == 1800
+        state_manager.record_login_attempt("test_site", False)
+        assert state_manager.cooldown_seconds("test_site") == 3600
+
+        for _ in range(10):
+            state_manager.record_login_attempt("test_site", False)
+        assert state_manager.cooldown_seconds("test_site") == 86400
+
+    def test_cooldown_until_only_for_unhealthy(self, state_manager):
+        """测试只有不健康站点才有冷却结束时间"""
+        state_manager.record_login_attempt("test_site", False)
+        assert state_manager.cooldown_until("test_site") is None
+
+        state_manager.record_login_attempt("test_site", False)
+        state_manager.record_login_attempt("test_site", False)
+        until = state_manager.cooldown_until("test_site")
+        last_attempt = datetime.fromisoformat(
+            state_manager.get_site_state("test_site")["last_attempt_time"]
+        )
+        assert until == last_attempt + timedelta(seconds=7200)
+
+    def test_cookie_expiry_recorded(self, state_manager):
+        """测试记录 Cookie 过期时间"""
+        expires = datetime(2030, 1, 1).timestamp()
+        state_manager.record_login_attempt(
+            "test_site", True, cookies_saved=True, cookies_expire_at=expires
+        )
+
+        assert state_manager.get_cookie_expiry("test_site") == datetime(2030, 1, 1)
+        assert state_manager.get_cookie_expiry("unknown_site") is None
+
+    def test_device_verification_rate(self, state_manager):
+        """测试按配置模式统计设备验证频率"""
+        login = {"github_password_logins": 1, "device_verifications": 1}
+        state_manager.record_login_attempt("test_site", True, metrics=login)
+        state_manager.record_login_attempt("test_site", True, metrics={"github_password_logins": 1})
+        state_manager.record_login_attempt(
+            "test_site", True, metrics={"github_password_logins": 1}, persistent_profile=True
+        )
+
+        assert state_manager.device_verification_rate("test_site", False) == 0.5
+        assert state_manager.device_verification_rate("test_site", True) == 0
+        assert state_manager.device_verification_rate("unknown_site", True) is None
+        assert "设备验证频率（空白上下文）: 50.0%" in state_manager.get_stats("test_site")
+
+    def test_storage_state_hit_rate(self, state_manager):
+        """测试 storage_state 缓存命中率"""
+        assert state_manager.storage_state_hit_rate("test_site") is None
+
+        state_manager.record_login_attempt("test_site", True, metrics={"storage_state_misses": 1})
+        for _ in range(3):
+            state_manager.record_login_attempt("test_site", True, metrics={"storage_state_hits": 1})
+
+        assert state_manager.storage_state_hit_rate("test_site") == 0.75
+        assert "storage_state 缓存命中率: 75.0%" in state_manager.get_stats("test_site")
@@ -0,0 +1,63 @@
+"""步骤生成器驱动测试"""
+import asyncio
+
+import pytest
+
+from core.steps import run_steps, run_steps_async
+
+
+def flow(first, second):
+    """两次 I/O 调用，第二次出错时由流程自身处理"""
+    total = yield first()
+    try:
+        total += yield second()
+    except ValueError:
+        return -total
+    return total
+
+
+def fail():
+    raise ValueError("boom")
+
+
+async def async_value(value):
+    return value
+
+
+async def async_fail():
+    raise ValueError("boom")
+
+
+class TestRunSteps:
+    """测试同步版驱动"""
+
+    def test_sends_results_back(self):
+        """测试 yield 出的结果原样送回"""
+        assert run_steps(flow(lambda: 1, lambda: 2)) == 3
+
+    def test_errors_raise_inside_flow(self):
+        """测试同步调用的异常在生成器内抛出"""
+        assert run_steps(flow(lambda: 1, fail)) == -1
+
+
+class TestRunStepsAsync:
+    """测试异步版驱动"""
+
+    def test_awaits_coroutines(self):
+        """测试等待 yield 出的协程，普通值原样送回"""
+        steps = flow(lambda: async_value(1), lambda: 2)
+
+        assert asyncio.run(run_steps_async(steps)) == 3
+
+    def test_errors_thrown_into_flow(self):
+        """测试协程的异常抛回生成器，由流程的 try/except 处理"""
+        steps = flow(lambda: async_value(1), async_fail)
+
+        assert asyncio.run(run_steps_async(steps)) == -1
+
+    def test_unhandled_error_propagates(self):
+        """测试流程未处理的异常传给调用方"""
+        steps = flow(async_fail, lambda: 2)
+
+        with pytest.raises(ValueError, match="boom"):
+            asyncio.run(run_steps_async(steps))
@@ -0,0 +1,117 @@
+"""storage_state 缓存测试"""
+import os
+import json
+
+import pytest
+
+from core.config_loader import parse_site_config
+from core.storage_state_cache import StorageStateCache, cache_enabled
+from sites.clawcloud import ClawCloudAdapter
+from tests.test_keepalive import SITE
+
+STATE = {
+    "cookies": [{"name": "sid", "value": "abc", "domain": "alpha.example.com", "path": "/"}],
+    "origins": [
+        {"origin": "https://alpha.example.com", "localStorage": [{"name": "t", "value": "1"}]}
+    ],
+}
+
+
+class TestStorageStateCache:
+    """测试缓存读写"""
+
+    def test_round_trip(self, tmp_path):
+        """测试写入后读取，且不残留临时文件"""
+        cache = StorageStateCache("Alpha_octo/cat", str(tmp_path), secret="")
+        assert cache.load() is None
+
+        cache.save(STATE)
+
+        assert cache.load() == STATE
+        assert os.listdir(tmp_path) == ["Alpha_octo_cat.json"]
+        assert os.stat(cache.path).st_mode & 0o777 == 0o600
+
+    def test_github_state_not_saved(self, tmp_path):
+        """测试写入前去掉 github.com 的 Cookie 与 localStorage"""
+        cache = StorageStateCache("Alpha", str(tmp_path), secret="")
+        github_cookie = {"name": "user_session", "value": "gh", "domain": ".github.com"}
+        github_origin = {"origin": "https://github.com", "localStorage": []}
+        cache.save(
+            {
+                "cookies": STATE["cookies"] + [github_cookie],
+                "origins": STATE["origins"] + [github_origin],
+            }
+        )
+
+        assert cache.load() == STATE
+        assert b"user_session" not in open(cache.path, "rb").read()
+
+    def test_corrupted_file_is_miss(self, tmp_path):
+        """测试损坏的缓存视为未命中"""
+        cache = StorageStateCache("Alpha", str(tmp_path), secret="")
+        with open(cache.path, "w") as f:
+            f.write("{not json")
+
+        assert cache.load() is None
+
+    def test_encrypted(self, tmp_path):
+        """测试加密缓存：口令错误时视为未命中"""
+        pytest.importorskip("nacl")
+        cache = StorageStateCache("Alpha", str(tmp_path), secret="passphrase")
+        cache.save(STATE)
+
+        assert cache.path.endswith(".json.enc")
+        assert b"abc" not in open(cache.path, "rb").read()
+        assert cache.load() == STATE
+        assert StorageStateCache("Alpha", str(tmp_path), secret="wrong").load() is None
+
+
+class TestCacheEnabled:
+    """测试缓存默认开关"""
+
+    def test_default_requires_key(self, monkeypatch):
+        """测试未配置时仅在设置口令后启用"""
+        monkeypatch.delenv("ATHENA_STORAGE_KEY", raising=False)
+        assert cache_enabled(None) is False
+
+        monkeypatch.setenv("ATHENA_STORAGE_KEY", "passphrase")
+        assert cache_enabled(None) is True
+
+    def test_explicit_plaintext_warns(self, monkeypatch, capsys):
+        """测试显式启用但没有口令时打印明文警告"""
+        monkeypatch.delenv("ATHENA_STORAGE_KEY", raising=False)
+
+        assert cache_enabled(True) is True
+        assert "明文" in capsys.readouterr().out
+        assert cache_enabled(False) is False
+
+
+class TestAdapterStorageState:
+    """测试适配器恢复缓存时的过滤"""
+
+    def test_github_and_expired_cookies_dropped(
+        self, tmp_path, monkeypatch, mock_credentials, mock_notifier
+    ):
+        """测试恢复时去掉 GitHub Cookie 与已过期的 Cookie"""
+        monkeypatch.setenv("ATHENA_STORAGE_DIR", str(tmp_path))
+        monkeypatch.delenv("ATHENA_STORAGE_KEY", raising=False)
+        assert (
+            ClawCloudAdapter(parse_site_config(SITE), mock_credentials, mock_notifier).state_cache
+            is None
+        )
+
+        config = parse_site_config({**SITE, "storage_state_cache": True})
+        adapter = ClawCloudAdapter(config, mock_credentials, mock_notifier)
+        assert adapter._cached_storage_state() is None
+
+        # 旧版缓存中可能仍有 GitHub Cookie
+        github = {"name": "user_session", "value": "old", "domain": "github.com", "expires": -1}
+        expired = {"name": "old", "value": "x", "domain": "alpha.example.com", "expires": 1}
+        with open(adapter.state_cache.path, "w") as f:
+            json.dump({**STATE, "cookies": STATE["cookies"] + [github, expired]}, f)
+
+        state = adapter._cached_storage_state()
+        assert state["cookies"] == STATE["cookies"]
+        assert '"https://alpha.example.com": {"t": "1"}' in adapter._local_storage_script(
+            state["origins"]
+        )
@@ -0,0 +1,94 @@
+"""浏览器进程内存统计（基于 Linux /proc）"""
+import os
+import threading
+from typing import Optional
+
+# Chromium 各进程的进程名（/proc/<pid>/comm）包含的关键字
+BROWSER_PROCESS_NAMES = ("chrom", "headless_shell")
+
+
+def _read(path: str) -> Optional[str]:
+    """读取 /proc 文件，进程已退出时返回 None"""
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _parent_pids() -> dict[int, int]:
+    """所有进程的 pid 到父进程 pid 的映射"""
+    parents = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        stat = _read(f"/proc/{entry}/stat")
+        if stat:
+            # 进程名可能包含空格，取最后一个右括号之后的字段
+            parents[int(entry)] = int(stat.rsplit(")", 1)[1].split()[1])
+    return parents
+
+
+def browser_rss_bytes(root_pid: Optional[int] = None) -> int:
+    """root_pid 的所有 Chromium 子孙进程的常驻内存之和
+
+    Args:
+        root_pid: 根进程（默认当前进程）
+
+    Returns:
+        RSS 字节数，非 Linux 系统返回 0
+    """
+    if not os.path.isdir("/proc"):
+        return 0
+
+    root_pid = root_pid or os.getpid()
+    children: dict[int, list[int]] = {}
+    for pid, parent in _parent_pids().items():
+        children.setdefault(parent, []).append(pid)
+
+    total = 0
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    stack = list(children.get(root_pid, []))
+    while stack:
+        pid = stack.pop()
+        stack.extend(children.get(pid, []))
+        name = (_read(f"/proc/{pid}/comm") or "").strip()
+        statm = _read(f"/proc/{pid}/statm")
+        if statm and any(keyword in name for keyword in BROWSER_PROCESS_NAMES):
+            total += int(statm.split()[1]) * page_size
+    return total
+
+
+class PeakRSSSampler:
+    """在后台线程中定期采样浏览器进程内存，记录峰值
+
+    用法:
+        with PeakRSSSampler() as sampler:
+            ...
+        print(sampler.peak)
+    """
+
+    def __init__(self, interval: float = 0.05):
+        """初始化
+
+        Args:
+            interval: 采样间隔（秒）
+        """
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        """采样循环"""
+        while not self._stop.is_set():
+            self.peak = max(self.peak, browser_rss_bytes())
+            self._stop.wait(self.interval)
+
+    def __enter__(self) -> "PeakRSSSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
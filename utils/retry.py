@@ -4,7 +4,6 @@ import logging
 from functools import wraps
 from typing import Callable, TypeVar, Any, Type, Tuple
 from requests.exceptions import RequestException
-from playwright.sync_api import TimeoutError as PlaywrightTimeout, Error as PlaywrightError
 
 from core.constants import RetryConfig
 
@@ -87,8 +86,11 @@ def retry_playwright(
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """Playwright 操作重试装饰器
 
-    专门用于 Playwright 操作，捕获超时和常见错误
+    专门用于 Playwright 操作，捕获超时和常见错误。
+    Playwright 在调用时才导入，使通知器等模块无需加载 Playwright。
     """
+    from playwright.sync_api import TimeoutError as PlaywrightTimeout, Error as PlaywrightError
+
     return retry(
         max_attempts=max_attempts, delay=delay, exceptions=(PlaywrightTimeout, PlaywrightError)
     )
@@ -0,0 +1,30 @@
+"""终端表格格式化"""
+import unicodedata
+from typing import Sequence
+
+
+def display_width(text: str) -> int:
+    """计算字符串在终端中的显示宽度（中文等全角字符占两列）"""
+    return sum(2 if unicodedata.east_asian_width(ch) in ("W", "F") else 1 for ch in text)
+
+
+def format_table(headers: Sequence[str], rows: Sequence[Sequence[str]]) -> str:
+    """格式化为对齐的文本表格
+
+    Args:
+        headers: 表头
+        rows: 数据行（每个单元格为字符串）
+
+    Returns:
+        表格文本
+    """
+    widths = [max(display_width(row[i]) for row in [headers, *rows]) for i in range(len(headers))]
+
+    def format_row(row: Sequence[str]) -> str:
+        return " | ".join(
+            cell + " " * (widths[i] - display_width(cell)) for i, cell in enumerate(row)
+        ).rstrip()
+
+    lines = [format_row(headers), "-+-".join("-" * w for w in widths)]
+    lines.extend(format_row(row) for row in rows)
+    return "\n".join(lines)